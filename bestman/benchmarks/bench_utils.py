@@ -0,0 +1,180 @@
+"""
+Micro-benchmarks for the math and trajectory utilities.
+数学与轨迹工具的微基准测试：单次调用延迟 + 批量吞吐，结果写成 JSON 并与基线比较。
+
+Usage / 用法:
+    python benchmarks/bench_utils.py                              # 运行并与 baseline.json 比较
+    python benchmarks/bench_utils.py --sizes 1000 10000           # 只跑较小的轨迹
+    python benchmarks/bench_utils.py --save-baseline              # 用本次结果覆盖基线
+    python benchmarks/bench_utils.py --output /tmp/bench.json --threshold 0.3
+
+退出码为 1 表示有指标比基线慢超过 threshold（默认 25%）。
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.spatial.transform import Rotation as R
+
+from bestman.robots.utils.math_utils import compensate_tcp_for_gripper, pose_to_euler
+from bestman.utils.utils import (
+    map_sensor_to_robot,
+    map_sensor_to_robot_batch,
+    rpy2T,
+    transform_traj,
+    transform_vive_to_gripper,
+    transform_vive_to_gripper_batch,
+)
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_BASELINE = HERE / "baseline.json"
+DEFAULT_OUTPUT = HERE / "results.json"
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+T_ROBOT_INIT = rpy2T([0.3, -0.1, 0.25, 3.1, 0.05, -1.2])
+
+
+def synthetic_session(n, seed=0):
+    '''UMI 风格的合成轨迹：(N,7) 位姿、(M,2) 夹爪数据、(N,) 时间戳（约 200 Hz）'''
+    rng = np.random.default_rng(seed)
+    pose_ts = np.cumsum(rng.uniform(0.004, 0.006, n))
+    raw_pose = np.hstack([rng.normal(scale=0.3, size=(n, 3)), R.random(n, random_state=seed).as_quat()])
+    clamp_ts = np.sort(rng.uniform(pose_ts[0], pose_ts[-1], max(n // 4, 2)))
+    raw_clamp = np.column_stack([clamp_ts, rng.uniform(0, 88, len(clamp_ts))])
+    return raw_pose, raw_clamp, pose_ts
+
+
+def time_call(fn, min_time=0.2, repeat=5):
+    '''
+    best-of-`repeat` seconds per call; the inner loop count grows until one run takes `min_time`
+    取 repeat 次中的最小单次耗时（秒）
+    '''
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time / repeat or number >= 1 << 20:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - t0) / number)
+    return best
+
+
+def latency_cases(pose):
+    '''单个位姿的逐次调用'''
+    x, y, z, qx, qy, qz, qw = pose.tolist()
+    quat = pose[3:7]
+    return {
+        "map_sensor_to_robot": lambda: map_sensor_to_robot(x, y, z, qx, qy, qz, qw, T_ROBOT_INIT),
+        "transform_vive_to_gripper": lambda: transform_vive_to_gripper(pose),
+        "pose_to_euler": lambda: pose_to_euler([x, y, z, qw, qx, qy, qz]),
+        "compensate_tcp_for_gripper": lambda: compensate_tcp_for_gripper(x, y, z, quat, 0.02),
+    }
+
+
+def throughput_cases(raw_pose, raw_clamp, pose_ts):
+    '''整条轨迹的批量调用'''
+    return {
+        "map_sensor_to_robot_batch": lambda: map_sensor_to_robot_batch(raw_pose, T_ROBOT_INIT),
+        "transform_traj": lambda: transform_traj(raw_pose, raw_clamp, pose_ts, T_ROBOT_INIT),
+        "transform_vive_to_gripper_batch": lambda: transform_vive_to_gripper_batch(raw_pose),
+    }
+
+
+def run(sizes=DEFAULT_SIZES, min_time=0.2, verbose=True):
+    '''
+    Returns:
+        {"meta": {...}, "results": {name: {"unit": ..., "value": ...}}}
+        latency 为 us/call（越小越好），throughput 为 points/s（越大越好）
+    '''
+    results = {}
+    raw_pose, _, _ = synthetic_session(1)
+    for name, fn in latency_cases(raw_pose[0]).items():
+        key = f"latency/{name}"
+        results[key] = {"unit": "us/call", "value": time_call(fn, min_time) * 1e6}
+        if verbose:
+            print(f"{key:<52} {results[key]['value']:>12.2f} us/call")
+
+    for n in sizes:
+        session = synthetic_session(n)
+        for name, fn in throughput_cases(*session).items():
+            key = f"throughput/{name}/{n}"
+            # 大轨迹单次就够慢，只重复 3 次
+            seconds = time_call(fn, min_time, repeat=3 if n >= 100_000 else 5)
+            results[key] = {"unit": "points/s", "value": n / seconds}
+            if verbose:
+                print(f"{key:<52} {results[key]['value']:>12,.0f} points/s  ({seconds * 1e3:.2f} ms)")
+
+    meta = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(current, baseline, threshold=0.25):
+    '''
+    Returns the list of regressions: (name, baseline, current, relative change)
+    返回比基线慢超过 threshold 的指标
+    '''
+    regressions = []
+    for key, cur in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None or base["unit"] != cur["unit"]:
+            continue
+        if cur["unit"] == "points/s":
+            slowdown = base["value"] / cur["value"] - 1.0
+        else:
+            slowdown = cur["value"] / base["value"] - 1.0
+        if slowdown > threshold:
+            regressions.append((key, base["value"], cur["value"], slowdown))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="trajectory lengths")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds spent per measurement")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="where to write the JSON results")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline JSON to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative slowdown")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to --baseline too")
+    args = parser.parse_args(argv)
+
+    current = run(args.sizes, args.min_time)
+    args.output.write_text(json.dumps(current, indent=2))
+    print(f"results written to {args.output}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(current, indent=2))
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}, run with --save-baseline to create one")
+        return 0
+
+    regressions = compare(current, json.loads(args.baseline.read_text()), args.threshold)
+    if not regressions:
+        print(f"✅ no regression over {args.threshold:.0%} against {args.baseline.name}")
+        return 0
+    print(f"❌ {len(regressions)} regression(s) over {args.threshold:.0%}:")
+    for key, base, cur, slowdown in regressions:
+        print(f"  {key:<52} {base:>14,.2f} -> {cur:>14,.2f}  (+{slowdown:.0%} slower)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
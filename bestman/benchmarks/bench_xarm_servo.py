@@ -0,0 +1,96 @@
+"""
+End-to-end BestmanXarm benchmark against the in-process fake controller.
+用进程内的 FakeXArmAPI 端到端测量 BestmanXarm：调用开销、connect() 流程、模式切换与伺服吞吐。
+
+latency=0 时测得的是驱动层的纯开销；给定 --latency 时模拟控制器往返，
+可以比较 servo_to_joint_positions / servo_to_ee_pose（每次查询 mode）与 XArmServoSession.send()。
+
+Usage / 用法:
+    python benchmarks/bench_xarm_servo.py
+    python benchmarks/bench_xarm_servo.py --latency 0.0005 --mode-switch-time 0.01
+    python benchmarks/bench_xarm_servo.py --output /tmp/xarm_servo.json
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from bench_utils import time_call
+
+
+def run(min_time=0.2, latency=0.0, jitter=0.0, mode_switch_time=0.0, settle_time=0.0, verbose=True):
+    from bestman.robots.xarm import BestmanXarm, XArmConfig
+
+    fake_kwargs = dict(latency=latency, jitter=jitter, mode_switch_time=mode_switch_time, settle_time=settle_time)
+    config = XArmConfig(
+        id="bench", dof=7, initial_joints=[0.0] * 7, tcp_offset=[0.0, 0.0, 100.0, 0.0, 0.0, 0.0],
+        backend="fake", fake_kwargs=fake_kwargs,
+    )
+    robot = BestmanXarm(config)
+
+    t0 = time.perf_counter()
+    robot.connect()
+    connect_time = time.perf_counter() - t0
+    robot.set_mode(1)
+
+    q = np.zeros(7)
+    pose = np.array([300.0, 0.0, 200.0, 180.0, 0.0, 0.0])
+    pose_m = np.array([0.3, 0.0, 0.2, 180.0, 0.0, 0.0])
+    cases = {
+        "servo_to_joint_positions": lambda: robot.servo_to_joint_positions(q),
+        "servo_to_ee_pose": lambda: robot.servo_to_ee_pose(pose),
+    }
+    joints = robot.servo_session("joint_positions").open()
+    cart = robot.servo_session("ee_pose").open()
+    cart_m = robot.servo_session("ee_pose", meters=True).open()
+    joints.send(q)
+    cart.send(pose)
+    cart_m.send(pose_m)
+    cases.update({
+        "session.send joint_positions": lambda: joints.send(q),
+        "session.send ee_pose": lambda: cart.send(pose),
+        "session.send ee_pose (meters)": lambda: cart_m.send(pose_m),
+        "sdk set_servo_angle_j (floor)": lambda: robot.arm.set_servo_angle_j(q, is_radian=False),
+        "get_joint_positions": robot.get_joint_positions,
+        "get_ee_pose": robot.get_ee_pose,
+    })
+
+    results = {}
+    for name, fn in cases.items():
+        results[name] = time_call(fn, min_time) * 1e6
+        if verbose:
+            print(f"{name:<36} {results[name]:>10.3f} us/call  ({1e6 / results[name]:>10.0f} Hz)")
+
+    # 模式切换：position -> servo -> position 的一个来回
+    def switch():
+        robot.set_mode(0)
+        robot.set_mode(1)
+    results["set_mode round trip"] = time_call(switch, min_time) * 1e6
+    results["connect"] = connect_time * 1e6
+    robot.disconnect()
+    if verbose:
+        for name in ("set_mode round trip", "connect"):
+            print(f"{name:<36} {results[name]:>10.3f} us")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds spent per measurement")
+    parser.add_argument("--latency", type=float, default=0.0, help="modelled controller round trip (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="std of the round trip jitter (s)")
+    parser.add_argument("--mode-switch-time", type=float, default=0.0, help="extra time of set_mode (s)")
+    parser.add_argument("--settle-time", type=float, default=0.0, help="extra time of set_tcp_offset(wait=True) (s)")
+    parser.add_argument("--output", type=Path, default=None, help="optional JSON output (us/call)")
+    args = parser.parse_args(argv)
+    results = run(args.min_time, args.latency, args.jitter, args.mode_switch_time, args.settle_time)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""Command line interface for bestman. / bestman 命令行工具。"""
+import json
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import typer
+from typing_extensions import Annotated
+
+app = typer.Typer(help="BestMan robot tools / BestMan 机器人工具", no_args_is_help=True)
+
+
+@app.callback()
+def main() -> None:
+    """BestMan robot tools / BestMan 机器人工具"""
+
+
+@app.command()
+def preprocess(
+    multi_session_root: Annotated[Path, typer.Argument(help="multi_sessions_* directory / 多会话目录")],
+    init_pose: Annotated[Tuple[float, float, float, float, float, float], typer.Option(
+        "--init-pose", help="robot home EE pose x y z roll pitch yaw (m, rad) / 机械臂初始末端位姿",
+    )],
+    workers: Annotated[Optional[int], typer.Option(help="process pool size, default cpu count / 进程数")] = None,
+    no_cache: Annotated[bool, typer.Option(
+        "--no-cache", help="do not use the TUM binary cache / 不使用二进制缓存",
+    )] = False,
+) -> None:
+    """
+    Preprocess every session_* of a multi_sessions_* directory in parallel.
+    并行预处理多会话目录下的全部 session_*，结果保存为 replay_ready.npz。
+
+    Example:
+        bestman preprocess /media/ark/B2D6-285E/multi_sessions_20251114_100000 --init-pose 0.3 0 0.25 3.14 0 0
+    """
+    from bestman.utils.batch import preprocess_multi_session
+    from bestman.utils.utils import rpy2T
+
+    results = preprocess_multi_session(
+        multi_session_root, rpy2T(init_pose), workers=workers, use_cache=not no_cache
+    )
+    if any("error" in r for r in results):
+        raise typer.Exit(code=1)
+
+
+# ======== bench / 控制回路基准测试 ========
+bench_app = typer.Typer(
+    help="Control-loop benchmarks on a configured robot / 控制回路基准测试（机械臂保持当前关节角，不会运动）",
+    no_args_is_help=True,
+)
+app.add_typer(bench_app, name="bench")
+
+ConfigArg = Annotated[Path, typer.Argument(
+    exists=True, dir_okay=False, help="robot YAML, e.g. assets/configs/xarm6_template.yaml",
+)]
+OutputOpt = Annotated[Optional[Path], typer.Option("--output", "-o", help="save results as JSON / 结果保存为 JSON")]
+RateOpt = Annotated[float, typer.Option("--rate", help="replay rate in Hz / 复现频率")]
+
+
+def _run_bench(config_path: Path, names: List[str], output: Optional[Path], **kwargs) -> None:
+    from bestman.robots import load_robot_config, make_robot_from_config
+    from bestman.robots.bench import format_result, run_benchmarks
+
+    config = load_robot_config(config_path)
+    with make_robot_from_config(config) as robot:
+        results = run_benchmarks(robot, names, **kwargs)
+    results["config"] = str(config_path)
+    results["parameters"] = kwargs
+    for name in names:
+        typer.echo("")
+        typer.echo(format_result(name, results["results"][name]))
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2))
+        typer.echo(f"\nresults written to {output}")
+
+
+@bench_app.command("servo")
+def bench_servo(
+    config: ConfigArg,
+    duration: Annotated[float, typer.Option(help="seconds of back-to-back servo commands / 测试时长（秒）")] = 5.0,
+    output: OutputOpt = None,
+) -> None:
+    """
+    Achievable servo frequency and per-command latency.
+    可达伺服频率与单条伺服指令耗时。
+    """
+    _run_bench(config, ["servo"], output, duration=duration)
+
+
+@bench_app.command("latency")
+def bench_latency(
+    config: ConfigArg,
+    calls: Annotated[int, typer.Option(help="calls per method / 每个接口的调用次数")] = 200,
+    output: OutputOpt = None,
+) -> None:
+    """
+    Per-call latency of state reads, servo commands and mode switches.
+    状态读取、伺服指令与模式切换的单次调用耗时。
+    """
+    _run_bench(config, ["latency"], output, calls=calls)
+
+
+@bench_app.command("state")
+def bench_state(
+    config: ConfigArg,
+    duration: Annotated[float, typer.Option(help="seconds per getter / 每个读取接口的测试时长（秒）")] = 1.0,
+    output: OutputOpt = None,
+) -> None:
+    """
+    Sustained state-read rate of every getter.
+    各状态读取接口的持续读取频率。
+    """
+    _run_bench(config, ["state"], output, duration=duration)
+
+
+@bench_app.command("replay")
+def bench_replay(
+    config: ConfigArg,
+    rate: RateOpt = 200.0,
+    duration: Annotated[float, typer.Option(help="seconds of replay / 测试时长（秒）")] = 5.0,
+    lag_policy: Annotated[str, typer.Option(help="drop / stretch / abort")] = "stretch",
+    output: OutputOpt = None,
+) -> None:
+    """
+    Replay-schedule adherence at a fixed rate.
+    定频复现的时间表偏差（每帧滞后、发送耗时、丢帧与超时帧）。
+    """
+    _run_bench(config, ["replay"], output, rate_hz=rate, duration=duration, lag_policy=lag_policy)
+
+
+@bench_app.command("all")
+def bench_all(
+    config: ConfigArg,
+    duration: Annotated[float, typer.Option(help="seconds per timed benchmark / 每项测试时长（秒）")] = 2.0,
+    rate: RateOpt = 200.0,
+    output: OutputOpt = None,
+) -> None:
+    """
+    Run servo, latency, state and replay in one session.
+    在一次连接中依次运行全部基准测试。
+    """
+    _run_bench(config, ["servo", "latency", "state", "replay"], output, duration=duration, rate_hz=rate)
+
+
+if __name__ == "__main__":
+    app()
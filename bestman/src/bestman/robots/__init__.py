@@ -2,11 +2,17 @@
 
 from .config import RobotConfig
 from .base_robot import BaseRobot
+from .state_cache import RobotState
 from .utils import *
-from .factory import make_robot_from_config
+from .factory import make_robot_from_config, load_robot_config
+from .group import RobotGroup, RobotGroupError
 
 __all__ = [
     "RobotConfig",
     "BaseRobot",
+    "RobotState",
     "make_robot_from_config",
+    "load_robot_config",
+    "RobotGroup",
+    "RobotGroupError",
 ]
@@ -0,0 +1,133 @@
+"""
+asyncio adapter for BaseRobot.
+BaseRobot 的 asyncio 适配器：SDK 调用在有界线程池中执行，事件循环不被阻塞。
+"""
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from .hooks import original_method
+
+# 以这些前缀开头的方法提供 awaitable 版本
+ASYNC_PREFIXES = ("move_", "servo_", "get_", "go_home", "connect", "disconnect", "set_mode")
+
+
+class AsyncRobot:
+    """
+    Awaitable wrapper around a synchronous robot.
+    同步机器人的 awaitable 包装。
+
+    `move_*` / `servo_*` / `get_*` / `go_home` / `connect` / `disconnect` 都变为协程，
+    在最多 `max_workers` 个线程的线程池中调用 SDK，方便与相机采集、策略推理或另一台机械臂并发。
+
+    wait=True 的运动（以及定义了 initial_joints 的 go_home）在机器人实现了
+    `is_moving()` 与 `stop_motion()` 时可取消：以 wait=False 下发后异步轮询 is_moving()，
+    任务被取消时调用 stop_motion() 停止机械臂。未实现时退化为在线程池中阻塞等待（不可中途停止）。
+
+    Example:
+        async with robot.aio() as r:
+            await asyncio.gather(r.move_to_joint_positions(q, wait=True), camera_task())
+            task = asyncio.create_task(r.go_home())
+            task.cancel()                       # 机械臂停止
+    """
+
+    def __init__(self, robot, max_workers: int = 2, poll_interval: float = 0.01, start_grace: float = 0.2):
+        self.robot = robot
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.start_grace = start_grace    # 下发后等待 is_moving() 变为 True 的最长时间
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # ======== Lifecycle / 生命周期 ========
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bestman-aio")
+        return self._executor
+
+    def close(self) -> None:
+        """Shut the thread pool down. / 关闭线程池。"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def __aenter__(self) -> "AsyncRobot":
+        self._pool()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def run(self, fn, *args, **kwargs):
+        """Run any blocking callable on the robot's thread pool. / 在线程池中运行任意阻塞调用。"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool(), functools.partial(fn, *args, **kwargs))
+
+    # ======== Cancellable motion / 可取消的运动 ========
+    def _supports(self, name: str) -> bool:
+        from .base_robot import BaseRobot
+        return getattr(type(self.robot), name, None) not in (None, getattr(BaseRobot, name, None))
+
+    @property
+    def cancellable(self) -> bool:
+        """True when the robot implements is_moving() and stop_motion(). / 运动是否可取消。"""
+        return self._supports("is_moving") and self._supports("stop_motion")
+
+    async def wait_motion(self) -> None:
+        """
+        Wait until the current motion ends; cancelling stops the arm.
+        等待当前运动结束；被取消时停止机械臂。
+        """
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        started = False
+        try:
+            while True:
+                moving = await self.run(self.robot.is_moving)
+                if moving:
+                    started = True
+                elif started or loop.time() - t0 > self.start_grace:
+                    return
+                await asyncio.sleep(self.poll_interval)
+        except asyncio.CancelledError:
+            # 事件循环可能正在取消全部任务，停止指令直接在线程池中执行并等待完成
+            await asyncio.shield(self.run(self.robot.stop_motion))
+            raise
+
+    async def _move(self, name: str, *args, **kwargs):
+        method = getattr(self.robot, name)
+        # 用类上的原始签名解析 wait（实例上可能装有 *args 形式的钩子）
+        signature = inspect.signature(original_method(self.robot, name))
+        if self.cancellable and "wait" in signature.parameters:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if bound.arguments["wait"]:
+                bound.arguments["wait"] = False
+                result = await self.run(method, *bound.args, **bound.kwargs)
+                await self.wait_motion()
+                return result
+        return await self.run(method, *args, **kwargs)
+
+    async def go_home(self):
+        """Move to config.initial_joints (cancellable when supported). / 回到初始关节位姿。"""
+        initial_joints = getattr(getattr(self.robot, "config", None), "initial_joints", None)
+        if initial_joints is None or not self.cancellable:
+            return await self.run(self.robot.go_home)
+        return await self._move("move_to_joint_positions", initial_joints, wait=True)
+
+    def __getattr__(self, name):
+        if not name.startswith(ASYNC_PREFIXES):
+            raise AttributeError(f"{type(self).__name__} has no attribute '{name}'")
+        method = getattr(self.robot, name)
+        if not callable(method):
+            raise AttributeError(f"{type(self.robot).__name__}.{name} is not callable")
+        if name.startswith("move_to_"):
+            async def call(*args, **kwargs):
+                return await self._move(name, *args, **kwargs)
+        else:
+            async def call(*args, **kwargs):
+                return await self.run(method, *args, **kwargs)
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
@@ -1,8 +1,15 @@
 import abc
-from typing import Any, Dict, Union, Tuple, List
+import threading
+from typing import Any, Dict, Optional, Union, Tuple, List
 import numpy as np
 
 from .config import RobotConfig
+from .state_cache import RobotState, StateCache, STATE_GETTERS, read_state
+from .hooks import original_method
+from .flight_recorder import FlightRecorder
+from .instrumentation import Instrumentation
+from .servo_engine import ServoEngine
+from .aio import AsyncRobot
 
 
 class BaseRobot(abc.ABC):
@@ -26,6 +33,11 @@ class BaseRobot(abc.ABC):
     - Position control:   move_to_joint_positions(), move_to_ee_pose_rpy(), move_to_ee_pose_quat()
     - Servo control:      servo_to_joint_positions(), servo_to_ee_pose_rpy(), servo_to_ee_pose_quat()
     - Utility:            go_home()
+    - State cache:        start_state_cache(), stop_state_cache(), get_state()
+    - Fault recording:    start_flight_recorder(), dump_flight_record()
+    - Call latency:       enable_instrumentation(), stats()
+    - Servo streaming:    start_servo_engine(), stop_servo_engine()
+    - asyncio:            aio(), is_moving(), stop_motion()
 
     基础接口包括：
     - 生命周期管理:      connect(), disconnect()
@@ -33,12 +45,23 @@ class BaseRobot(abc.ABC):
     - 位置控制:         move_to_joint_positions(), move_to_ee_pose_rpy(), move_to_ee_pose_quat()
     - 伺服控制:         servo_to_joint_positions(), servo_to_ee_pose_rpy(), servo_to_ee_pose_quat()
     - 工具方法:         go_home()
+    - 状态缓存:         start_state_cache(), stop_state_cache(), get_state()
+    - 故障记录:         start_flight_recorder(), dump_flight_record()
+    - 调用耗时统计:     enable_instrumentation(), stats()
+    - 伺服发送引擎:     start_servo_engine(), stop_servo_engine()
+    - asyncio:          aio(), is_moving(), stop_motion()
     """
 
     config_class: type[RobotConfig]
 
     def __init__(self, config: RobotConfig):
         self.config = config
+        # 串行化控制线程与后台线程（状态缓存轮询等）对 SDK 的调用：驱动在每次调用 SDK 时持有
+        self.sdk_lock = threading.RLock()
+        self._state_cache: Optional[StateCache] = None
+        self._flight_recorder: Optional[FlightRecorder] = None
+        self._instrumentation: Optional[Instrumentation] = None
+        self.servo_engine: Optional[ServoEngine] = None
 
     # ======== Inference Related / 推理相关 ========
     @property
@@ -84,11 +107,16 @@ class BaseRobot(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def get_observation(self) -> Dict[str, Any]:
+    def get_observation(self, copy: bool = False) -> Dict[str, Any]:
         """
         Retrieve a full observation dictionary matching `observation_features`.
         获取与 `observation_features` 定义完全匹配的完整观测字典。
 
+        Args:
+            copy: If False, implementations may return preallocated arrays that are
+                  overwritten by the next call (see `ObservationBuffer`).
+                  为 False 时可返回预分配数组（下一次调用会覆盖其内容）；需要保存时传 True。
+
         Returns:
             Dict[str, Any]: Observation data with keys and shapes as declared.
             返回包含声明键和形状的观测数据字典。
@@ -391,6 +419,196 @@ class BaseRobot(abc.ABC):
         """
         pass
 
+    # ======== State Cache / 状态缓存 ========
+    def start_state_cache(self, rate_hz: float = 100.0) -> StateCache:
+        """
+        Poll the driver on a background thread and serve state reads from the latest snapshot.
+        启动后台状态轮询，之后状态读取接口直接返回最新快照（O(1)，不访问 SDK）。
+
+        Args:
+            rate_hz: Polling rate. / 轮询频率。
+
+        Returns:
+            StateCache: The running cache (errors / last_error for diagnostics).
+                        正在运行的缓存对象（可查看 errors / last_error）。
+        """
+        if self._state_cache is not None:
+            self._state_cache.stop()
+        self._state_cache = StateCache(self, rate_hz).start()
+        return self._state_cache
+
+    def stop_state_cache(self) -> None:
+        """
+        Stop polling; state reads go to the driver again.
+        停止后台轮询，状态读取接口恢复为直接访问 SDK。
+        """
+        if self._state_cache is not None:
+            self._state_cache.stop()
+            self._state_cache = None
+
+    def get_state(self) -> RobotState:
+        """
+        Latest immutable state snapshot.
+        获取最新的不可变状态快照。
+
+        Returns:
+            RobotState: From the state cache when running, otherwise read from the driver now.
+                        状态缓存运行时返回最新快照，否则立即读取一次。
+        """
+        if self._state_cache is not None:
+            return self._state_cache.state
+        getters = {
+            field_name: original_method(self, name) for name, field_name in STATE_GETTERS.items()
+        }
+        with self.sdk_lock:
+            return read_state(getters)
+
+    # ======== Flight Recorder / 故障记录 ========
+    def start_flight_recorder(self, capacity: int = 4096, dump_dir=None) -> FlightRecorder:
+        """
+        Record the last `capacity` commands and state reads in ring buffers.
+        在环形缓冲区中记录最近 `capacity` 条指令与状态读取。
+
+        The record is dumped to `dump_dir` (default: cwd) as .npz when a recorded
+        call raises, on disconnect(), or via dump_flight_record().
+        被记录的方法抛出异常、disconnect() 或调用 dump_flight_record() 时落盘。
+
+        Returns:
+            FlightRecorder: The active recorder. / 当前记录器。
+        """
+        self.stop_flight_recorder()
+        self._flight_recorder = FlightRecorder(self, capacity, dump_dir).start()
+        return self._flight_recorder
+
+    def stop_flight_recorder(self) -> None:
+        """Remove the recording hooks (nothing is dumped). / 停止记录（不落盘）。"""
+        if self._flight_recorder is not None:
+            self._flight_recorder.stop()
+            self._flight_recorder = None
+
+    def dump_flight_record(self, path=None):
+        """
+        Dump the recorded window now.
+        立即将记录落盘。
+
+        Returns:
+            Path of the .npz file. / 文件路径。
+        """
+        if self._flight_recorder is None:
+            raise RuntimeError("flight recorder not started, call start_flight_recorder() first")
+        return self._flight_recorder.dump(path)
+
+    # ======== Instrumentation / 调用耗时统计 ========
+    def enable_instrumentation(self, methods=None) -> Instrumentation:
+        """
+        Time every API call into per-method latency histograms.
+        统计每个接口的调用耗时（固定分桶直方图），不需要修改驱动类。
+
+        Args:
+            methods: Method names to time; default: the whole BaseRobot API. / 需要统计的方法名，默认全部接口。
+
+        Returns:
+            Instrumentation: Call export() on it for periodic text / JSON reports.
+                             可调用其 export() 周期性输出文本或 JSON 报告。
+        """
+        self.disable_instrumentation()
+        self._instrumentation = Instrumentation(self, methods).start()
+        return self._instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """Remove the timers; calls have no overhead afterwards. / 移除计时钩子，之后调用无额外开销。"""
+        if self._instrumentation is not None:
+            self._instrumentation.stop()
+            self._instrumentation = None
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-method latency statistics in seconds.
+        各接口的耗时统计（秒）。
+
+        Returns:
+            {method: {count, errors, mean, min, max, p50, p90, p99}} for methods called so far.
+        """
+        if self._instrumentation is None:
+            raise RuntimeError("instrumentation not enabled, call enable_instrumentation() first")
+        return self._instrumentation.stats()
+
+    # ======== Servo Engine / 伺服发送引擎 ========
+    def start_servo_engine(
+        self,
+        target: str = "ee_pose",
+        rate_hz: float = 250.0,
+        interpolate: bool = True,
+        angle_period: Optional[float] = None,
+        **kwargs,
+    ) -> ServoEngine:
+        """
+        Stream servo commands from a fixed-rate thread; producers only call `post()`.
+        启动固定频率的伺服发送线程，生产者只需调用 `engine.post(target)`。
+
+        Args:
+            target: "ee_pose" (servo_to_ee_pose) or "joint_positions" (servo_to_joint_positions).
+                    发送接口："ee_pose" 或 "joint_positions"。
+            rate_hz: Servo rate, e.g. 200-500 Hz. / 伺服频率。
+            interpolate: Interpolate between targets posted slower than `rate_hz`.
+                         生产者慢于伺服频率时在目标之间插值。
+            angle_period: For "ee_pose", wrap rpy interpolation (2*pi for radians, 360 for degrees).
+                          ee_pose 的 rpy 插值周期（弧度 2*pi，角度 360），None 为不处理跨越。
+            **kwargs: Passed to ServoEngine (spin_window, max_lag, realtime_priority).
+
+        Note:
+            The robot must already be in servo mode (e.g. xArm set_mode(1)).
+            调用前需将机械臂切换到伺服模式（如 xArm set_mode(1)）。
+        """
+        senders = {"ee_pose": "servo_to_ee_pose", "joint_positions": "servo_to_joint_positions"}
+        if target not in senders:
+            raise ValueError(f"target must be one of {list(senders)}, got {target!r}")
+        method = senders[target]
+
+        def send(command):
+            # 每个周期重新查找方法，启动之后安装/移除的钩子（如 instrument、flight recorder）同样生效
+            return getattr(self, method)(command)
+
+        self.stop_servo_engine()
+        self.servo_engine = ServoEngine(
+            send,
+            rate_hz=rate_hz,
+            interpolate=interpolate,
+            angle_dims=slice(3, 6) if target == "ee_pose" else None,
+            angle_period=angle_period,
+            **kwargs,
+        ).start()
+        return self.servo_engine
+
+    def stop_servo_engine(self) -> None:
+        """Stop the servo thread (the arm holds the last command). / 停止伺服线程。"""
+        if self.servo_engine is not None:
+            self.servo_engine.stop()
+            self.servo_engine = None
+
+    # ======== Motion Status / 运动状态（可选） ========
+    def is_moving(self) -> bool:
+        """
+        Whether a planned motion is in progress. Optional; enables cancellable async motions.
+        是否正在执行规划运动。可选实现；实现后 aio() 中 wait=True 的运动可取消。
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not report motion status")
+
+    def stop_motion(self) -> None:
+        """
+        Stop the current motion and stay ready for new commands. Optional.
+        停止当前运动并保持可接收新指令的状态。可选实现。
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot stop a motion")
+
+    # ======== asyncio ========
+    def aio(self, max_workers: int = 2) -> AsyncRobot:
+        """
+        asyncio adapter: `async with robot.aio() as r: await r.go_home()`.
+        asyncio 适配器，SDK 调用在最多 `max_workers` 个线程中执行。
+        """
+        return AsyncRobot(self, max_workers=max_workers)
+
     # ======== Context Manager Support / 上下文管理器支持 ========
     def __enter__(self) -> "BaseRobot":
         """Context manager entry. Automatically connects the robot.
@@ -403,5 +621,7 @@ class BaseRobot(abc.ABC):
         """Context manager exit. Automatically disconnects the robot.
         上下文管理器出口，自动断开机器人连接。
         """
+        self.stop_servo_engine()
+        self.stop_state_cache()
         self.disconnect()
         return False  # Don't suppress exceptions
\ No newline at end of file
@@ -0,0 +1,256 @@
+"""
+Control-loop benchmarks on a connected robot (used by `bestman bench`).
+在已连接的机器人上测量控制回路性能：伺服频率、单次调用耗时、状态读取频率、定频复现的时间表偏差。
+
+所有伺服类测试都以"保持当前关节角"作为指令，机械臂不会运动。时间单位均为秒。
+"""
+import contextlib
+import inspect
+import platform
+import sys
+import time
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .scheduler import RealtimeScheduler
+from .state_cache import STATE_GETTERS
+
+PERCENTILES = (50, 90, 99, 99.9)
+SERVO_MODE = 1
+
+
+def summarize(samples: Iterable[float]) -> Dict[str, Optional[float]]:
+    """
+    count / mean / min / max / p50 / p90 / p99 / p99.9 of samples in seconds.
+    样本的分位数统计；没有样本时统计值为 None（JSON 中为 null）。
+    """
+    arr = np.asarray(samples, dtype=np.float64)
+    if arr.size == 0:
+        return {"count": 0, "mean": None, "min": None, "max": None, **{f"p{q:g}": None for q in PERCENTILES}}
+    summary = {"count": int(arr.size), "mean": float(arr.mean()), "min": float(arr.min()), "max": float(arr.max())}
+    for q, value in zip(PERCENTILES, np.percentile(arr, PERCENTILES)):
+        summary[f"p{q:g}"] = float(value)
+    return summary
+
+
+def _cell(value, scale: float = 1.0) -> str:
+    if value is None:
+        return f"{'-':>11}"
+    return f"{value:>11d}" if isinstance(value, int) else f"{value * scale:>11.1f}"
+
+
+def format_table(rows: Dict[str, Dict[str, float]], title: str = "", extra: Iterable[str] = ()) -> str:
+    '''
+    aligned percentile table: times in microseconds, `extra` columns printed as-is
+    分位数表格：时间列以微秒显示，extra 中的列原样输出
+    '''
+    time_keys = ["mean"] + [f"p{q:g}" for q in PERCENTILES] + ["max"]
+    extra = list(extra)
+    header = f"{title:<28}{'count':>9}" + "".join(f"{k:>11}" for k in extra)
+    header += "".join(f"{k + ' us':>11}" for k in time_keys)
+    lines = [header]
+    for name, row in rows.items():
+        line = f"{name:<28}{row['count']:>9d}" + "".join(_cell(row[k]) for k in extra)
+        line += "".join(_cell(row[k], 1e6) for k in time_keys)
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def environment(robot) -> Dict[str, Optional[str]]:
+    """Machine / robot metadata stored with every result. / 随结果保存的机器与机器人信息。"""
+    config = robot.config
+    arm = robot.__dict__.get("arm")
+    firmware = getattr(arm, "version", None) if arm is not None else None
+    return {
+        "host": platform.node(),
+        "platform": platform.platform(),
+        "python": sys.version.split()[0],
+        "robot_type": getattr(config, "type", None),
+        "robot_id": getattr(config, "id", None),
+        "dof": getattr(config, "dof", None),
+        "firmware": None if firmware is None else str(firmware),
+    }
+
+
+@contextlib.contextmanager
+def servo_mode(robot):
+    '''switch to servo mode when the driver has modes, restore the previous mode afterwards'''
+    if not callable(getattr(type(robot), "set_mode", None)):
+        yield
+        return
+    previous = robot.mode
+    if previous != SERVO_MODE:
+        robot.set_mode(SERVO_MODE)
+    try:
+        yield
+    finally:
+        if previous != SERVO_MODE:
+            robot.set_mode(previous if previous is not None else 0)
+
+
+def _timed_loop(fn: Callable, duration: float, clock=time.perf_counter):
+    '''call fn back-to-back for `duration` seconds; returns (latencies, elapsed, failures)'''
+    latencies = array("d")
+    failures = 0
+    start = clock()
+    end = start + duration
+    t = start
+    while t < end:
+        if fn() is False:
+            failures += 1
+        now = clock()
+        latencies.append(now - t)
+        t = now
+    return latencies, t - start, failures
+
+
+# ======== Benchmarks / 基准测试 ========
+def bench_servo(robot, duration: float = 5.0) -> Dict:
+    """
+    Achievable servo frequency: stream hold commands back-to-back.
+    可达伺服频率：连续不间断地下发"保持当前关节角"伺服指令。
+    """
+    hold = robot.get_joint_positions()
+    with servo_mode(robot):
+        latencies, elapsed, failures = _timed_loop(lambda: robot.servo_to_joint_positions(hold), duration)
+    return {
+        "servo_to_joint_positions": {
+            "rate_hz": len(latencies) / elapsed, "failed": failures, **summarize(latencies),
+        },
+    }
+
+
+def _call_latencies(fn: Callable, calls: int, clock=time.perf_counter) -> array:
+    latencies = array("d")
+    for _ in range(calls):
+        t0 = clock()
+        fn()
+        latencies.append(clock() - t0)
+    return latencies
+
+
+def bench_latency(robot, calls: int = 200) -> Dict:
+    """
+    Per-call latency of state reads, servo commands and mode switches.
+    各接口单次调用耗时：状态读取、伺服指令与模式切换。
+    """
+    cls = type(robot)
+    results = {}
+    for name in [name for name in STATE_GETTERS if callable(getattr(cls, name, None))] + ["get_observation"]:
+        getter = getattr(robot, name)
+        try:
+            getter()
+        except NotImplementedError:
+            continue
+        results[name] = summarize(_call_latencies(getter, calls))
+    hold = robot.get_joint_positions()
+    with servo_mode(robot):
+        results["servo_to_joint_positions"] = summarize(
+            _call_latencies(lambda: robot.servo_to_joint_positions(hold), calls)
+        )
+    if callable(getattr(cls, "set_mode", None)):
+        previous = robot.mode if robot.mode is not None else 0
+        modes = iter([SERVO_MODE, previous] * calls)
+        results["set_mode"] = summarize(_call_latencies(lambda: robot.set_mode(next(modes)), 2 * calls))
+    return results
+
+
+def bench_state(robot, duration: float = 1.0) -> Dict:
+    """
+    Sustained state-read rate per getter (each getter runs for `duration` seconds).
+    每个状态读取接口连续读取 duration 秒的持续读取频率。
+    """
+    cls = type(robot)
+    names = [name for name in STATE_GETTERS if callable(getattr(cls, name, None))] + ["get_observation", "get_state"]
+    results = {}
+    for name in names:
+        getter = getattr(robot, name)
+        try:
+            getter()
+        except NotImplementedError:
+            continue
+        latencies, elapsed, _ = _timed_loop(getter, duration)
+        results[name] = {"rate_hz": len(latencies) / elapsed, **summarize(latencies)}
+    return results
+
+
+def bench_replay(
+    robot,
+    rate_hz: float = 200.0,
+    duration: float = 5.0,
+    lag_policy: str = "stretch",
+    max_lag: float = 0.01,
+    spin_window: float = 0.002,
+) -> Dict:
+    """
+    Replay-schedule adherence: send hold commands on a fixed-rate timeline (as TrajReplayer does).
+    复现时间表偏差：按固定频率时间轴下发保持指令（与 TrajReplayer 相同的调度方式），
+    统计每帧相对时间表的滞后、发送耗时与超过周期的帧数。
+    """
+    hold = robot.get_joint_positions()
+    period = 1.0 / rate_hz
+    ticks = int(duration * rate_hz)
+    scheduler = RealtimeScheduler(spin_window=spin_window, lag_policy=lag_policy, max_lag=max_lag)
+    clock = scheduler.clock
+    lateness, send = array("d"), array("d")
+    overruns = 0
+    with servo_mode(robot):
+        scheduler.start()
+        for i in range(ticks):
+            t = i * period
+            if not scheduler.wait(t):
+                continue
+            lateness.append(max(scheduler.now() - t, 0.0))
+            t0 = clock()
+            robot.servo_to_joint_positions(hold)
+            dt = clock() - t0
+            send.append(dt)
+            if dt > period:
+                overruns += 1
+    scheduler_stats = scheduler.stats()
+    return {
+        "rate_hz": rate_hz,
+        "ticks": ticks,
+        "sent": len(send),
+        "dropped": scheduler_stats["dropped"],
+        "stretched": scheduler_stats["stretched"],
+        "overruns": overruns,
+        "lateness": summarize(lateness),
+        "send": summarize(send),
+    }
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    "servo": bench_servo,
+    "latency": bench_latency,
+    "state": bench_state,
+    "replay": bench_replay,
+}
+
+
+def format_result(name: str, result: Dict) -> str:
+    """Percentile table(s) for one benchmark result. / 将单项基准结果格式化为分位数表格。"""
+    if name == "servo":
+        return format_table(result, "servo", extra=["rate_hz", "failed"])
+    if name == "state":
+        return format_table(result, "state read", extra=["rate_hz"])
+    if name == "latency":
+        return format_table(result, "method")
+    if name == "replay":
+        head = (f"replay @ {result['rate_hz']:g} Hz: {result['sent']}/{result['ticks']} sent, "
+                f"dropped {result['dropped']}, overruns {result['overruns']}, "
+                f"stretched {result['stretched'] * 1e3:.2f} ms")
+        return head + "\n" + format_table({"lateness": result["lateness"], "send": result["send"]}, "replay")
+    raise KeyError(name)
+
+
+def run_benchmarks(robot, names: List[str], **kwargs) -> Dict:
+    '''run several benchmarks on a connected robot; kwargs are routed by parameter name'''
+    results = {"environment": environment(robot), "results": {}}
+    for name in names:
+        fn = BENCHMARKS[name]
+        params = inspect.signature(fn).parameters
+        results["results"][name] = fn(robot, **{k: v for k, v in kwargs.items() if k in params})
+    return results
@@ -6,6 +6,8 @@ from typing import Literal, Dict, Any, Optional, ClassVar, List
 
 import draccus
 
+from . import registry
+
 @dataclass(kw_only=True)
 class RobotConfig(draccus.ChoiceRegistry, abc.ABC):
     """
@@ -34,7 +36,7 @@ class RobotConfig(draccus.ChoiceRegistry, abc.ABC):
                 f"Missing required sdk_kwargs for {self.type}: {sorted(missing_kwargs)}. "
                 f"Required: {self.necessary_kwargs}, Got: {list(self.sdk_kwargs.keys())}"
             )
-        if len(self.initial_joints)!=self.dof:
+        if self.initial_joints is not None and len(self.initial_joints)!=self.dof:
             raise ValueError(
                 f"initial_joints needs to be length {self.dof}, got {len(self.initial_joints)}"
             )
@@ -50,6 +52,28 @@ class RobotConfig(draccus.ChoiceRegistry, abc.ABC):
             # TODO
             pass
 
+    @classmethod
+    def get_choice_class(cls, name: str):
+        """按 type 名取配置类，未注册时通过插件注册表导入（draccus 解析时调用）"""
+        if name not in cls._choice_registry and cls is RobotConfig:
+            try:
+                registry.load_config_class(name)
+            except KeyError:
+                pass    # 交给 draccus 报告未知的 type
+        return super().get_choice_class(name)
+
+    @classmethod
+    def get_known_choices(cls):
+        """导入所有已注册的配置类（不导入驱动），供命令行帮助列出全部 type"""
+        if cls is RobotConfig:
+            for name in registry.available_robots():
+                if name not in cls._choice_registry:
+                    try:
+                        registry.load_config_class(name)
+                    except ImportError as e:
+                        print(f"[WARN]: robot config '{name}' unavailable: {e}")
+        return super().get_known_choices()
+
     @property
     def type(self) -> str:
         """返回注册时的名称（如 'xarm'）"""
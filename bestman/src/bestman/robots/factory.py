@@ -1,8 +1,14 @@
 # bestman/robots/__init__.py
 
-from typing import Type,Dict
-from .config import RobotConfig
+from pathlib import Path
+from typing import Dict, Type, Union
+
+import draccus
+import yaml
+
+from . import registry
 from .base_robot import BaseRobot
+from .config import RobotConfig
 
 # 全局注册表
 _ROBOT_REGISTRY: Dict[Type[RobotConfig], Type[BaseRobot]] = {}
@@ -16,9 +22,24 @@ def register_robot(config_cls: Type[RobotConfig]):
 
 
 
+def load_robot_config(path: Union[str, Path]) -> RobotConfig:
+    """
+    从 YAML 加载 RobotConfig，支持顶层配置或 `robot:` 下的嵌套配置
+    （如 assets/configs/xarm6_template.yaml）。只导入 type 对应的配置类，不导入驱动。
+    """
+    with open(path) as f:
+        data = yaml.safe_load(f) or {}
+    if isinstance(data.get("robot"), dict):
+        data = data["robot"]
+    if data.get("type") is None:
+        raise ValueError(f"{path}: robot config must define 'type'")
+    return draccus.decode(RobotConfig, data)
+
+
 def make_robot_from_config(config: RobotConfig) -> BaseRobot:
     """
     根据 RobotConfig 自动创建对应的机器人实例。
+    驱动未注册时按 config.type 通过插件注册表导入驱动模块（此时才导入厂商 SDK）。
     """
     if not hasattr(config, "type"):
         raise ValueError(
@@ -27,10 +48,18 @@ def make_robot_from_config(config: RobotConfig) -> BaseRobot:
         )
     robot_class = _ROBOT_REGISTRY.get(type(config))
     if robot_class is None:
-        raise ValueError(
-            f"Unsupported robot config type: {type(config).__name__}. "
-            f"Available: {[cls.__name__ for cls in _ROBOT_REGISTRY.keys()]}"
-        )
-    
+        # 插件驱动无需 @register_robot：直接使用注册表按 type 导入的类
+        try:
+            robot_class = registry.load_robot_class(config.type)
+        except KeyError:
+            raise ValueError(
+                f"Unsupported robot config type: {type(config).__name__}. "
+                f"Available: {registry.available_robots()}"
+            ) from None
+        if not (isinstance(robot_class, type) and issubclass(robot_class, BaseRobot)):
+            raise TypeError(
+                f"driver registered for robot type {config.type!r} is not a BaseRobot subclass: {robot_class!r}"
+            )
+
     # 返回BestMan封装实例
-    return robot_class(config)
\ No newline at end of file
+    return robot_class(config)
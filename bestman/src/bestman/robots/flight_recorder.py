@@ -0,0 +1,246 @@
+"""
+Fault flight recorder: fixed-size ring buffers of recent commands and state reads.
+故障飞行记录仪：用定长环形缓冲区记录最近的指令与状态读取，出错时落盘便于排查。
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .hooks import add_method_hook, remove_hooks
+from .state_cache import STATE_GETTERS
+
+_HOOK_KEY = "flight_recorder"
+COMMAND_PREFIXES = ("servo_to_", "move_to_")
+COMMAND_METHODS = ("move_gripper",)
+# 每条记录最多保存的数值个数（位置 + 姿态 + 参数），超出部分截断，不足部分为 NaN
+DEFAULT_WIDTH = 16
+
+
+class _Ring:
+    '''array-backed ring buffer: time, method code, status, flattened values'''
+
+    def __init__(self, capacity: int, width: int):
+        self.capacity = capacity
+        self.times = np.zeros(capacity)
+        self.codes = np.zeros(capacity, dtype=np.int16)
+        self.status = np.zeros(capacity)
+        self.values = np.full((capacity, width), np.nan)
+        self.count = 0          # 累计写入条数（可超过 capacity）
+
+    def record(self, t: float, code: int, status: float, args, kwargs) -> None:
+        i = self.count % self.capacity
+        self.count += 1
+        self.times[i] = t
+        self.codes[i] = code
+        self.status[i] = status
+        row = self.values[i]
+        row.fill(np.nan)
+        j, width = 0, len(row)
+        for value in (*args, *kwargs.values()):
+            if j >= width:
+                break
+            if isinstance(value, (int, float)):        # bool 也是 int
+                row[j] = value
+                j += 1
+            elif value is not None:
+                flat = np.ravel(value)[:width - j]
+                row[j:j + len(flat)] = flat
+                j += len(flat)
+
+    def ordered(self) -> Dict[str, np.ndarray]:
+        '''copies in chronological order'''
+        n = min(self.count, self.capacity)
+        order = (np.arange(n) + self.count - n) % self.capacity
+        return {
+            "times": self.times[order],
+            "codes": self.codes[order],
+            "status": self.status[order],
+            "values": self.values[order],
+        }
+
+
+def _status(result) -> float:
+    if result is None:
+        return np.nan
+    try:
+        return float(result)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class FlightRecorder:
+    """
+    Record every command and state read of one robot into ring buffers.
+    将单个机器人的每条指令与状态读取记入环形缓冲区。
+
+    记录 servo_to_* / move_to_* / move_gripper 指令（参数展平为数值）与
+    get_joint_positions 等状态读取（返回值展平），时间戳为 time.perf_counter()（单调）。
+    每次记录只写入预分配数组，不分配新对象。以下情况自动落盘为 .npz：
+    被记录的方法抛出异常（每 `fault_dump_interval` 秒最多一次）、disconnect()
+    （包括上下文管理器退出时）；也可随时调用 dump()。
+
+    status 字段：指令返回值（True/False/错误码），None 记为 NaN，抛出异常记为 -inf。
+
+    Example:
+        recorder = robot.start_flight_recorder(capacity=8192, dump_dir="logs")
+        ...
+        path = robot.dump_flight_record()
+        record = load_flight_record(path)   # dict: commands / states / names
+    """
+
+    def __init__(
+        self,
+        robot,
+        capacity: int = 4096,
+        dump_dir=None,
+        width: int = DEFAULT_WIDTH,
+        fault_dump_interval: float = 1.0,
+    ):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.robot = robot
+        self.dump_dir = Path(dump_dir) if dump_dir is not None else Path.cwd()
+        self.commands = _Ring(capacity, width)
+        self.states = _Ring(capacity, width)
+        self.last_dump: Optional[Path] = None
+        self.fault_dump_interval = fault_dump_interval
+        self._last_fault_dump = -np.inf
+        self._lock = threading.Lock()   # GripperChannel 等线程会并发下发指令
+
+        cls = type(robot)
+        self.command_names: List[str] = sorted(
+            name for name in dir(cls)
+            if (name.startswith(COMMAND_PREFIXES) or name in COMMAND_METHODS) and callable(getattr(cls, name))
+        )
+        self.state_names: List[str] = [name for name in STATE_GETTERS if callable(getattr(cls, name, None))]
+        self._installed = False
+
+    @property
+    def names(self) -> List[str]:
+        """Method name per code: commands first, then state reads. / 方法编号对应的方法名。"""
+        return self.command_names + self.state_names
+
+    def start(self) -> "FlightRecorder":
+        if self._installed:
+            return self
+        for code, name in enumerate(self.command_names):
+            add_method_hook(self.robot, name, _HOOK_KEY, self._command_hook(code))
+        for code, name in enumerate(self.state_names, start=len(self.command_names)):
+            add_method_hook(self.robot, name, _HOOK_KEY, self._state_hook(code))
+        add_method_hook(self.robot, "disconnect", _HOOK_KEY, self._disconnect_hook)
+        self._installed = True
+        return self
+
+    def stop(self) -> None:
+        remove_hooks(self.robot, _HOOK_KEY)
+        self._installed = False
+
+    # ======== Hooks / 钩子 ========
+    def _command_hook(self, code):
+        def factory(inner):
+            def recorded(*args, **kwargs):
+                try:
+                    result = inner(*args, **kwargs)
+                except Exception:
+                    with self._lock:
+                        self.commands.record(time.perf_counter(), code, -np.inf, args, kwargs)
+                    self._dump_on_fault()
+                    raise
+                with self._lock:
+                    self.commands.record(time.perf_counter(), code, _status(result), args, kwargs)
+                return result
+            return recorded
+        return factory
+
+    def _state_hook(self, code):
+        def factory(inner):
+            def recorded():
+                try:
+                    result = inner()
+                except NotImplementedError:
+                    raise
+                except Exception:
+                    with self._lock:
+                        self.states.record(time.perf_counter(), code, -np.inf, (), {})
+                    self._dump_on_fault()
+                    raise
+                with self._lock:
+                    self.states.record(time.perf_counter(), code, 1.0, (result,), {})
+                return result
+            return recorded
+        return factory
+
+    def _disconnect_hook(self, inner):
+        def disconnect(*args, **kwargs):
+            try:
+                return inner(*args, **kwargs)
+            finally:
+                self._safe_dump("disconnect")
+        return disconnect
+
+    def _dump_on_fault(self) -> None:
+        # 循环中反复出错时避免每次都写文件
+        now = time.perf_counter()
+        if now - self._last_fault_dump < self.fault_dump_interval:
+            return
+        self._last_fault_dump = now
+        self._safe_dump("exception")
+
+    def _safe_dump(self, reason: str) -> None:
+        # 自动落盘失败不能掩盖原始异常或阻止断开连接
+        try:
+            self.dump(reason=reason)
+        except OSError as e:
+            print(f"[WARN]: failed to dump flight record: {e}")
+
+    # ======== Dump / 落盘 ========
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """Chronological copies of both rings. / 按时间顺序拷贝两个环形缓冲区。"""
+        with self._lock:
+            commands, states = self.commands.ordered(), self.states.ordered()
+        out = {f"command_{k}": v for k, v in commands.items()}
+        out.update({f"state_{k}": v for k, v in states.items()})
+        out["names"] = np.array(self.names)
+        out["dropped"] = np.array([
+            max(self.commands.count - self.commands.capacity, 0),
+            max(self.states.count - self.states.capacity, 0),
+        ])
+        return out
+
+    def dump(self, path=None, reason: str = "request") -> Path:
+        """
+        Write the recorded window to a .npz file and return its path.
+        将记录窗口写入 .npz 文件并返回路径；默认文件名含机器人 id、时间与原因。
+        """
+        if path is None:
+            robot_id = getattr(getattr(self.robot, "config", None), "id", None) or type(self.robot).__name__
+            now = time.time()
+            stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now)) + f"_{int(now * 1000) % 1000:03d}"
+            path = self.dump_dir / f"flight_{robot_id}_{stamp}_{reason}.npz"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = self.snapshot()
+        data["reason"] = np.array(reason)
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **data)
+        self.last_dump = path
+        return path
+
+
+def load_flight_record(path) -> Dict:
+    '''
+    read a dump written by FlightRecorder.dump
+    读取飞行记录：返回 {"commands": {...}, "states": {...}, "names": [...], "reason": str}，
+    commands / states 中额外提供 "methods"（每条记录对应的方法名）
+    '''
+    with np.load(path) as data:
+        names = [str(n) for n in data["names"]]
+        record = {"names": names, "reason": str(data["reason"]), "dropped": data["dropped"]}
+        for ring in ("command", "state"):
+            part = {k: data[f"{ring}_{k}"] for k in ("times", "codes", "status", "values")}
+            part["methods"] = [names[c] for c in part["codes"]]
+            record[f"{ring}s"] = part
+    return record
@@ -0,0 +1,261 @@
+"""
+Multi-robot coordinator: connect robots in parallel and command them concurrently per tick.
+多机器人协调器：并行连接，每个控制周期向所有成员并发下发指令，并统计机械臂间的时间偏差。
+"""
+import queue
+import threading
+import time
+from array import array
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import numpy as np
+
+from .base_robot import BaseRobot
+from .config import RobotConfig
+from .factory import make_robot_from_config
+from .scheduler import RealtimeScheduler
+
+
+class RobotGroupError(RuntimeError):
+    """
+    One or more members failed during a group call; `errors` maps member name to exception.
+    组调用中有成员失败；errors 为 成员名 -> 异常。
+    """
+
+    def __init__(self, method: str, errors: Dict[str, BaseException]):
+        self.errors = errors
+        detail = ", ".join(f"{name}: {e!r}" for name, e in errors.items())
+        super().__init__(f"{method} failed on {len(errors)} robot(s): {detail}")
+
+
+@dataclass
+class GroupTick:
+    """
+    Result of one concurrent group call.
+    一次并发组调用的结果（时间均为 time.perf_counter()）。
+    """
+    t: float                       # 共享的周期时间戳（下发时刻）
+    results: Dict[str, Any]
+    starts: Dict[str, float]       # 各成员实际开始调用 SDK 的时刻
+    finishes: Dict[str, float]     # 各成员调用返回的时刻
+
+    @property
+    def start_skew(self) -> float:
+        """Spread of the call start times across arms. / 各臂开始时刻的最大差。"""
+        return max(self.starts.values()) - min(self.starts.values()) if self.starts else 0.0
+
+    @property
+    def finish_skew(self) -> float:
+        """Spread of the call return times across arms. / 各臂返回时刻的最大差。"""
+        return max(self.finishes.values()) - min(self.finishes.values()) if self.finishes else 0.0
+
+
+class _Member:
+    '''one worker thread per robot, so SDK round trips of different arms overlap'''
+
+    def __init__(self, name: str, robot: BaseRobot):
+        self.name = name
+        self.robot = robot
+        self.jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._run, name=f"bestman-group-{name}", daemon=True)
+        self.thread.start()
+
+    def submit(self, method: str, args, kwargs) -> Future:
+        future: Future = Future()
+        self.jobs.put((future, method, args, kwargs))
+        return future
+
+    def close(self) -> None:
+        self.jobs.put(None)
+        self.thread.join()
+
+    def _run(self) -> None:
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            future, method, args, kwargs = job
+            start = time.perf_counter()
+            try:
+                result = getattr(self.robot, method)(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result((result, start, time.perf_counter()))
+
+
+class RobotGroup:
+    """
+    Drive several `BaseRobot` instances as one.
+    将多台 BaseRobot 作为一个整体控制（如 xArm + Startouch 双臂）。
+
+    每个成员有独立的工作线程；`call()` 在同一时刻把指令投递给所有成员，各臂的 SDK 往返并行进行，
+    第二台机械臂不再比第一台滞后一个往返。每次调用返回 GroupTick，并累计开始/返回时刻的臂间偏差。
+
+    Example:
+        group = RobotGroup.from_configs({"left": xarm_cfg, "right": startouch_cfg})
+        with group:
+            group.call("go_home")
+            for left_pose, right_pose in traj:
+                group.call_each("servo_to_ee_pose", {"left": left_pose, "right": right_pose})
+            print(group.stats())
+    """
+
+    def __init__(self, robots: Mapping[str, BaseRobot]):
+        if not robots:
+            raise ValueError("RobotGroup needs at least one robot")
+        for name, robot in robots.items():
+            if not isinstance(robot, BaseRobot):
+                raise TypeError(
+                    f"robot {name!r} must be a BaseRobot, got {type(robot).__name__} "
+                    "(use RobotGroup.from_configs for configs)"
+                )
+        self.robots: Dict[str, BaseRobot] = dict(robots)
+        self._members: Optional[Dict[str, _Member]] = None
+        self._start_skew = array("d")
+        self._finish_skew = array("d")
+
+    @classmethod
+    def from_configs(cls, configs: Mapping[str, RobotConfig]) -> "RobotGroup":
+        """Build every member with make_robot_from_config. / 用 make_robot_from_config 创建成员。"""
+        return cls({name: make_robot_from_config(config) for name, config in configs.items()})
+
+    @property
+    def names(self):
+        return list(self.robots)
+
+    def __getitem__(self, name: str) -> BaseRobot:
+        return self.robots[name]
+
+    def _workers(self) -> Dict[str, _Member]:
+        if self._members is None:
+            self._members = {name: _Member(name, robot) for name, robot in self.robots.items()}
+        return self._members
+
+    # ======== Concurrent calls / 并发调用 ========
+    def call(self, method: str, *args, **kwargs) -> GroupTick:
+        """
+        Call `method(*args, **kwargs)` on every member concurrently and wait for all of them.
+        在所有成员上以相同参数并发调用 method 并等待全部返回。
+
+        Example:
+            group.call("move_gripper", 0.5)
+
+        Raises:
+            RobotGroupError: If any member raised (after all members finished).
+        """
+        return self._call(method, {name: args for name in self._workers()}, kwargs)
+
+    def call_each(self, method: str, per_robot: Mapping[str, Any], *args, **kwargs) -> GroupTick:
+        """
+        Call `method` concurrently with a per-member first argument.
+        以各成员各自的第一个参数并发调用 method；未列出的成员跳过，*args / **kwargs 所有成员共用。
+
+        Example:
+            group.call_each("servo_to_ee_pose", {"left": left_pose, "right": right_pose})
+
+        Raises:
+            RobotGroupError: If any member raised (after all members finished).
+        """
+        unknown = set(per_robot) - set(self.robots)
+        if unknown:
+            raise KeyError(f"unknown robots {sorted(unknown)}, group has {self.names}")
+        return self._call(method, {name: (value, *args) for name, value in per_robot.items()}, kwargs)
+
+    def _call(self, method: str, calls: Dict[str, tuple], kwargs) -> GroupTick:
+        members = self._workers()
+        t = time.perf_counter()
+        futures = {name: members[name].submit(method, call_args, kwargs) for name, call_args in calls.items()}
+        tick = GroupTick(t=t, results={}, starts={}, finishes={})
+        errors = {}
+        for name, future in futures.items():
+            try:
+                tick.results[name], tick.starts[name], tick.finishes[name] = future.result()
+            except BaseException as e:
+                errors[name] = e
+        if len(tick.starts) > 1:
+            self._start_skew.append(tick.start_skew)
+            self._finish_skew.append(tick.finish_skew)
+        if errors:
+            raise RobotGroupError(method, errors)
+        return tick
+
+    def run(
+        self,
+        ticks: Iterable[Mapping[str, Any]],
+        rate_hz: float,
+        method: str = "servo_to_ee_pose",
+        lag_policy: str = "stretch",
+    ) -> Dict[str, float]:
+        """
+        Stream per-tick targets {name: target} at a fixed rate on a shared time base.
+        以共享时间轴按固定频率逐周期下发 {成员名: 目标}。
+
+        Returns:
+            scheduler stats plus skew statistics (see stats()).
+        """
+        scheduler = RealtimeScheduler(lag_policy=lag_policy)
+        period = 1.0 / rate_hz
+        scheduler.start()
+        for i, targets in enumerate(ticks):
+            if scheduler.wait(i * period):
+                self.call_each(method, targets)
+        stats = scheduler.stats()
+        stats.update(self.stats())
+        return stats
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Inter-arm skew in seconds over all group calls so far.
+        臂间偏差统计（秒）：start_skew 为开始调用 SDK 的时刻差，finish_skew 为返回时刻差。
+        """
+        stats: Dict[str, float] = {"group_calls": len(self._start_skew)}
+        for key, values in (("start_skew", self._start_skew), ("finish_skew", self._finish_skew)):
+            arr = np.array(values, dtype=np.float64) if len(values) else np.zeros(1)
+            stats[f"{key}_p50"] = float(np.percentile(arr, 50))
+            stats[f"{key}_p99"] = float(np.percentile(arr, 99))
+            stats[f"{key}_max"] = float(arr.max())
+        return stats
+
+    # ======== Lifecycle / 生命周期 ========
+    def connect(self) -> None:
+        """
+        Connect all members in parallel; on failure the connected ones are disconnected again
+        and the worker threads are stopped.
+        并行连接所有成员；任一失败时断开已连接的成员、停止工作线程并抛出 ConnectionError。
+        """
+        try:
+            self.call("connect")
+        except RobotGroupError as e:
+            connected = [name for name in self.names if name not in e.errors]
+            try:
+                if connected:
+                    self._call("disconnect", {name: () for name in connected}, {})
+            except RobotGroupError:
+                pass
+            finally:
+                self.close()
+            raise ConnectionError(str(e)) from e
+
+    def disconnect(self) -> None:
+        """Disconnect all members in parallel and stop the worker threads. / 并行断开并停止工作线程。"""
+        try:
+            self.call("disconnect")
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the worker threads (robots stay connected). / 仅停止工作线程。"""
+        if self._members is not None:
+            for member in self._members.values():
+                member.close()
+            self._members = None
+
+    def __enter__(self) -> "RobotGroup":
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.disconnect()
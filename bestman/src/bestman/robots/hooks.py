@@ -0,0 +1,78 @@
+"""
+Instance-level method hooks for robot drivers.
+机器人驱动的实例级方法钩子。
+
+钩子只作用于单个机器人实例（写入实例 __dict__，覆盖类方法），不修改驱动类本身；
+同一方法可叠加多层钩子，每层由 key 标识，可单独移除。层按 order 从内到外排列：
+order 越小越靠近原始方法（例如状态缓存 order=0 直接替换 SDK 读取，记录/统计类钩子包在外层）。
+
+Example:
+    add_method_hook(robot, "servo_to_ee_pose", "timing",
+                    lambda inner: lambda *a, **kw: timed(inner, *a, **kw))
+    ...
+    remove_hooks(robot, "timing")
+"""
+from typing import Callable, Dict, List, Tuple
+
+_HOOKS_ATTR = "_bestman_method_hooks"
+
+# factory(inner) -> wrapper, inner 为下一层（最终为类上定义的原始方法）
+HookFactory = Callable[[Callable], Callable]
+
+
+def _hooks(obj) -> Dict[str, List[Tuple[int, str, HookFactory]]]:
+    # 直接访问 __dict__，避免触发驱动类的 __getattr__ 委托
+    hooks = obj.__dict__.get(_HOOKS_ATTR)
+    if hooks is None:
+        hooks = obj.__dict__[_HOOKS_ATTR] = {}
+    return hooks
+
+
+def original_method(obj, name: str) -> Callable:
+    """The method as defined on the class, bound to `obj`, ignoring hooks. / 忽略钩子的原始方法。"""
+    return getattr(type(obj), name).__get__(obj, type(obj))
+
+
+def _rebuild(obj, name: str) -> None:
+    layers = _hooks(obj).get(name)
+    if not layers:
+        obj.__dict__.pop(name, None)
+        _hooks(obj).pop(name, None)
+        return
+    fn = original_method(obj, name)
+    for _, _, factory in sorted(layers, key=lambda layer: layer[0]):
+        fn = factory(fn)
+    obj.__dict__[name] = fn
+
+
+def add_method_hook(obj, name: str, key: str, factory: HookFactory, order: int = 10) -> None:
+    """
+    Install (or replace) the hook layer `key` on method `name` of `obj`.
+    在 obj.name 上安装（或替换）名为 key 的钩子层。
+    """
+    if not callable(getattr(type(obj), name, None)):
+        raise AttributeError(f"{type(obj).__name__} has no method '{name}'")
+    layers = [layer for layer in _hooks(obj).get(name, []) if layer[1] != key]
+    layers.append((order, key, factory))
+    _hooks(obj)[name] = layers
+    _rebuild(obj, name)
+
+
+def remove_method_hook(obj, name: str, key: str) -> None:
+    """Remove the hook layer `key` from method `name`; no-op if absent. / 移除一层钩子。"""
+    layers = _hooks(obj).get(name)
+    if layers is None:
+        return
+    _hooks(obj)[name] = [layer for layer in layers if layer[1] != key]
+    _rebuild(obj, name)
+
+
+def remove_hooks(obj, key: str) -> None:
+    """Remove the hook layer `key` from every method. / 从所有方法上移除名为 key 的钩子层。"""
+    for name in list(_hooks(obj)):
+        remove_method_hook(obj, name, key)
+
+
+def hooked_methods(obj, key: str) -> List[str]:
+    """Names of the methods that carry the hook layer `key`. / 带有 key 钩子层的方法名。"""
+    return [name for name, layers in _hooks(obj).items() if any(layer[1] == key for layer in layers)]
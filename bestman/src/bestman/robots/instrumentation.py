@@ -0,0 +1,254 @@
+"""
+Per-method call latency instrumentation.
+逐方法调用耗时统计：用实例级钩子包裹机器人接口，耗时记入固定分桶直方图。
+"""
+import bisect
+import json
+import math
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .hooks import add_method_hook, remove_hooks
+
+_HOOK_KEY = "instrumentation"
+# 包在最外层：统计的是调用方看到的耗时（含状态缓存、飞行记录等内层钩子）
+_HOOK_ORDER = 100
+EXTRA_METHODS = ("move_gripper", "set_mode", "is_moving", "stop_motion")
+# 非方法的抽象成员
+_SKIP = ("observation_features",)
+
+# 直方图分桶：1 µs ~ 10 s，每个数量级 10 个对数等距桶
+BUCKETS_PER_DECADE = 10
+MIN_LATENCY = 1e-6
+MAX_LATENCY = 10.0
+STAT_KEYS = ("count", "errors", "mean", "min", "max", "p50", "p90", "p99")
+
+
+def _bucket_edges() -> List[float]:
+    decades = round(math.log10(MAX_LATENCY / MIN_LATENCY))
+    return [MIN_LATENCY * 10 ** (i / BUCKETS_PER_DECADE) for i in range(decades * BUCKETS_PER_DECADE + 1)]
+
+
+BUCKET_EDGES = _bucket_edges()
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (seconds).
+    固定分桶的耗时直方图（秒）。
+
+    桶边界为 BUCKET_EDGES（对数等距），另有下溢/上溢桶；record() 只做一次二分查找与几次整数加法，
+    不加锁、不分配内存。同一方法被多个线程并发调用时计数可能极少量丢失，统计意义不受影响。
+    分位数取所在桶的上边界（相对误差 < 26%），并以 max 截断；mean / min / max 为精确值。
+    """
+
+    __slots__ = ("counts", "count", "errors", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_EDGES) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_right(BUCKET_EDGES, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Upper edge of the bucket holding the q-th percentile. / 第 q 百分位所在桶的上边界。"""
+        if self.count == 0:
+            return math.nan
+        rank = q / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return min(BUCKET_EDGES[i], self.max) if i < len(BUCKET_EDGES) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        empty = self.count == 0
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean": math.nan if empty else self.total / self.count,
+            "min": math.nan if empty else self.min,
+            "max": math.nan if empty else self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+def api_methods(robot) -> List[str]:
+    '''the BaseRobot API methods implemented by `robot`'s class'''
+    from .base_robot import BaseRobot
+    cls = type(robot)
+    names = set(BaseRobot.__abstractmethods__) - set(_SKIP)
+    names.update(EXTRA_METHODS)
+    return sorted(name for name in names if callable(getattr(cls, name, None)))
+
+
+class Instrumentation:
+    """
+    Time every API call of one robot with time.perf_counter().
+    用 time.perf_counter()（单调时钟）统计单个机器人每个接口的调用耗时。
+
+    默认包裹 BaseRobot 的全部抽象接口（get_* / move_* / servo_* / connect / go_home ...）
+    以及 move_gripper / set_mode / is_moving / stop_motion，不需要修改驱动类。
+    抛出异常的调用同样计入耗时，并累加 errors。stop() 移除钩子后，调用直接进入类方法，没有额外开销。
+
+    Example:
+        inst = robot.enable_instrumentation()
+        inst.export(interval=5.0)                # 每 5 秒打印一次表格
+        ...
+        print(robot.stats()["servo_to_ee_pose"]["p99"])
+    """
+
+    def __init__(self, robot, methods: Optional[Iterable[str]] = None):
+        self.robot = robot
+        self.methods = list(methods) if methods is not None else api_methods(robot)
+        self.histograms: Dict[str, LatencyHistogram] = {name: LatencyHistogram() for name in self.methods}
+        self.exporter: Optional[StatsExporter] = None
+        self._installed = False
+
+    def start(self) -> "Instrumentation":
+        if self._installed:
+            return self
+        for name in self.methods:
+            add_method_hook(self.robot, name, _HOOK_KEY, self._timer(self.histograms[name]), order=_HOOK_ORDER)
+        self._installed = True
+        return self
+
+    def stop(self) -> None:
+        """Remove the timers and stop the exporter (statistics are kept). / 移除计时钩子（保留统计）。"""
+        if self.exporter is not None:
+            self.exporter.stop()
+            self.exporter = None
+        remove_hooks(self.robot, _HOOK_KEY)
+        self._installed = False
+
+    def reset(self) -> None:
+        for name in self.methods:
+            self.histograms[name] = LatencyHistogram()
+        if self._installed:
+            self._installed = False
+            self.start()
+
+    @staticmethod
+    def _timer(hist: LatencyHistogram):
+        clock = time.perf_counter
+
+        def factory(inner):
+            def timed(*args, **kwargs):
+                t0 = clock()
+                try:
+                    return inner(*args, **kwargs)
+                except BaseException:
+                    hist.errors += 1
+                    raise
+                finally:
+                    hist.record(clock() - t0)
+            return timed
+        return factory
+
+    # ======== Reports / 报告 ========
+    def stats(self, include_idle: bool = False) -> Dict[str, Dict[str, float]]:
+        """
+        {method: {count, errors, mean, min, max, p50, p90, p99}}, times in seconds.
+        每个方法的耗时统计（秒）；默认省略从未调用的方法。
+        """
+        return {
+            name: hist.summary() for name, hist in self.histograms.items()
+            if include_idle or hist.count
+        }
+
+    def report(self, fmt: str = "text", include_idle: bool = False) -> str:
+        """
+        Stats as an aligned table (µs) or a JSON document.
+        以表格（微秒）或 JSON 输出统计；JSON 中从未调用的方法的耗时为 null（而非非法的 NaN）。
+        """
+        stats = self.stats(include_idle)
+        if fmt == "json":
+            robot_id = getattr(getattr(self.robot, "config", None), "id", None)
+            methods = {
+                name: {key: None if isinstance(v, float) and math.isnan(v) else v for key, v in s.items()}
+                for name, s in stats.items()
+            }
+            return json.dumps({"time": time.time(), "robot": robot_id, "methods": methods}, allow_nan=False)
+        if fmt != "text":
+            raise ValueError(f"fmt must be 'text' or 'json', got {fmt!r}")
+        lines = [f"{'method':<28}" + "".join(f"{key:>10}" for key in STAT_KEYS)]
+        for name, s in stats.items():
+            cells = [f"{s['count']:>10d}", f"{s['errors']:>10d}"]
+            cells += [f"{s[key] * 1e6:>10.1f}" for key in STAT_KEYS[2:]]
+            lines.append(f"{name:<28}" + "".join(cells))
+        return "\n".join(lines)
+
+    def export(self, interval: float = 10.0, path=None, fmt: str = "text") -> "StatsExporter":
+        """Start a periodic exporter (replaces a running one). / 启动周期导出（替换已有的导出器）。"""
+        if self.exporter is not None:
+            self.exporter.stop()
+        self.exporter = StatsExporter(self, interval, path, fmt).start()
+        return self.exporter
+
+
+class StatsExporter:
+    """
+    Periodically write `Instrumentation.report()` to stdout or a file.
+    周期性地把统计写到标准输出或文件（追加；json 格式为每行一条记录，便于 tail / jq）。
+    """
+
+    def __init__(self, instrumentation: Instrumentation, interval: float = 10.0, path=None, fmt: str = "text"):
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if fmt not in ("text", "json"):
+            raise ValueError(f"fmt must be 'text' or 'json', got {fmt!r}")
+        self.instrumentation = instrumentation
+        self.interval = interval
+        self.path = Path(path) if path is not None else None
+        self.fmt = fmt
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "StatsExporter":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="bestman-stats", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop and write one final report. / 停止并写出最后一次报告。"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.write()
+
+    def write(self) -> None:
+        text = self.instrumentation.report(self.fmt)
+        if self.path is None:
+            print(text, file=sys.stdout, flush=True)
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(text + "\n")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError as e:
+                print(f"[WARN]: failed to export robot stats: {e}")
@@ -0,0 +1,96 @@
+"""
+Preallocated observation buffers.
+预分配的观测缓冲区：每次 get_observation() 原地写入同一组数组，高频策略循环中不产生新的分配。
+"""
+from typing import Any, Dict
+
+import numpy as np
+
+
+def state_observation_features(dof: int) -> Dict[str, Any]:
+    """
+    Observation schema shared by the arm drivers.
+    机械臂驱动通用的观测结构。
+    """
+    return {
+        "joint_pos": (dof,),       # 关节角（单位与 get_joint_positions 一致）
+        "joint_vel": (dof,),       # 关节速度
+        "eef_pos": (6,),           # [x, y, z, roll, pitch, yaw]，米
+        "gripper_pos": float,      # 夹爪位置，未实现时为 NaN
+    }
+
+
+# 观测特征 -> 读取接口
+STATE_OBSERVATION_GETTERS = (
+    ("joint_pos", "get_joint_positions"),
+    ("joint_vel", "get_joint_velocities"),
+    ("eef_pos", "get_ee_pose"),
+    ("gripper_pos", "get_gripper_position"),
+)
+
+
+class ObservationBuffer:
+    """
+    One preallocated array per feature of an `observation_features` schema.
+    按 observation_features 为每个特征预分配一个数组。
+
+    形状为 tuple 的特征分配 `dtype` 数组；声明为 float 的标量特征分配 0 维 float64 数组。
+    `get()` 每次返回同一个字典与同一组数组（内容会被下一次 fill 覆盖），
+    需要保存观测时用 `get(copy=True)`。
+
+    Example:
+        buf = ObservationBuffer(robot.observation_features, dtype=np.float32)
+        buf.fill("joint_pos", robot.get_joint_positions())
+        obs = buf.get()
+    """
+
+    def __init__(self, features: Dict[str, Any], dtype=np.float64):
+        self.features = dict(features)
+        self.arrays: Dict[str, np.ndarray] = {}
+        for name, spec in self.features.items():
+            if spec is float or spec is int:
+                self.arrays[name] = np.full((), np.nan)
+            else:
+                self.arrays[name] = np.full(tuple(spec), np.nan, dtype=dtype)
+        self._view = dict(self.arrays)
+
+    def fill(self, name: str, value) -> None:
+        """
+        Write `value` into the buffer of `name` in place; None fills NaN.
+        原地写入；value 为 None（接口未实现）时写入 NaN。
+        """
+        buf = self.arrays[name]
+        if value is None:
+            buf.fill(np.nan)
+            return
+        if buf.ndim and len(value) != buf.shape[0]:
+            raise ValueError(f"observation '{name}' expects shape {buf.shape}, got length {len(value)}")
+        np.copyto(buf, value, casting="unsafe")
+
+    def fill_head(self, name: str, values) -> None:
+        """
+        Copy the first len(buffer) items of a longer sequence without slicing it.
+        按缓冲区长度逐项复制序列的前若干项（不切片、不分配临时列表），如 SDK 固定 7 维的关节列表。
+        """
+        buf = self.arrays[name]
+        for i in range(buf.shape[0]):
+            buf[i] = values[i]
+
+    def get(self, copy: bool = False) -> Dict[str, np.ndarray]:
+        """The observation dict; copies the arrays only when `copy` is True. / 获取观测字典。"""
+        if copy:
+            return {name: arr.copy() for name, arr in self.arrays.items()}
+        return self._view
+
+
+def read_state_observation(robot, buffer: ObservationBuffer) -> None:
+    '''
+    fill the `state_observation_features` entries from the robot getters
+    通过机器人读取接口填充通用状态观测（状态缓存运行时读取的是快照，不访问 SDK）
+    '''
+    for name, getter in STATE_OBSERVATION_GETTERS:
+        try:
+            value = getattr(robot, getter)()
+        except NotImplementedError:
+            value = None
+        buffer.fill(name, value)
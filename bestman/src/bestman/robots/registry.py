@@ -0,0 +1,94 @@
+"""
+Lazy robot plugin registry.
+延迟加载的机器人插件注册表：配置 type 名 -> 配置类 / 驱动类的 "module:attr" 路径。
+
+内置机器人只登记在 BUILTIN_* 中（不重复写入 pyproject）；第三方包通过 entry points 注册
+（同名时覆盖内置项），例如：
+
+    [project.entry-points."bestman.robot_configs"]
+    my_arm = "my_pkg.config:MyArmConfig"
+
+    [project.entry-points."bestman.robots"]
+    my_arm = "my_pkg.driver:BestmanMyArm"
+
+配置类只在解析到对应 type 时导入；驱动模块（及其厂商 SDK）只在 make_robot_from_config 需要时导入。
+"""
+import functools
+import importlib
+from importlib import metadata
+from typing import Any, Callable, Dict, List
+
+CONFIG_GROUP = "bestman.robot_configs"
+ROBOT_GROUP = "bestman.robots"
+
+BUILTIN_CONFIGS: Dict[str, str] = {
+    "xarm": "bestman.robots.xarm.xarm_config:XArmConfig",
+    "startouch": "bestman.robots.startouch.startouch_config:StartouchConfig",
+    "sim": "bestman.robots.sim.sim_config:SimConfig",
+}
+BUILTIN_ROBOTS: Dict[str, str] = {
+    "xarm": "bestman.robots.xarm.bestman_xarm:BestmanXarm",
+    "startouch": "bestman.robots.startouch.bestman_startouch:BestmanStartouch",
+    "sim": "bestman.robots.sim.bestman_sim:BestmanSim",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _entry_points(group: str) -> Dict[str, str]:
+    try:
+        eps = metadata.entry_points(group=group)
+    except TypeError:                       # Python < 3.10
+        eps = metadata.entry_points().get(group, [])
+    return {ep.name: ep.value for ep in eps}
+
+
+def targets(group: str) -> Dict[str, str]:
+    """{type name: "module:attr"} for a group, entry points over built-ins. / 某组的全部注册项。"""
+    builtin = BUILTIN_CONFIGS if group == CONFIG_GROUP else BUILTIN_ROBOTS
+    return {**builtin, **_entry_points(group)}
+
+
+def available_robots() -> List[str]:
+    """Registered robot type names (nothing is imported). / 已注册的机器人 type 名（不导入任何模块）。"""
+    return sorted(targets(CONFIG_GROUP))
+
+
+def load_target(target: str) -> Any:
+    '''import "module:attr" and return the attribute'''
+    module_name, _, attr = target.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in filter(None, attr.split(".")):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _load(group: str, name: str) -> Any:
+    target = targets(group).get(name)
+    if target is None:
+        raise KeyError(f"unknown robot type {name!r}, available: {available_robots()}")
+    return load_target(target)
+
+
+def load_config_class(name: str) -> type:
+    """Import the config class registered for type `name`. / 导入 type 对应的配置类（会完成 draccus 注册）。"""
+    return _load(CONFIG_GROUP, name)
+
+
+def load_robot_class(name: str) -> type:
+    """Import the driver class registered for type `name`. / 导入 type 对应的驱动类（会导入厂商 SDK）。"""
+    return _load(ROBOT_GROUP, name)
+
+
+def lazy_exports(module_name: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Module-level __getattr__ that imports `exports` ({name: relative module}) on first access.
+    生成模块级 __getattr__：首次访问 exports 中的名字时才导入对应子模块。
+
+    Example:
+        __getattr__ = lazy_exports(__name__, {"BestmanSim": ".bestman_sim"})
+    """
+    def __getattr__(name: str) -> Any:
+        if name in exports:
+            return getattr(importlib.import_module(exports[name], module_name), name)
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+    return __getattr__
@@ -0,0 +1,103 @@
+import time
+from array import array
+from typing import Dict, Literal
+
+import numpy as np
+
+LagPolicy = Literal["drop", "stretch", "abort"]
+LAG_POLICIES = ("drop", "stretch", "abort")
+
+
+class ScheduleLagError(RuntimeError):
+    """Raised by the "abort" lag policy when a tick is later than `max_lag`."""
+
+
+class RealtimeScheduler:
+    """
+    High-precision periodic scheduler: coarse sleep, then spin-wait.
+    高精度定时器：先粗睡眠，最后 `spin_window` 秒忙等，减小 time.sleep 的唤醒抖动。
+
+    Lag policies / 滞后策略（某一帧晚于 `max_lag` 时）:
+    - "drop":    跳过该帧，直到追上时间表
+    - "stretch": 整体平移后续时间轴（时间拉伸），不丢帧
+    - "abort":   抛出 ScheduleLagError
+
+    Example:
+        scheduler = RealtimeScheduler(lag_policy="stretch")
+        scheduler.start()
+        for t, cmd in zip(timestamps, commands):
+            if scheduler.wait(t):
+                send(cmd)
+        print(scheduler.stats())
+    """
+
+    def __init__(
+        self,
+        spin_window: float = 0.002,
+        lag_policy: LagPolicy = "stretch",
+        max_lag: float = 0.01,
+        clock=time.perf_counter,
+    ):
+        if lag_policy not in LAG_POLICIES:
+            raise ValueError(f"lag_policy must be one of {LAG_POLICIES}, got {lag_policy!r}")
+        self.spin_window = spin_window
+        self.lag_policy = lag_policy
+        self.max_lag = max_lag
+        self.clock = clock
+        self.start()
+
+    def start(self) -> None:
+        """Reset the time base to now and clear statistics. / 以当前时刻为零点并清空统计。"""
+        self._t0 = self.clock()
+        self._offset = 0.0       # stretch 策略累计的时间平移
+        self._lateness = array("d")
+        self.dropped = 0
+
+    def now(self) -> float:
+        """Seconds on the schedule time axis. / 时间轴上的当前时刻（秒）。"""
+        return self.clock() - self._t0 - self._offset
+
+    def wait(self, t: float) -> bool:
+        """
+        Block until schedule time `t`, then apply the lag policy.
+        等待至时间轴时刻 `t`，并执行滞后策略。
+
+        Returns:
+            bool: False if the tick should be skipped ("drop" policy).
+                  若该帧应被跳过（"drop" 策略）则返回 False。
+        """
+        clock = self.clock
+        target = self._t0 + self._offset + t
+        remaining = target - clock()
+        if remaining > self.spin_window:
+            time.sleep(remaining - self.spin_window)
+        while clock() < target:
+            pass
+
+        late = clock() - target
+        self._lateness.append(late)
+        if late <= self.max_lag:
+            return True
+        if self.lag_policy == "drop":
+            self.dropped += 1
+            return False
+        if self.lag_policy == "stretch":
+            self._offset += late
+            return True
+        raise ScheduleLagError(f"behind schedule by {late:.3f}s at t={t:.3f}s (max_lag={self.max_lag}s)")
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Per-tick lateness statistics in seconds.
+        每帧滞后统计（秒）。
+        """
+        lateness = np.array(self._lateness, dtype=np.float64) if len(self._lateness) else np.zeros(1)
+        return {
+            "ticks": len(self._lateness),
+            "dropped": self.dropped,
+            "stretched": self._offset,
+            "lateness_p50": float(np.percentile(lateness, 50)),
+            "lateness_p99": float(np.percentile(lateness, 99)),
+            "lateness_max": float(lateness.max()),
+            "lateness_mean": float(lateness.mean()),
+        }
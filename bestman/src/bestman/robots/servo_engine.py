@@ -0,0 +1,156 @@
+"""
+Fixed-rate servo streaming engine with latest-target semantics.
+固定频率伺服发送引擎：生产者只投递目标，引擎线程按固定频率向 SDK 发送。
+"""
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from .scheduler import RealtimeScheduler
+
+# 生产者间隔估计的上限：生产者停止投递时，最多用这么长时间插值到最后一个目标后保持
+MAX_SEGMENT = 0.2
+
+
+class ServoEngine:
+    """
+    Stream servo commands at a fixed rate from a latest-wins target slot.
+    以固定频率从"最新目标"槽位取值并发送伺服指令。
+
+    生产者（策略、遥操作、复现）调用 `post(target)` 覆盖最新目标并立即返回，不会阻塞；
+    引擎线程用 RealtimeScheduler 以 `rate_hz` 节拍调用 `send`，生产者卡顿不会传导为机械臂抖动。
+
+    interpolate=True 时，每收到新目标，从当前已发送的指令出发，在估计的生产者间隔内
+    线性插值到新目标（最多引入一个生产者周期的延迟），生产者慢于伺服频率时指令依然平滑；
+    生产者停止投递后保持最后一个目标。`angle_dims` 指定的分量按 `angle_period`
+    取最短方向插值（例如 ee_pose 的 rpy，弧度用 2*pi，角度用 360）。
+
+    Example:
+        engine = robot.start_servo_engine("ee_pose", rate_hz=250)
+        while running:
+            engine.post(policy(obs))     # 任意频率
+        robot.stop_servo_engine()
+    """
+
+    def __init__(
+        self,
+        send: Callable[[np.ndarray], object],
+        rate_hz: float = 250.0,
+        interpolate: bool = True,
+        angle_dims=None,
+        angle_period: Optional[float] = None,
+        spin_window: float = 0.001,
+        max_lag: float = 0.005,
+        realtime_priority: bool = False,
+    ):
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+        self.send = send
+        self.period = 1.0 / rate_hz
+        self.interpolate = interpolate
+        self.angle_dims = angle_dims
+        self.angle_period = angle_period
+        self.realtime_priority = realtime_priority
+        self.scheduler = RealtimeScheduler(spin_window=spin_window, lag_policy="stretch", max_lag=max_lag)
+
+        self.sent = 0                  # 成功调用 send 的次数
+        self.errors = 0
+        self.posted = 0                # 生产者投递次数
+        self.last_error: Optional[BaseException] = None
+        self.last_command: Optional[np.ndarray] = None
+
+        self._lock = threading.Lock()
+        self._target: Optional[np.ndarray] = None
+        self._target_seq = 0
+        self._last_post: Optional[float] = None
+        self._interval = self.period   # 生产者投递间隔的滑动估计
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def post(self, target) -> None:
+        """Publish the latest target (non-blocking, latest wins). / 投递最新目标（非阻塞，覆盖旧目标）。"""
+        target = np.array(target, dtype=float)
+        now = time.perf_counter()
+        with self._lock:
+            if self._last_post is not None:
+                dt = min(now - self._last_post, MAX_SEGMENT)
+                self._interval += 0.3 * (dt - self._interval)
+            self._last_post = now
+            self._target = target
+            self._target_seq += 1
+            self.posted += 1
+
+    def start(self) -> "ServoEngine":
+        if self.running:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="bestman-servo", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def stats(self) -> Dict[str, float]:
+        """Tick timing (see RealtimeScheduler.stats) plus send counters. / 节拍统计与发送计数。"""
+        stats = self.scheduler.stats()
+        stats.update(sent=self.sent, errors=self.errors, posted=self.posted, producer_interval=self._interval)
+        return stats
+
+    def _set_priority(self) -> None:
+        # Linux 下 pid=0 作用于当前线程；需要 CAP_SYS_NICE 权限，失败时保持普通优先级
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+        except (AttributeError, OSError) as e:
+            print(f"[WARN]: servo thread keeps normal priority: {e}")
+
+    def _shortest(self, delta: np.ndarray) -> np.ndarray:
+        if self.angle_period is not None and self.angle_dims is not None:
+            half = 0.5 * self.angle_period
+            delta[self.angle_dims] = (delta[self.angle_dims] + half) % self.angle_period - half
+        return delta
+
+    def _run(self) -> None:
+        if self.realtime_priority:
+            self._set_priority()
+        seen_seq = 0
+        seg_start = seg_delta = None
+        seg_t0, seg_duration = 0.0, self.period
+        self.scheduler.start()
+        tick = 0
+        while not self._stop.is_set():
+            tick += 1
+            self.scheduler.wait(tick * self.period)
+
+            with self._lock:
+                target, seq, interval = self._target, self._target_seq, self._interval
+            if target is None:
+                continue
+            now = time.perf_counter()
+            if seq != seen_seq:
+                seen_seq = seq
+                seg_start = target if self.last_command is None or not self.interpolate else self.last_command
+                seg_delta = self._shortest(target - seg_start)
+                seg_t0, seg_duration = now, max(interval, self.period)
+
+            alpha = (now - seg_t0 + self.period) / seg_duration if self.interpolate else 1.0
+            # 插值结束后发送目标本身（最短方向插值的终点可能与目标相差一个周期）
+            command = target if alpha >= 1.0 else seg_start + alpha * seg_delta
+            try:
+                self.send(command)
+                self.sent += 1
+            except Exception as e:
+                self.errors += 1
+                self.last_error = e
+            self.last_command = command
@@ -0,0 +1,13 @@
+"""
+Kinematic simulation backend. Importing the package only loads the config; the driver on first use.
+运动学仿真后端：导入包只加载配置类，驱动在首次访问时导入。
+"""
+from ..registry import lazy_exports
+from .sim_config import SimConfig
+
+__all__ = ["SimConfig", "BestmanSim", "DHChain"]
+
+__getattr__ = lazy_exports(__name__, {
+    "BestmanSim": ".bestman_sim",
+    "DHChain": ".kinematics",
+})
@@ -0,0 +1,388 @@
+import heapq
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from bestman.utils.conversions import T_to_pose_euler, pose_euler_to_T, pose_quat_to_T
+
+from ..base_robot import BaseRobot
+from ..factory import register_robot
+from ..observation import ObservationBuffer, state_observation_features
+from .kinematics import DHChain
+from .sim_config import SimConfig
+
+
+@register_robot(SimConfig)
+class BestmanSim(BaseRobot):
+    """
+    Kinematic simulated arm: no hardware, no vendor SDK.
+    运动学仿真机械臂，不需要硬件与厂商 SDK，用于在任意 Linux 机器上测试与基准复现/伺服流程。
+
+    Model / 模型:
+    - 关节角受 joint_limits 约束，超限的关节指令被拒绝（返回 False），笛卡尔指令的逆解被限制在范围内
+    - 一阶跟踪：q̇ = (q_target - q) / time_constant，并限制在 max_joint_velocity 以内
+    - 指令经过 command_latency + |N(0, jitter)| 的仿真时间后才生效；每次接口调用阻塞 call_duration
+    - 仿真时间 = 墙上时间 * time_scale；manual_clock=True 时仅随 step() 与阻塞调用推进，
+      跑得和 CPU 一样快且结果确定
+
+    状态在读取/下发时按经过的仿真时间解析积分，不需要后台线程。
+
+    Example:
+        config = SimConfig(time_scale=10.0, command_latency=0.004, jitter=0.001)
+        with make_robot_from_config(config) as robot:
+            robot.servo_to_ee_pose(pose)
+    """
+
+    config_class = SimConfig
+
+    def __init__(self, config: SimConfig):
+        super().__init__(config)
+        self.config: SimConfig = config
+        dof = config.dof
+        if config.joint_limits is not None:
+            limits = np.asarray(config.joint_limits, dtype=float)
+        else:
+            limits = np.tile([-2.0 * np.pi, 2.0 * np.pi], (dof, 1))
+        self.lower, self.upper = limits[:, 0].copy(), limits[:, 1].copy()
+        self.kinematics = DHChain(config.dh_params, self.lower, self.upper)
+        self._rng = np.random.default_rng(config.seed)
+        self._lock = threading.RLock()
+        self._observation: Optional[ObservationBuffer] = None
+        self._mode = 0
+        self.connected = False
+
+        home = np.asarray(config.initial_joints, dtype=float)
+        self._q = np.clip(home, self.lower, self.upper)
+        self._target = self._q.copy()            # 已生效的关节目标
+        self._commanded = self._q.copy()         # 最近一次下发的关节目标（可能尚未生效）
+        self._gripper = 0.0
+        self._gripper_target = 0.0
+        self._pending = []                       # 堆：(生效时刻, 序号, 类型, 值)
+        self._seq = 0
+        self._t = 0.0                            # 已积分到的仿真时刻
+        self._sim_time = 0.0                     # manual_clock 的当前仿真时刻
+        self._wall_origin = time.perf_counter()
+
+    # ======== Sim clock / 仿真时钟 ========
+    def now(self) -> float:
+        """Current simulation time in seconds. / 当前仿真时间（秒）。"""
+        if self.config.manual_clock:
+            return self._sim_time
+        return (time.perf_counter() - self._wall_origin) * self.config.time_scale
+
+    def step(self, dt: float) -> None:
+        """Advance the manual clock by `dt` sim seconds. / 推进手动时钟 dt 秒（仅 manual_clock=True）。"""
+        if not self.config.manual_clock:
+            raise RuntimeError("step() requires SimConfig(manual_clock=True)")
+        with self._lock:
+            self._sim_time += dt
+            self._advance(self._sim_time)
+
+    def _block(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        if self.config.manual_clock:
+            with self._lock:
+                self._sim_time += seconds
+        else:
+            time.sleep(seconds / self.config.time_scale)
+
+    def _call(self) -> None:
+        '''every interface call: check the connection and pay the SDK round trip'''
+        if not self.connected:
+            raise ConnectionError("sim robot is not connected, call connect() first")
+        self._block(self.config.call_duration)
+
+    # ======== Dynamics / 动力学 ========
+    def _integrate(self, t: float) -> None:
+        dt = t - self._t
+        if dt <= 0:
+            return
+        cfg = self.config
+        step = (self._target - self._q) * -math.expm1(-dt / cfg.time_constant)
+        limit = cfg.max_joint_velocity * dt
+        np.clip(step, -limit, limit, out=step)
+        self._q += step
+        self._gripper += (self._gripper_target - self._gripper) * -math.expm1(-dt / cfg.gripper_time_constant)
+        self._t = t
+
+    def _advance(self, t: float) -> None:
+        pending = self._pending
+        while pending and pending[0][0] <= t:
+            t_apply, _, kind, value = heapq.heappop(pending)
+            self._integrate(t_apply)
+            if kind == "joints":
+                self._target[:] = value
+            else:
+                self._gripper_target = value
+        self._integrate(t)
+
+    def _sync(self) -> None:
+        self._advance(self.now())
+
+    def _command(self, kind: str, value) -> None:
+        delay = self.config.command_latency
+        if self.config.jitter > 0:
+            delay += abs(self._rng.normal(0.0, self.config.jitter))
+        with self._lock:
+            self._sync()
+            if kind == "joints":
+                self._commanded[:] = value
+            if delay <= 0:
+                if kind == "joints":
+                    self._target[:] = value
+                else:
+                    self._gripper_target = value
+                return
+            self._seq += 1
+            if kind == "joints":
+                value = np.array(value, dtype=float)
+            heapq.heappush(self._pending, (self._t + delay, self._seq, kind, value))
+
+    def _settled(self) -> bool:
+        return not self._pending and float(np.max(np.abs(self._target - self._q))) <= self.config.settle_tolerance
+
+    def _wait_settled(self) -> bool:
+        t_end = self.now() + self.config.move_timeout
+        while True:
+            with self._lock:
+                self._sync()
+                if self._settled():
+                    return True
+            if self.now() >= t_end:
+                return False
+            if self.config.manual_clock:
+                self.step(0.01)
+            else:
+                time.sleep(0.002)
+
+    # ======== Lifecycle / 生命周期 ========
+    def connect(self) -> None:
+        with self._lock:
+            self._wall_origin = time.perf_counter()
+            self._sim_time = 0.0
+            self._t = 0.0
+            self.connected = True
+
+    def disconnect(self) -> None:
+        with self._lock:
+            self._sync()
+            self._pending.clear()
+            self._target[:] = self._q
+            self.connected = False
+
+    # ======== Observation / 观测 ========
+    @property
+    def observation_features(self) -> Dict[str, Any]:
+        return state_observation_features(self.config.dof)
+
+    def get_observation(self, copy: bool = False) -> Dict[str, Any]:
+        """
+        Fill the preallocated observation buffers and return them.
+        原地填充预分配的观测数组并返回（copy=True 时返回副本）。
+
+        一次调用、一次加锁读取仿真状态，直接写入缓冲区（不经过返回副本的 get_* 接口）。
+        """
+        if self._observation is None:
+            self._observation = ObservationBuffer(self.observation_features, dtype=np.float32)
+        obs = self._observation.arrays
+        limit = self.config.max_joint_velocity
+        self._call()
+        with self._lock:
+            self._sync()
+            obs["joint_pos"][:] = self._q
+            joint_vel = obs["joint_vel"]
+            np.subtract(self._target, self._q, out=joint_vel)
+            joint_vel /= self.config.time_constant
+            np.clip(joint_vel, -limit, limit, out=joint_vel)
+            T_to_pose_euler(self.kinematics.frames(self._q)[-1], out=obs["eef_pos"])
+            obs["gripper_pos"][...] = self._gripper
+        return self._observation.get(copy)
+
+    def action_features(self) -> Dict[str, Any]:
+        return {
+            "joint_targets": (self.config.dof,),    # 弧度
+            "gripper_command": float,               # [0, 1]
+        }
+
+    # ======== Mode / 模式 ========
+    def set_mode(self, mode: int) -> int:
+        '''recorded only, position and servo commands behave the same in simulation'''
+        self._mode = mode
+        return 0
+
+    @property
+    def mode(self) -> int:
+        return self._mode
+
+    # ======== State / 状态读取 ========
+    def get_joint_positions(self) -> np.ndarray:
+        """(dof,) in radians / 弧度"""
+        self._call()
+        with self._lock:
+            self._sync()
+            return self._q.copy()
+
+    def _velocity(self) -> np.ndarray:
+        limit = self.config.max_joint_velocity
+        return np.clip((self._target - self._q) / self.config.time_constant, -limit, limit)
+
+    def get_joint_velocities(self) -> np.ndarray:
+        """(dof,) in rad/s"""
+        self._call()
+        with self._lock:
+            self._sync()
+            return self._velocity()
+
+    def get_ee_pose(self) -> np.ndarray:
+        """[x, y, z, roll, pitch, yaw] in meters and radians / 米 + 弧度"""
+        self._call()
+        with self._lock:
+            self._sync()
+            return T_to_pose_euler(self.kinematics.fk(self._q))
+
+    def get_ee_velocity(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(linear m/s, angular rad/s) in the base frame / 基坐标系下的线速度与角速度"""
+        self._call()
+        with self._lock:
+            self._sync()
+            twist = self.kinematics.jacobian(self._q) @ self._velocity()
+        return twist[:3], twist[3:]
+
+    def get_gripper_position(self) -> float:
+        """Normalized [0, 1], 0=open / 归一化开合，0 为全开"""
+        self._call()
+        with self._lock:
+            self._sync()
+            return float(self._gripper)
+
+    # ======== Commands / 指令 ========
+    def _joint_command(self, joint_positions) -> bool:
+        q = np.asarray(joint_positions, dtype=float)
+        if q.shape != (self.config.dof,):
+            raise ValueError(f"Expected joint_positions shape ({self.config.dof},), got {q.shape}")
+        if not np.all(np.isfinite(q)) or np.any(q < self.lower) or np.any(q > self.upper):
+            return False
+        self._command("joints", q)
+        return True
+
+    def _pose_command(self, T: np.ndarray) -> bool:
+        with self._lock:
+            seed = self._commanded.copy()
+        q, converged = self.kinematics.ik(T, seed)
+        if not converged:
+            return False
+        self._command("joints", q)
+        return True
+
+    def move_to_joint_positions(
+        self,
+        joint_positions: Union[list, np.ndarray],
+        is_radian: bool = True,
+        wait: bool = False,
+    ) -> bool:
+        """
+        目标关节角，超出关节范围时拒绝并返回 False
+        is_radian: 默认弧度（BaseRobot 约定）；False 时按度解释，与 BestmanXarm 的同名参数对应
+        """
+        if not is_radian:
+            joint_positions = np.deg2rad(np.asarray(joint_positions, dtype=float))
+        self._call()
+        if not self._joint_command(joint_positions):
+            return False
+        return self._wait_settled() if wait else True
+
+    def move_to_ee_pose(
+        self,
+        pose: Union[list, np.ndarray],
+        is_radian: bool = False,
+        wait: bool = False,
+    ) -> bool:
+        """pose: [x, y, z, roll, pitch, yaw]，位置米，姿态由 is_radian 决定；逆解失败返回 False"""
+        pose = np.array(pose, dtype=float)
+        if pose.shape != (6,):
+            raise ValueError(f"pose must be shape (6,), got {pose.shape}")
+        if not is_radian:
+            pose[3:] = np.deg2rad(pose[3:])
+        self._call()
+        if not self._pose_command(pose_euler_to_T(pose)):
+            return False
+        return self._wait_settled() if wait else True
+
+    def move_to_ee_pose_rpy(
+        self,
+        position: Union[List[float], np.ndarray],
+        rpy: Union[List[float], np.ndarray],
+        is_radian: bool = False,
+        wait: bool = False,
+    ) -> bool:
+        return self.move_to_ee_pose(np.concatenate([position, rpy]), is_radian=is_radian, wait=wait)
+
+    def move_to_ee_pose_quat(
+        self,
+        position: Union[List[float], np.ndarray],
+        orientation: Union[List[float], np.ndarray],
+        wait: bool = False,
+    ) -> bool:
+        """orientation: [qx, qy, qz, qw]"""
+        self._call()
+        if not self._pose_command(pose_quat_to_T(np.concatenate([position, orientation]))):
+            return False
+        return self._wait_settled() if wait else True
+
+    def servo_to_joint_positions(
+        self,
+        joint_positions: Union[list, np.ndarray],
+    ) -> bool:
+        self._call()
+        return self._joint_command(joint_positions)
+
+    def servo_to_ee_pose(
+        self,
+        pose: Union[list, np.ndarray]
+    ) -> bool:
+        """pose: [x, y, z, roll, pitch, yaw]（米 + 弧度），逆解从上一次下发的关节目标出发"""
+        self._call()
+        return self._pose_command(pose_euler_to_T(pose))
+
+    def servo_to_ee_pose_rpy(
+        self,
+        position: Union[list, np.ndarray],
+        rpy: Union[list, np.ndarray],
+    ) -> bool:
+        return self.servo_to_ee_pose(np.concatenate([position, rpy]))
+
+    def servo_to_ee_pose_quat(
+        self,
+        position: Union[list, np.ndarray],
+        orientation: Union[list, np.ndarray],
+    ) -> bool:
+        self._call()
+        return self._pose_command(pose_quat_to_T(np.concatenate([position, orientation])))
+
+    def move_gripper(self, command: float) -> bool:
+        """command: [0, 1]，0 为全开"""
+        self._call()
+        self._command("gripper", min(max(float(command), 0.0), 1.0))
+        return True
+
+    def go_home(self) -> bool:
+        return self.move_to_joint_positions(self.config.initial_joints, wait=True)
+
+    # ======== Motion Status / 运动状态 ========
+    def is_moving(self) -> bool:
+        self._call()
+        with self._lock:
+            self._sync()
+            return not self._settled()
+
+    def stop_motion(self) -> None:
+        self._call()
+        with self._lock:
+            self._sync()
+            self._pending.clear()
+            self._target[:] = self._q
+            self._commanded[:] = self._q
@@ -0,0 +1,95 @@
+"""
+Standard-DH serial arm kinematics for the simulated backend.
+仿真后端使用的标准 DH 串联机械臂运动学：正解、几何雅可比、阻尼最小二乘逆解。
+"""
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+from bestman.utils.conversions import matrix_to_rotvec
+
+
+class DHChain:
+    """
+    Serial chain described by standard DH rows [d, a, alpha].
+    由标准 DH 参数 [d, a, alpha] 描述的串联机械臂；关节 i 的变换为
+    Rz(theta_i) @ Tz(d_i) @ Tx(a_i) @ Rx(alpha_i)。
+    """
+
+    def __init__(self, dh_params, lower: np.ndarray, upper: np.ndarray):
+        dh = np.asarray(dh_params, dtype=float)
+        if dh.ndim != 2 or dh.shape[1] != 3:
+            raise ValueError(f"dh_params must have shape (dof, 3), got {dh.shape}")
+        self.dof = dh.shape[0]
+        self.d, self.a, self.alpha = dh[:, 0], dh[:, 1], dh[:, 2]
+        self._ca, self._sa = np.cos(self.alpha), np.sin(self.alpha)
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        self._frames = np.empty((self.dof + 1, 4, 4))
+
+    def frames(self, q) -> np.ndarray:
+        '''(dof+1, 4, 4) base-to-frame transforms; the last one is the flange. Reuses one buffer.'''
+        frames = self._frames
+        frames[0] = np.eye(4)
+        for i in range(self.dof):
+            ct, st = math.cos(q[i]), math.sin(q[i])
+            ca, sa = self._ca[i], self._sa[i]
+            link = np.array((
+                (ct, -st * ca, st * sa, self.a[i] * ct),
+                (st, ct * ca, -ct * sa, self.a[i] * st),
+                (0.0, sa, ca, self.d[i]),
+                (0.0, 0.0, 0.0, 1.0),
+            ))
+            np.matmul(frames[i], link, out=frames[i + 1])
+        return frames
+
+    def fk(self, q) -> np.ndarray:
+        """Flange pose (4, 4) in the base frame. / 法兰在基坐标系下的位姿。"""
+        return self.frames(q)[-1].copy()
+
+    def jacobian(self, q, frames: Optional[np.ndarray] = None) -> np.ndarray:
+        """Geometric Jacobian (6, dof): rows [v; w]. / 几何雅可比，前三行线速度，后三行角速度。"""
+        if frames is None:
+            frames = self.frames(q)
+        p_end = frames[-1, :3, 3]
+        z = frames[:-1, :3, 2]
+        p = frames[:-1, :3, 3]
+        J = np.empty((6, self.dof))
+        J[:3] = np.cross(z, p_end - p).T
+        J[3:] = z.T
+        return J
+
+    def ik(
+        self,
+        target: np.ndarray,
+        seed,
+        max_iters: int = 100,
+        tol: float = 1e-6,
+        damping: float = 1e-3,
+    ) -> Tuple[np.ndarray, bool]:
+        """
+        Damped least-squares IK from `seed`, clamped to the joint limits.
+        从 seed 出发的阻尼最小二乘逆解，每步限制在关节范围内。
+
+        Returns:
+            (q, converged): converged 为 False 时 q 是最接近的解。
+        """
+        q = np.clip(np.array(seed, dtype=float), self.lower, self.upper)
+        R_t, p_t = target[:3, :3], target[:3, 3]
+        err = np.empty(6)
+        lam2 = damping * damping * np.eye(6)
+        for _ in range(max_iters):
+            frames = self.frames(q)
+            end = frames[-1]
+            err[:3] = p_t - end[:3, 3]
+            err[3:] = matrix_to_rotvec(R_t @ end[:3, :3].T)
+            if err @ err < tol * tol:
+                return q, True
+            J = self.jacobian(q, frames)
+            dq = J.T @ np.linalg.solve(J @ J.T + lam2, err)
+            np.clip(q + dq, self.lower, self.upper, out=q)
+        frames = self.frames(q)
+        err[:3] = p_t - frames[-1, :3, 3]
+        err[3:] = matrix_to_rotvec(R_t @ frames[-1, :3, :3].T)
+        return q, bool(err @ err < tol * tol)
@@ -0,0 +1,63 @@
+# bestman/robots/sim/sim_config.py
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+from ..config import RobotConfig
+
+# 默认 DH 参数（标准 DH，UR5 尺寸）：每行 [d, a, alpha]，单位 米 / 弧度
+DEFAULT_DH = [
+    [0.089159, 0.0, np.pi / 2],
+    [0.0, -0.425, 0.0],
+    [0.0, -0.39225, 0.0],
+    [0.10915, 0.0, np.pi / 2],
+    [0.09465, 0.0, -np.pi / 2],
+    [0.0823, 0.0, 0.0],
+]
+DEFAULT_HOME = [0.0, -np.pi / 2, np.pi / 2, -np.pi / 2, -np.pi / 2, 0.0]
+
+
+@RobotConfig.register_subclass("sim")
+@dataclass(kw_only=True)
+class SimConfig(RobotConfig):
+    """
+    运动学仿真机器人配置，无需硬件与厂商 SDK
+    通过 draccus 自动注册为 type='sim'
+
+    单位与 BaseRobot 接口约定一致：关节角 弧度，位置 米，姿态 弧度。
+    """
+    # ========== 运动学 ==========
+    dof: int = 6
+    dh_params: List[List[float]] = field(default_factory=lambda: [list(row) for row in DEFAULT_DH])
+    joint_limits: Optional[List[List[float]]] = None      # [[lower, upper], ...]，默认 ±2π
+    initial_joints: Optional[List[float]] = None          # None：6 轴用默认 home，其余全零
+
+    # ========== 一阶跟踪动力学 ==========
+    time_constant: float = 0.05        # 关节跟踪时间常数（秒）
+    max_joint_velocity: float = 3.0    # 关节速度上限（rad/s）
+    gripper_time_constant: float = 0.1
+    settle_tolerance: float = 1e-4     # wait=True 时判定到位的关节误差（rad）
+    move_timeout: float = 30.0         # wait=True 的最长等待（仿真时间，秒）
+
+    # ========== 通信模型（仿真时间，秒） ==========
+    command_latency: float = 0.0       # 指令从下发到生效的延迟
+    jitter: float = 0.0                # 延迟抖动（正态分布标准差，截断为非负）
+    call_duration: float = 0.0         # 每次 SDK 调用阻塞的时长
+    seed: Optional[int] = None
+
+    # ========== 时钟 ==========
+    time_scale: float = 1.0            # 仿真时间 / 墙上时间，>1 为快于实时
+    manual_clock: bool = False         # True：仿真时间只随 step() 与阻塞调用推进，可任意快
+
+    def __post_init__(self):
+        if self.dh_params is not None and len(self.dh_params) != self.dof:
+            raise ValueError(f"dh_params needs {self.dof} rows [d, a, alpha], got {len(self.dh_params)}")
+        if self.joint_limits is not None and len(self.joint_limits) != self.dof:
+            raise ValueError(f"joint_limits needs {self.dof} rows [lower, upper], got {len(self.joint_limits)}")
+        if self.time_constant <= 0 or self.time_scale <= 0:
+            raise ValueError("time_constant and time_scale must be positive")
+        if self.initial_joints is None:
+            # 仿真需要确定的初始关节角：6 轴用默认 home，其余全零
+            self.initial_joints = list(DEFAULT_HOME) if self.dof == len(DEFAULT_HOME) else [0.0] * self.dof
+        super().__post_init__()
@@ -1,3 +1,13 @@
-from .startouch_config import StartouchConfig
-from .bestman_startouch import BestmanStartouch
+"""
+Startouch backend. Importing the package only loads the config; the driver (and SDK) on first use.
+Startouch 后端：导入包只加载配置类，驱动与 SDK 在首次访问时导入。
+"""
 from ..config import RobotConfig
+from ..registry import lazy_exports
+from .startouch_config import StartouchConfig
+
+__all__ = ["RobotConfig", "StartouchConfig", "BestmanStartouch"]
+
+__getattr__ = lazy_exports(__name__, {
+    "BestmanStartouch": ".bestman_startouch",
+})
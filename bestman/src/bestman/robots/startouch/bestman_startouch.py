@@ -10,6 +10,7 @@ from scipy.spatial.transform import Rotation as R
 from bestman.robots.base_robot import BaseRobot
 from .startouch_config import StartouchConfig
 from ..factory import register_robot
+from ..observation import ObservationBuffer, state_observation_features
 
 try:
     from startouch_python_sdk import StartouchArm
@@ -35,10 +36,11 @@ class BestmanStartouch(BaseRobot):
         self.config: StartouchConfig = config
         self.arm: None
         self.cameras = {}
+        self._observation: Optional[ObservationBuffer] = None
 
     @property
     def observation_features(self) -> Dict[str, Any]:
-        pass
+        return state_observation_features(self.config.dof)
 
     def connect(self) -> None:
         """
@@ -55,10 +57,27 @@ class BestmanStartouch(BaseRobot):
         安全断开连接
         """
         if self.arm:
-            self.arm.cleanup()
+            with self.sdk_lock:
+                self.arm.cleanup()
 
-    def get_observation(self) -> Dict[str, Any]:
-        pass
+    def get_observation(self, copy: bool = False) -> Dict[str, Any]:
+        """
+        Fill the preallocated observation buffers and return them.
+        原地填充预分配的观测数组并返回（copy=True 时返回副本）。
+
+        SDK 返回的数组直接复制进缓冲区，不经过返回列表的 get_* 接口。
+        """
+        if self._observation is None:
+            self._observation = ObservationBuffer(self.observation_features, dtype=np.float32)
+        obs = self._observation.arrays
+        with self.sdk_lock:
+            np.copyto(obs["joint_pos"], self.arm.get_joint_positions(), casting="unsafe")
+            np.copyto(obs["joint_vel"], self.arm.get_joint_velocities(), casting="unsafe")
+            pos, rpy = self.arm.get_ee_pose_euler()
+            obs["eef_pos"][:3] = pos
+            obs["eef_pos"][3:] = rpy
+            self._observation.fill("gripper_pos", self.arm.get_gripper_position())
+        return self._observation.get(copy)
 
     def action_features(self) -> Dict[str, Any]:
         """
@@ -96,7 +115,8 @@ class BestmanStartouch(BaseRobot):
     
     def go_home(self):
         if hasattr(self,"initial_joints"):
-            self.arm.set_joint(self.config.initial_joints, tf=1.0)
+            with self.sdk_lock:
+                self.arm.set_joint(self.config.initial_joints, tf=1.0)
         else:
             self.go_home()
     def move_to_joint_positions(
@@ -113,7 +133,8 @@ class BestmanStartouch(BaseRobot):
             blocking: 是否阻塞等待执行完成
             is_radian: 是否使用弧度制
         """
-        self.arm.set_joint(joint_positions)
+        with self.sdk_lock:
+            self.arm.set_joint(joint_positions)
 
     def move_to_ee_pose(
         self,
@@ -133,7 +154,8 @@ class BestmanStartouch(BaseRobot):
             raise ValueError(f"pose must be shape (6,), got {pose.shape}")
         position = pose[:3]
         rpy = pose[3:]
-        self.arm.set_end_effector_pose_euler(position,rpy)
+        with self.sdk_lock:
+            self.arm.set_end_effector_pose_euler(position,rpy)
 
     def move_to_ee_pose_rpy(
         self,
@@ -153,7 +175,8 @@ class BestmanStartouch(BaseRobot):
         if (position.shape != (3,)) or (rpy.shape != (3,)):
             raise ValueError(f"position and position must be shape (3,), position.shape : {position.shape}, rpy.shape : {rpy.shape}")
         
-        self.arm.set_end_effector_pose_euler(position,rpy)
+        with self.sdk_lock:
+            self.arm.set_end_effector_pose_euler(position,rpy)
     
     def move_to_ee_pose_quat(
         self,
@@ -168,7 +191,8 @@ class BestmanStartouch(BaseRobot):
         if orientation.shape != (4,):
             raise ValueError(f"orientation must be shape (4,), position.shape : {orientation.shape}")
         
-        self.arm.set_end_effector_pose_quat(position,orientation)
+        with self.sdk_lock:
+            self.arm.set_end_effector_pose_quat(position,orientation)
 
     def servo_to_joint_positions(
         self,
@@ -186,7 +210,8 @@ class BestmanStartouch(BaseRobot):
         #     raise ValueError(f"pose must be shape (6,), got {pose.shape}")
         position = pose[:3]
         rpy = pose[3:]
-        self.arm.set_end_effector_pose_euler_raw(position,rpy)
+        with self.sdk_lock:
+            self.arm.set_end_effector_pose_euler_raw(position,rpy)
 
     def servo_to_ee_pose_rpy(
         self,
@@ -209,7 +234,8 @@ class BestmanStartouch(BaseRobot):
         Args:
             command: 夹爪指令（0.0~1.0 或具体单位，取决于 GripperInterface 实现）
         """
-        self.arm.setGripperPosition_raw(command)
+        with self.sdk_lock:
+            self.arm.setGripperPosition_raw(command)
         
 
     def get_joint_positions(self) -> List[float]:
@@ -220,7 +246,8 @@ class BestmanStartouch(BaseRobot):
         Returns:
             (N,) List in radians
         """
-        return self.arm.get_joint_positions().tolist()
+        with self.sdk_lock:
+            return self.arm.get_joint_positions().tolist()
 
     def get_joint_velocities(self) -> List[float]:
         """
@@ -230,7 +257,8 @@ class BestmanStartouch(BaseRobot):
         Returns:
             (N,) List in rad/s 
         """
-        return self.arm.get_joint_velocities().tolist()
+        with self.sdk_lock:
+            return self.arm.get_joint_velocities().tolist()
 
    
     def get_ee_pose(self) -> Tuple[np.ndarray, np.ndarray]:
@@ -242,7 +270,8 @@ class BestmanStartouch(BaseRobot):
             position: (3,) in meters / 位置：(3,) 米
             orientation: (3,) quaternion [roll, pitch, yaw](degree)角度
         """
-        pos,rpy = self.arm.get_ee_pose_euler()
+        with self.sdk_lock:
+            pos,rpy = self.arm.get_ee_pose_euler()
         return list(pos)+list(rpy)
     
     def get_ee_velocity(self) -> Tuple[np.ndarray, np.ndarray]:
@@ -266,7 +295,8 @@ class BestmanStartouch(BaseRobot):
             or physical value (e.g., mm) — consistent per robot model.
             归一化值 [0.0, 1.0]（0=开，1=关），或物理单位（如 mm）——每种机器人保持一致。
         """
-        return self.arm.get_gripper_position()
+        with self.sdk_lock:
+            return self.arm.get_gripper_position()
 
     def __getattr__(self, name):
         pass
@@ -6,11 +6,6 @@ import draccus
 
 from ..config import RobotConfig  
 
-try:
-    from bestman.camera.config import CameraConfig
-    from bestman.gripper.config import GripperConfig  
-except ImportError as e:
-    print("CameraConfig GripperConfig not implemented yes")
 
 @RobotConfig.register_subclass("startouch")
 @dataclass(kw_only=True)
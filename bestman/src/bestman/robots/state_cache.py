@@ -0,0 +1,162 @@
+"""
+Background state polling with immutable, timestamped snapshots.
+后台状态轮询：按固定频率读取驱动状态，发布不可变、带时间戳的快照。
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from .hooks import add_method_hook, original_method, remove_hooks
+
+# 被缓存的读取接口 -> RobotState 字段
+STATE_GETTERS = {
+    "get_joint_positions": "joint_positions",
+    "get_joint_velocities": "joint_velocities",
+    "get_ee_pose": "ee_pose",
+    "get_gripper_position": "gripper_position",
+}
+_HOOK_KEY = "state_cache"
+
+
+def _readonly(value):
+    if value is None:
+        return None
+    if np.isscalar(value):
+        return float(value)
+    arr = np.array(value, dtype=float)
+    arr.setflags(write=False)
+    return arr
+
+
+@dataclass(frozen=True)
+class RobotState:
+    """
+    Immutable snapshot of the robot state; arrays are read-only.
+    机器人状态的不可变快照（数组只读）；驱动未实现的字段为 None。
+    """
+    timestamp: float                              # time.perf_counter() 时刻（读取完成时）
+    seq: int                                      # 轮询序号
+    joint_positions: Optional[np.ndarray] = None
+    joint_velocities: Optional[np.ndarray] = None
+    ee_pose: Optional[np.ndarray] = None          # [x, y, z, roll, pitch, yaw]
+    gripper_position: Optional[float] = None
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was taken. / 快照距今的秒数。"""
+        return time.perf_counter() - self.timestamp
+
+
+def read_state(getters: Dict[str, Callable], seq: int = 0) -> RobotState:
+    '''
+    call every getter once and build a snapshot; NotImplementedError -> None
+    依次调用各读取接口生成快照；未实现的接口记为 None
+    '''
+    values = {}
+    for field_name, getter in getters.items():
+        try:
+            values[field_name] = _readonly(getter())
+        except NotImplementedError:
+            values[field_name] = None
+    return RobotState(timestamp=time.perf_counter(), seq=seq, **values)
+
+
+class StateCache:
+    """
+    Poll a robot on a background thread and publish the latest `RobotState`.
+    在后台线程中轮询机器人状态并发布最新快照。
+
+    启动后机器人实例上的 get_joint_positions / get_joint_velocities / get_ee_pose /
+    get_gripper_position 被替换为 O(1) 读取最新快照，不再访问 SDK；stop() 后恢复。
+    读取快照无需加锁（快照整体替换，单次引用赋值是原子的）。
+
+    Note:
+        Each poll holds `robot.sdk_lock`; drivers hold the same lock around every SDK call.
+        轮询线程与控制线程会并发访问 SDK：每次轮询都持有 robot.sdk_lock（每个机器人一把可重入锁），
+        内置驱动（xArm / Startouch）的每次 SDK 调用也持有该锁；第三方驱动应同样处理。
+
+    Example:
+        robot.start_state_cache(rate_hz=200)
+        state = robot.get_state()        # RobotState
+        q = robot.get_joint_positions()  # 同一份快照数据
+        robot.stop_state_cache()
+    """
+
+    def __init__(self, robot, rate_hz: float = 100.0):
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+        self.robot = robot
+        self.period = 1.0 / rate_hz
+        self.errors = 0                 # 轮询失败次数（保留上一份快照）
+        self.last_error: Optional[BaseException] = None
+        # 直接读 SDK 的原始方法，不经过实例上的钩子
+        self._getters = {
+            field_name: original_method(robot, name) for name, field_name in STATE_GETTERS.items()
+            if callable(getattr(type(robot), name, None))
+        }
+        self._lock = getattr(robot, "sdk_lock", None) or threading.RLock()
+        self._state: Optional[RobotState] = None
+        self._seq = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def state(self) -> Optional[RobotState]:
+        """Latest snapshot. / 最新快照。"""
+        return self._state
+
+    def poll(self) -> RobotState:
+        """Read the robot once and publish the snapshot. / 读取一次并发布快照。"""
+        self._seq += 1
+        with self._lock:
+            state = read_state(self._getters, self._seq)
+        self._state = state
+        return self._state
+
+    def start(self) -> "StateCache":
+        if self.running:
+            return self
+        self.poll()   # 先同步读取一次，保证启动后立即有快照
+        for name, field_name in STATE_GETTERS.items():
+            if field_name in self._getters:
+                add_method_hook(self.robot, name, _HOOK_KEY, self._cached_getter(field_name), order=0)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="bestman-state-cache", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        remove_hooks(self.robot, _HOOK_KEY)
+
+    def _cached_getter(self, field_name: str):
+        def factory(_inner):
+            def getter():
+                return getattr(self._state, field_name)
+            return getter
+        return factory
+
+    def _run(self) -> None:
+        next_poll = time.perf_counter() + self.period
+        while not self._stop.is_set():
+            delay = next_poll - time.perf_counter()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            try:
+                self.poll()
+            except Exception as e:
+                self.errors += 1
+                self.last_error = e
+            # 读取过慢时不补偿累积的周期，直接从当前时刻重新计时
+            next_poll = max(next_poll + self.period, time.perf_counter())
@@ -1,6 +1,6 @@
+from bestman.utils.conversions import euler_to_quat, quat_to_euler, quat_to_matrix
+
 
-from scipy.spatial.transform import Rotation as R
-import numpy as np
 # from rawbestman
 def compensate_tcp_for_gripper(x, y, z, quaternion, distance):
     """
@@ -17,11 +17,9 @@ def compensate_tcp_for_gripper(x, y, z, quaternion, distance):
     Returns:
         新的 (x, y, z, quaternion)
     """
-    rotation = R.from_quat(quaternion)
-    rotation_matrix = rotation.as_matrix()
+    rotation_matrix = quat_to_matrix(quaternion)
     z_axis = rotation_matrix[:, 2]        # 局部Z轴方向（朝向物体）
-    new_position = np.array([x, y, z]) - distance * z_axis
-    return new_position[0], new_position[1], new_position[2], quaternion
+    return x - distance * z_axis[0], y - distance * z_axis[1], z - distance * z_axis[2], quaternion
 
 
 def pose_to_euler(pose):
@@ -35,8 +33,7 @@ def pose_to_euler(pose):
     tuple: (x, y, z, roll, pitch, yaw) where (x, y, z) is the position and (roll, pitch, yaw) are the Euler angles in radians.
     '''
     x, y, z, qw, qx, qy, qz = pose
-    r = R.from_quat([qx, qy, qz, qw])  # Reordering to match scipy's [qx, qy, qz, qw]
-    roll, pitch, yaw = r.as_euler('xyz', degrees=False)
+    roll, pitch, yaw = quat_to_euler([qx, qy, qz, qw]).tolist()  # Reordering to [qx, qy, qz, qw]
     return [x, y, z, roll, pitch, yaw]
 
 def euler_to_pose(self, position_euler):
@@ -50,7 +47,6 @@ def euler_to_pose(self, position_euler):
     list: [x, y, z, qw, qx, qy, qz]
     '''
     x, y, z, roll, pitch, yaw = position_euler
-    r = R.from_euler('xyz', [roll, pitch, yaw], degrees=False)
-    qx, qy, qz, qw = r.as_quat()  # Getting [qx, qy, qz, qw] from scipy
+    qx, qy, qz, qw = euler_to_quat([roll, pitch, yaw]).tolist()  # Getting [qx, qy, qz, qw]
     return [x, y, z, qw, qx, qy, qz]  # Reordering to match [qw, qx, qy, qz]
     
\ No newline at end of file
@@ -1,3 +1,15 @@
+"""
+xArm backend. Importing the package only loads the config; the driver is imported on first use.
+xArm 后端：导入包只加载配置类，驱动在首次访问时导入。
+"""
+from ..config import RobotConfig
+from ..registry import lazy_exports
 from .xarm_config import XArmConfig
-from .bestman_xarm import BestmanXarm
-from ..config import RobotConfig
\ No newline at end of file
+
+__all__ = ["RobotConfig", "XArmConfig", "BestmanXarm", "XArmServoSession", "FakeXArmAPI"]
+
+__getattr__ = lazy_exports(__name__, {
+    "BestmanXarm": ".bestman_xarm",
+    "XArmServoSession": ".servo_session",
+    "FakeXArmAPI": ".fake_xarm",
+})
@@ -1,4 +1,5 @@
 # bestman/robots/xarm6.py
+import time
 from typing import Any, Dict, Optional, Union, Tuple,List
 
 import numpy as np
@@ -6,14 +7,27 @@ import numpy as np
 from bestman.robots.base_robot import BaseRobot
 from .xarm_config import XArmConfig
 from ..factory import register_robot
+from ..observation import ObservationBuffer, state_observation_features
+from .servo_session import XArmServoSession
+from .fake_xarm import FakeXArmAPI
+
+# SDK 位姿 [mm, mm, mm, roll, pitch, yaw] -> [m, m, m, roll, pitch, yaw]
+_EE_POSE_SCALE = np.array([1e-3, 1e-3, 1e-3, 1.0, 1.0, 1.0])
+
+
+def _controller_class(backend: str):
+    '''resolve the XArmAPI class for config.backend; the SDK is only imported when it is used'''
+    if backend == "fake":
+        return FakeXArmAPI
+    try:
+        from xarm.wrapper import XArmAPI
+    except ImportError as e:
+        raise ImportError(
+            "XArm SDK not installed. Please install via: "
+            "pip install bestman[xarm]  (or use XArmConfig(backend='fake') without hardware)"
+        ) from e
+    return XArmAPI
 
-try:
-    from xarm.wrapper import XArmAPI
-except ImportError:
-    raise ImportError(
-        "XArm SDK not installed. Please install via: "
-        "pip install bestman[xarm]"
-    )
 
 @register_robot(XArmConfig)
 class BestmanXarm(BaseRobot):
@@ -29,35 +43,29 @@ class BestmanXarm(BaseRobot):
     def __init__(self, config: XArmConfig):
         super().__init__(config)
         self.config: XArmConfig = config
-        self.arm: Optional[XArmAPI] = None
+        self.arm = None    # XArmAPI 或 FakeXArmAPI，connect() 时创建
         self.cameras = {}
+        self._observation: Optional[ObservationBuffer] = None
 
     @property
     def observation_features(self) -> Dict[str, Any]:
-        pass
-        # obs = {
-        #     "joint_pos": (self.config.dof,),
-        #     "joint_vel": (self.config.dof,),
-        #     "eef_pos": (6,),#x,y,z,roll,pitch,yaw
-        #     "eef_vel": (6,),#vx,vy,vz,vr,vp,vy
-        #     "gripper_pos": float,
-        # }
-        # for cam_name in self.config.cameras:
-        #     cam_cfg = self.config.cameras[cam_name]
-        #     obs[f"image_{cam_name}"] = (cam_cfg.height, cam_cfg.width, 3)
-        # return obs
+        # 角度单位与 get_joint_positions / get_ee_pose 一致（SDK 默认 is_radian=False，即度）
+        return state_observation_features(self.config.dof)
 
     def connect(self) -> None:
         sdk_kwargs = self.config.sdk_kwargs.copy()
+        if self.config.backend == "fake":
+            sdk_kwargs.update(dof=self.config.dof, **self.config.fake_kwargs)
 
-        self.arm = XArmAPI(**sdk_kwargs)
+        self.arm = _controller_class(self.config.backend)(**sdk_kwargs)
         try:
-            self.arm.clean_warn()
-            self.arm.clean_error()
-            if hasattr(self.config,"tcp_offset") and self.config.tcp_offset is not None:
-                self.arm.set_tcp_offset(self.config.tcp_offset,wait=True)
-            self.arm.motion_enable(True)
-            self.arm.set_mode(0)    #速度位置模式
+            with self.sdk_lock:
+                self.arm.clean_warn()
+                self.arm.clean_error()
+                if hasattr(self.config,"tcp_offset") and self.config.tcp_offset is not None:
+                    self.arm.set_tcp_offset(self.config.tcp_offset,wait=True)
+                self.arm.motion_enable(True)
+                self.arm.set_mode(0)    #速度位置模式
         except Exception as e:
             if self.arm:
                 self.arm.disconnect()
@@ -85,28 +93,25 @@ class BestmanXarm(BaseRobot):
             cam.release()
         print(f"[{self.config.id or 'xarm6'}] Disconnected.")
 
-    def get_observation(self) -> Dict[str, Any]:
-        pass
-        # angles = self.arm.get_servo_angle()[1]
-        # velocities = self.arm.get_joint_states()[1][1]
-        # gripper_pos = self.gripper.get_position() if self.gripper else 0.0
-
-        # obs = {
-        #     "joint_positions": np.array(angles[: self.config.dof], dtype=np.float32),
-        #     "joint_velocities": np.array(velocities[: self.config.dof], dtype=np.float32),
-        #     "gripper_position": float(gripper_pos),
-        # }
-
-        # for name, cam in self.cameras.items():
-        #     ret, frame = cam.read()
-        #     if ret:
-        #         obs[f"image_{name}"] = frame[..., ::-1]  # BGR -> RGB
-        #     else:
-        #         cfg = self.config.cameras[name]
-        #         obs[f"image_{name}"] = np.zeros(
-        #             (cfg.height, cfg.width, 3), dtype=np.uint8
-        #         )
-        # return obs
+    def get_observation(self, copy: bool = False) -> Dict[str, Any]:
+        """
+        Fill the preallocated observation buffers and return them.
+        原地填充预分配的观测数组并返回（copy=True 时返回副本）。
+
+        直接把 SDK 上报线程缓存的 angles / realtime_joint_speeds / position 写入缓冲区，
+        不经过 get_* 接口，也不切片或分配中间列表。
+        """
+        if self._observation is None:
+            self._observation = ObservationBuffer(self.observation_features, dtype=np.float32)
+        buffer = self._observation
+        obs = buffer.arrays
+        with self.sdk_lock:
+            buffer.fill_head("joint_pos", self.arm.angles)
+            buffer.fill_head("joint_vel", self.arm.realtime_joint_speeds)
+            np.multiply(self.arm.position, _EE_POSE_SCALE, out=obs["eef_pos"], casting="unsafe")
+        buffer.fill("gripper_pos", self.get_gripper_position())
+        return buffer.get(copy)
+
     def action_features(self) -> Dict[str, Any]:
         """
         Declare the structure of action commands.
@@ -135,13 +140,38 @@ class BestmanXarm(BaseRobot):
         Notes:
             https://github.com/xArm-Developer/xArm-Python-SDK/blob/master/doc/api/xarm_api.md#mode
         '''
-        self.arm.set_mode(mode)
-        # self.arm.motion_enable(True)
-        self.arm.set_state(0)#每次更换机械臂运动模式都要切换机械臂运动状态
+        with self.sdk_lock:
+            self.arm.set_mode(mode)
+            # self.arm.motion_enable(True)
+            self.arm.set_state(0)#每次更换机械臂运动模式都要切换机械臂运动状态
 
     @property
     def mode(self):
         return self.arm.mode
+
+    def is_moving(self) -> bool:
+        with self.sdk_lock:
+            return bool(self.arm.get_is_moving())
+
+    def stop_motion(self) -> None:
+        """停止当前运动（state 4 清空运动队列），再恢复为可运动状态"""
+        with self.sdk_lock:
+            self.arm.set_state(4)
+            self.arm.set_state(0)
+
+    def _wait_motion(self, start_grace: float = 0.2, poll_interval: float = 0.01) -> None:
+        '''
+        wait for a motion sent with wait=False; sdk_lock is only held per is_moving() query
+        等待以 wait=False 下发的运动结束：只在每次查询时持锁，运动期间状态轮询与 stop_motion 不被阻塞
+        '''
+        t0 = time.perf_counter()
+        started = False
+        while True:
+            if self.is_moving():
+                started = True
+            elif started or time.perf_counter() - t0 > start_grace:
+                return
+            time.sleep(poll_interval)
     
     def go_home(self):
         self.set_mode(0)
@@ -168,14 +198,17 @@ class BestmanXarm(BaseRobot):
             self.set_mode(0)
         if len(joint_positions) != self.config.dof:
             raise ValueError(
-                f"Expected joint_positions shape ({self.config.dof},), got {joint_positions.shape}"
+                f"Expected joint_positions shape ({self.config.dof},), got length {len(joint_positions)}"
+            )
+        with self.sdk_lock:
+            code = self.arm.set_servo_angle(
+                angle=joint_positions,
+                is_radian=is_radian,
+                wait=False,
             )
-        code = self.arm.set_servo_angle(
-            angle=joint_positions,
-            is_radian=is_radian,
-            wait=wait,
-        )
-        return code == 0  
+        if wait and code == 0:
+            self._wait_motion()
+        return code == 0
 
     def move_to_ee_pose(
         self,
@@ -194,14 +227,17 @@ class BestmanXarm(BaseRobot):
         if self.mode != 0:
             self.set_mode(0)
         if len(pose) != 6:
-            raise ValueError(f"pose must be (3,), got {pose.shape}")
-
-        code = self.arm.set_position(
-            x = pose[0]*1000, y = pose[1]*1000, z = pose[2]*1000,
-            roll = pose[3], pitch = pose[4], yaw = pose[5],
-            is_radian=is_radian,
-            wait=wait,
-        )
+            raise ValueError(f"pose must be (6,), got length {len(pose)}")
+
+        with self.sdk_lock:
+            code = self.arm.set_position(
+                x = pose[0]*1000, y = pose[1]*1000, z = pose[2]*1000,
+                roll = pose[3], pitch = pose[4], yaw = pose[5],
+                is_radian=is_radian,
+                wait=False,
+            )
+        if wait and code == 0:
+            self._wait_motion()
         return code == 0
 
     def move_to_ee_pose_rpy(
@@ -223,17 +259,20 @@ class BestmanXarm(BaseRobot):
             self.set_mode(0)
 
         if len(position) != 3:
-            raise ValueError(f"position must be (3,), got {position.shape}")
+            raise ValueError(f"position must be (3,), got length {len(position)}")
         if len(rpy) != 3:
-            raise ValueError(f"rpy must be (3,) , got {rpy.shape}")
+            raise ValueError(f"rpy must be (3,), got length {len(rpy)}")
 
         
-        code = self.arm.set_position(
-            x = position[0]*1000, y = position[1]*1000, z = position[2]*1000,
-            roll = rpy[0], pitch = rpy[1], yaw = rpy[2],
-            is_radian=is_radian,
-            wait=wait,
-        )
+        with self.sdk_lock:
+            code = self.arm.set_position(
+                x = position[0]*1000, y = position[1]*1000, z = position[2]*1000,
+                roll = rpy[0], pitch = rpy[1], yaw = rpy[2],
+                is_radian=is_radian,
+                wait=False,
+            )
+        if wait and code == 0:
+            self._wait_motion()
         return code == 0
     
     def move_to_ee_pose_quat(
@@ -253,7 +292,8 @@ class BestmanXarm(BaseRobot):
         if self.mode != 1:
             raise ValueError(f"current mode:{self.mode}, call set_mode(1) first")
             # self.arm.set_mode(1)
-        return self.arm.set_servo_angle_j(angles=joint_positions,is_radian=False) == 0
+        with self.sdk_lock:
+            return self.arm.set_servo_angle_j(angles=joint_positions,is_radian=False) == 0
     
     def servo_to_ee_pose(
         self,
@@ -263,8 +303,21 @@ class BestmanXarm(BaseRobot):
         if self.mode != 1:
             raise ValueError(f"current mode:{self.mode}, call set_mode(1) first")
             
-        self.arm.set_servo_cartesian(mvpose=pose,is_radian=False)
+        with self.sdk_lock:
+            return self.arm.set_servo_cartesian(mvpose=pose,is_radian=False) == 0
     
+    def servo_session(self, target: str = "ee_pose", is_radian: bool = False, meters: bool = False) -> XArmServoSession:
+        """
+        Validated servo session for high-rate streaming (see XArmServoSession).
+        高频伺服会话：进入时切换一次模式并检查，send() 直接调用 SDK，适合 200 Hz 以上的循环。
+
+        Example:
+            with robot.servo_session("joint_positions") as servo:
+                for q in joint_traj:
+                    servo.send(q)
+        """
+        return XArmServoSession(self, target, is_radian=is_radian, meters=meters)
+
     def servo_to_ee_pose_rpy(
         self,
         position: Union[list, np.ndarray],
@@ -289,7 +342,8 @@ class BestmanXarm(BaseRobot):
         if self.gripper is None:
             raise RuntimeError("Gripper not initialized")
         try:
-            self.gripper.move(command)
+            with self.sdk_lock:
+                self.gripper.move(command)
             return True
         except Exception as e:
             print(f"Gripper error: {e}")
@@ -302,9 +356,18 @@ class BestmanXarm(BaseRobot):
         获取当前关节角。
 
         Returns:
-            (N,) List in radians
+            (N,) List in the SDK angle unit: degrees unless sdk_kwargs sets is_radian=True,
+            the same unit move_to_joint_positions / servo_to_joint_positions expect by default
+            (N,) 列表，单位与 SDK 一致：默认为度（sdk_kwargs 中 is_radian=True 时为弧度），
+            与 move_to_joint_positions / servo_to_joint_positions 的默认输入单位相同
+
+        Note:
+            Reads the `angles` cached by the SDK report thread. Earlier versions called
+            get_servo_angles(), which costs a controller round trip and returns a (code, angles) tuple.
+            读取 SDK 上报线程缓存的 angles；旧版本调用 get_servo_angles()（一次控制器往返，返回 (code, angles) 元组）。
         """
-        return self.arm.get_servo_angles()
+        with self.sdk_lock:
+            return self.arm.angles[:self.config.dof]
 
     def get_joint_velocities(self) -> List[float]:
         """
@@ -314,21 +377,26 @@ class BestmanXarm(BaseRobot):
         Returns:
             (N,) List in rad/s 
         """
-        return self.arm.realtime_joint_speeds
+        with self.sdk_lock:
+            return self.arm.realtime_joint_speeds[:self.config.dof]
 
    
-    def get_ee_pose(self) -> Tuple[np.ndarray, np.ndarray]:
+    def get_ee_pose(self) -> np.ndarray:
         """
         Get current end-effector pose in base coordinate frame.
         获取基坐标系下的当前末端执行器位姿。
 
         Returns:
-            position: (3,) in meters / 位置：(3,) 米
-            rpy: (3,) 
+            (6,) [x, y, z, roll, pitch, yaw], position in meters, orientation in the SDK angle unit (degrees by default)
+            位置单位：米；姿态单位与 SDK 一致（默认为度）
+
+        Note:
+            Returns a new ndarray (BaseRobot contract). Earlier versions returned the SDK's own
+            `position` list after converting it to meters in place.
+            返回新的 ndarray；旧版本返回原地换算为米的 SDK position 列表（会改写 SDK 内部数据）。
         """
-        position = self.arm.position    
-        position[:3] = [x/1000 for x in position[:3]]
-        return position
+        with self.sdk_lock:
+            return np.multiply(self.arm.position, _EE_POSE_SCALE)    # 新数组，不修改 SDK 内部的列表
 
     
     def get_ee_velocity(self) -> Tuple[np.ndarray, np.ndarray]:
@@ -0,0 +1,169 @@
+"""
+In-process stand-in for `xarm.wrapper.XArmAPI` with modelled response latency.
+进程内的假 xArm 控制器：接口与 XArmAPI 一致，每次调用按配置的响应延迟阻塞，
+用于在没有机械臂的机器上端到端基准测试 BestmanXarm（connect 流程、模式切换、伺服吞吐）。
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+SERVO_MODE = 1
+
+
+class FakeXArmAPI:
+    """
+    Fake xArm controller implementing the subset of XArmAPI used by BestmanXarm.
+    实现 BestmanXarm 用到的 XArmAPI 子集。
+
+    时间模型 / Timing model:
+    - 方法调用（set_* / clean_* / motion_enable / get_is_moving ...）模拟一次控制器往返，
+      阻塞 `latency + |N(0, jitter)|` 秒
+    - set_mode 额外阻塞 `mode_switch_time`；set_tcp_offset(wait=True) 额外阻塞 `settle_time`
+    - 规划运动（set_servo_angle / set_position）持续 `motion_time`，期间 get_is_moving() 为 True，
+      wait=True 时阻塞到运动结束
+    - 属性（mode / state / angles / position / realtime_joint_speeds）与真实 SDK 一样读取
+      上报线程的缓存，不产生延迟
+
+    运动学不做建模：关节指令只更新 angles，笛卡尔指令只更新 position
+    （需要一致的运动学请使用 `bestman.robots.sim`）。伺服指令在 mode != 1 时返回错误码 1。
+
+    Example:
+        config = XArmConfig(backend="fake", fake_kwargs={"latency": 0.002}, initial_joints=[0.0] * 7, dof=7)
+        with make_robot_from_config(config) as robot:
+            ...
+            print(robot.arm.call_counts)
+    """
+
+    def __init__(
+        self,
+        port: Optional[str] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        mode_switch_time: float = 0.0,
+        settle_time: float = 0.0,
+        motion_time: float = 0.0,
+        dof: int = 7,
+        seed: Optional[int] = None,
+        **kwargs,
+    ):
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.mode_switch_time = mode_switch_time
+        self.settle_time = settle_time
+        self.motion_time = motion_time
+        self.connected = True
+        self.call_counts: Dict[str, int] = {}
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+
+        self.mode = 0
+        self.state = 0
+        self.error_code = 0
+        self.warn_code = 0
+        self.tcp_offset = [0.0] * 6
+        self.angles = [0.0] * 7            # 度（真实 SDK 的 angles 固定为 7 维）
+        self.position = [0.0] * 6          # mm + 度
+        self.realtime_joint_speeds = [0.0] * 7
+        self._dof = dof
+        self._motion_end = 0.0
+
+    # ======== 往返延迟 ========
+    def _rpc(self, name: str, extra: float = 0.0) -> None:
+        if not self.connected:
+            raise ConnectionError("fake xArm is disconnected")
+        with self._lock:
+            self.call_counts[name] = self.call_counts.get(name, 0) + 1
+            delay = self.latency + extra
+            if self.jitter > 0:
+                delay += abs(self._rng.normal(0.0, self.jitter))
+        if delay > 0:
+            time.sleep(delay)
+
+    def _start_motion(self, wait: bool) -> None:
+        self._motion_end = time.perf_counter() + self.motion_time
+        if wait and self.motion_time > 0:
+            time.sleep(self.motion_time)
+
+    @staticmethod
+    def _degrees(values, is_radian) -> list:
+        values = [float(v) for v in values]
+        return [float(np.rad2deg(v)) for v in values] if is_radian else values
+
+    # ======== 连接与状态 ========
+    def disconnect(self) -> None:
+        self.connected = False
+
+    def clean_warn(self) -> int:
+        self._rpc("clean_warn")
+        self.warn_code = 0
+        return 0
+
+    def clean_error(self) -> int:
+        self._rpc("clean_error")
+        self.error_code = 0
+        return 0
+
+    def motion_enable(self, enable: bool = True, servo_id=None) -> int:
+        self._rpc("motion_enable")
+        return 0
+
+    def set_tcp_offset(self, offset, is_radian=None, wait=True, **kwargs) -> int:
+        self._rpc("set_tcp_offset", self.settle_time if wait else 0.0)
+        self.tcp_offset = list(offset)
+        return 0
+
+    def set_mode(self, mode: int = 0, detection_param=None) -> int:
+        self._rpc("set_mode", self.mode_switch_time)
+        self.mode = mode
+        return 0
+
+    def set_state(self, state: int = 0) -> int:
+        self._rpc("set_state")
+        if state == 4:
+            self._motion_end = 0.0
+        self.state = state
+        return 0
+
+    def get_state(self):
+        self._rpc("get_state")
+        return 0, self.state
+
+    def get_is_moving(self) -> bool:
+        self._rpc("get_is_moving")
+        return time.perf_counter() < self._motion_end
+
+    # ======== 规划运动（模式 0） ========
+    def set_servo_angle(self, servo_id=None, angle=None, speed=None, mvacc=None, mvtime=None,
+                        relative=False, is_radian=None, wait=False, timeout=None, **kwargs) -> int:
+        self._rpc("set_servo_angle")
+        if len(angle) != self._dof:
+            return 1
+        self.angles[:self._dof] = self._degrees(angle, is_radian)
+        self._start_motion(wait)
+        return 0
+
+    def set_position(self, x=None, y=None, z=None, roll=None, pitch=None, yaw=None, radius=None,
+                     speed=None, mvacc=None, mvtime=None, relative=False, is_radian=None,
+                     wait=False, timeout=None, **kwargs) -> int:
+        self._rpc("set_position")
+        self.position = [float(x), float(y), float(z)] + self._degrees((roll, pitch, yaw), is_radian)
+        self._start_motion(wait)
+        return 0
+
+    # ======== 伺服（模式 1） ========
+    def set_servo_angle_j(self, angles, speed=None, mvacc=None, mvtime=None, is_radian=None, **kwargs) -> int:
+        self._rpc("set_servo_angle_j")
+        if self.mode != SERVO_MODE:
+            return 1
+        self.angles[:self._dof] = self._degrees(angles[:self._dof], is_radian)
+        return 0
+
+    def set_servo_cartesian(self, mvpose, speed=None, mvacc=None, mvtime=0, is_radian=None, **kwargs) -> int:
+        self._rpc("set_servo_cartesian")
+        if self.mode != SERVO_MODE:
+            return 1
+        self.position = [float(v) for v in mvpose[:3]] + self._degrees(mvpose[3:6], is_radian)
+        return 0
@@ -0,0 +1,126 @@
+"""
+Validated xArm servo session with a lean send() path.
+xArm 伺服会话：进入时一次性切换模式、检查形状与单位，之后 send() 直接调用 SDK。
+"""
+import time
+from typing import Optional
+
+import numpy as np
+
+SERVO_MODE = 1
+SERVO_TARGETS = ("joint_positions", "ee_pose")
+
+
+class XArmServoSession:
+    """
+    Servo streaming session for `BestmanXarm`.
+    BestmanXarm 的伺服会话。
+
+    与 servo_to_joint_positions / servo_to_ee_pose 不同，会话只在进入时切换一次模式（mode 1）
+    并确定单位；第一次 send() 检查指令长度与数值有效性，之后 send() 不再查询 mode、
+    不做任何检查，直接调用 set_servo_angle_j / set_servo_cartesian（持有 robot.sdk_lock）。
+    退出时恢复进入前的模式。
+
+    Units / 单位:
+        joint_positions: 度（is_radian=True 时为弧度），长度 config.dof
+        ee_pose:         [x, y, z, roll, pitch, yaw]，位置 mm（meters=True 时为米），
+                         姿态度（is_radian=True 时为弧度）
+
+    Example:
+        with XArmServoSession(robot, "ee_pose", meters=True, is_radian=True) as servo:
+            for pose in traj:
+                servo.send(pose)
+    """
+
+    def __init__(
+        self,
+        robot,
+        target: str = "ee_pose",
+        is_radian: bool = False,
+        meters: bool = False,
+        settle: float = 0.1,
+    ):
+        if target not in SERVO_TARGETS:
+            raise ValueError(f"target must be one of {SERVO_TARGETS}, got {target!r}")
+        if meters and target != "ee_pose":
+            raise ValueError("meters=True only applies to target='ee_pose'")
+        self.robot = robot
+        self.target = target
+        self.is_radian = is_radian
+        self.meters = meters
+        self.settle = settle
+        self.size = robot.config.dof if target == "joint_positions" else 6
+        self.sent = 0
+        self.failed = 0                   # SDK 返回非 0 的次数
+        self._previous_mode: Optional[int] = None
+        self._buffer = np.empty(self.size)    # meters=True 时的单位换算缓冲区
+        self._lock = robot.sdk_lock           # 与状态缓存轮询等后台线程串行访问 SDK
+        self._sdk_send = None
+        self.send = self._closed_send
+
+    @property
+    def active(self) -> bool:
+        return self._sdk_send is not None
+
+    def open(self) -> "XArmServoSession":
+        """Switch to servo mode once and bind the SDK call. / 切换一次伺服模式并绑定 SDK 调用。"""
+        arm = self.robot.arm
+        if arm is None:
+            raise ConnectionError("robot is not connected, call connect() first")
+        self._previous_mode = arm.mode
+        if arm.mode != SERVO_MODE:
+            self.robot.set_mode(SERVO_MODE)
+            if self.settle:
+                time.sleep(self.settle)
+        if self.target == "joint_positions":
+            self._sdk_send = arm.set_servo_angle_j
+        else:
+            self._sdk_send = arm.set_servo_cartesian
+        self.send = self._first_send
+        return self
+
+    def close(self) -> None:
+        """Leave the session and restore the previous mode. / 退出会话并恢复进入前的模式。"""
+        if not self.active:
+            return
+        self._sdk_send = None
+        self.send = self._closed_send
+        if self._previous_mode is not None and self._previous_mode != SERVO_MODE:
+            self.robot.set_mode(self._previous_mode)
+
+    def __enter__(self) -> "XArmServoSession":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # ======== send 的三种状态 ========
+    def _closed_send(self, values) -> bool:
+        raise RuntimeError("servo session is not open, use `with XArmServoSession(...)` or call open()")
+
+    def _first_send(self, values) -> bool:
+        '''validate the first command, then switch to the unchecked path'''
+        arr = np.asarray(values, dtype=float)
+        if arr.shape != (self.size,):
+            raise ValueError(f"{self.target} command must have shape ({self.size},), got {arr.shape}")
+        if not np.all(np.isfinite(arr)):
+            raise ValueError(f"{self.target} command contains non-finite values: {arr}")
+        if self.meters and np.any(np.abs(arr[:3]) > 10.0):
+            raise ValueError(f"position {arr[:3]} looks like mm but the session was opened with meters=True")
+        self.send = self._send_meters if self.meters else self._send
+        return self.send(values)
+
+    def _send(self, values) -> bool:
+        with self._lock:
+            code = self._sdk_send(values, is_radian=self.is_radian)
+        if code == 0:
+            self.sent += 1
+            return True
+        self.failed += 1
+        return False
+
+    def _send_meters(self, values) -> bool:
+        buf = self._buffer
+        buf[:] = values
+        buf[:3] *= 1000.0
+        return self._send(buf)
@@ -6,11 +6,9 @@ import draccus
 
 from ..config import RobotConfig  
 
-try:
-    from bestman.camera.config import CameraConfig
-    from bestman.gripper.config import GripperConfig  
-except ImportError as e:
-    print("CameraConfig GripperConfig not implemented yes")
+XARM_BACKENDS = ("sdk", "fake")
+
+
 @RobotConfig.register_subclass("xarm")
 @dataclass(kw_only=True)
 class XArmConfig(RobotConfig):  
@@ -29,6 +27,11 @@ class XArmConfig(RobotConfig):
     # ========== SDK 透传参数 ==========
     sdk_kwargs: Dict[str, Any] = field(default_factory=dict)
 
+    # ========== 控制器后端 ==========
+    # "sdk": xarm-python-sdk 的 XArmAPI；"fake": 进程内的 FakeXArmAPI（无需机械臂与 SDK）
+    backend: str = "sdk"
+    fake_kwargs: Dict[str, Any] = field(default_factory=dict)   # 透传给 FakeXArmAPI（latency 等）
+
     # ========== SDK 必要参数 通信接口检查 ==========
     necessary_kwargs: ClassVar[List[str]] = ["port"]
 
@@ -36,5 +39,9 @@ class XArmConfig(RobotConfig):
     initial_joints: Optional[List[float]] = None
     tcp_offset: Optional[List[float]] = None
     def __post_init__(self):
+        if self.backend not in XARM_BACKENDS:
+            raise ValueError(f"backend must be one of {XARM_BACKENDS}, got {self.backend!r}")
+        if self.backend == "fake":
+            self.sdk_kwargs.setdefault("port", "fake")
         super().__post_init__()
         
\ No newline at end of file
@@ -1,3 +1,26 @@
-from .file_utils import *
-from .utils import load_trajectory,rpy2T,transform_traj
-from .replayer.replayer import TrajReplayer
\ No newline at end of file
+from .batch import load_preprocessed, preprocess_multi_session
+from .file_utils import parse_timestamp_from_name, select_multi_sessions_dir, select_session_subdir
+from .replayer.replayer import TrajReplayer
+from .session_index import SessionIndex, SessionRecord
+from .traj_cache import load_tum
+from .traj_stream import iter_transformed_chunks
+from .transform_tree import TransformTree, make_umi_tree
+from .utils import load_trajectory, rpy2T, transform_traj
+
+__all__ = [
+    "parse_timestamp_from_name",
+    "select_multi_sessions_dir",
+    "select_session_subdir",
+    "load_trajectory",
+    "rpy2T",
+    "transform_traj",
+    "load_tum",
+    "iter_transformed_chunks",
+    "TransformTree",
+    "make_umi_tree",
+    "SessionIndex",
+    "SessionRecord",
+    "preprocess_multi_session",
+    "load_preprocessed",
+    "TrajReplayer",
+]
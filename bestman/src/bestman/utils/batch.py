@@ -0,0 +1,124 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .session_index import CLAMP_REL_PATH, TRAJ_REL_PATH
+from .traj_cache import load_tum
+from .utils import transform_traj
+
+# 预处理结果文件，与 Clamp_Data / Merged_Trajectory 同级
+PREPROCESSED_FILE_NAME = "replay_ready.npz"
+
+
+def preprocessed_path(session_dir) -> Path:
+    return Path(session_dir) / PREPROCESSED_FILE_NAME
+
+
+def preprocess_session(session_dir, T_robot_init, use_cache=True) -> Dict:
+    '''
+    load -> clamp alignment -> map_sensor_to_robot for one session, saved as ready-to-replay arrays
+    单个会话的预处理：读取、夹爪对齐、坐标变换，结果保存为 replay_ready.npz
+    '''
+    session_dir = Path(session_dir)
+    t_start = time.perf_counter()
+    # load_tum directly rather than load_trajectory, so a missing/corrupt file raises its own error
+    # 直接调用 load_tum（load_trajectory 会吞掉异常），让读取失败的真实原因传到进程池结果里
+    raw_clamp = load_tum(session_dir.joinpath(*CLAMP_REL_PATH), use_cache=use_cache)
+    raw_pose = load_tum(session_dir.joinpath(*TRAJ_REL_PATH), use_cache=use_cache)
+    pose_timestamps, raw_pose = raw_pose[:, 0], raw_pose[:, 1:]
+    target_pose, target_clamp_width = transform_traj(raw_pose, raw_clamp, pose_timestamps, T_robot_init)
+
+    out_path = preprocessed_path(session_dir)
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(
+            f,
+            timestamps=np.asarray(pose_timestamps),
+            target_pose=target_pose,
+            clamp_width=target_clamp_width,
+            T_robot_init=np.asarray(T_robot_init, dtype=float),
+        )
+    os.replace(tmp_path, out_path)
+    return {
+        "session": str(session_dir),
+        "n_points": len(target_pose),
+        "seconds": time.perf_counter() - t_start,
+        "output": str(out_path),
+    }
+
+
+def load_preprocessed(session_dir, T_robot_init=None):
+    '''
+    load arrays written by preprocess_session
+    读取预处理结果；若给定 T_robot_init 且与预处理时不一致则报错（机械臂初始位姿已变化）
+
+    Returns:
+        timestamps (N,), target_pose (N,6), clamp_width (N,)
+    '''
+    with np.load(preprocessed_path(session_dir)) as data:
+        if T_robot_init is not None and not np.allclose(data["T_robot_init"], T_robot_init, atol=1e-6):
+            raise ValueError(
+                f"{session_dir} was preprocessed with a different T_robot_init, run preprocessing again"
+            )
+        return data["timestamps"], data["target_pose"], data["clamp_width"]
+
+
+def preprocess_multi_session(
+    multi_session_root,
+    T_robot_init,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    verbose: bool = True,
+) -> List[Dict]:
+    '''
+    preprocess every session_* under a multi_sessions_* directory on a process pool
+    以进程池并行预处理 multi_sessions_*/ 下的全部 session_*（每个进程处理一个会话）
+
+    Args:
+        multi_session_root: multi_sessions_* 目录
+        T_robot_init: (4,4) 机械臂初始位姿（见 rpy2T）
+        workers: 进程数，默认 os.cpu_count()
+    Returns:
+        每个会话的结果字典（session, n_points, seconds, output；失败时为 error）
+    '''
+    root = Path(multi_session_root).expanduser()
+    sessions = sorted(p for p in root.glob("session_*") if p.is_dir())
+    if not sessions:
+        raise FileNotFoundError(f"在 '{root}' 下未找到任何 'session_*' 子目录。")
+
+    T_robot_init = np.asarray(T_robot_init, dtype=float)
+    results = []
+    total_points = 0
+    t_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(preprocess_session, s, T_robot_init, use_cache): s for s in sessions}
+        for i, future in enumerate(as_completed(futures), 1):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"session": str(futures[future]), "error": repr(e)}
+            results.append(result)
+            if "error" in result:
+                if verbose:
+                    print(f"[{i}/{len(sessions)}] {futures[future].name}  ❌ {result['error']}")
+                continue
+            total_points += result["n_points"]
+            if verbose:
+                elapsed = time.perf_counter() - t_start
+                print(
+                    f"[{i}/{len(sessions)}] {futures[future].name}  {result['n_points']} 点  "
+                    f"{result['seconds']:.2f}s  | 累计 {total_points / elapsed:,.0f} 点/秒"
+                )
+
+    if verbose:
+        elapsed = time.perf_counter() - t_start
+        n_ok = sum("error" not in r for r in results)
+        print(
+            f"✅ 完成 {n_ok}/{len(sessions)} 个会话, 共 {total_points} 点, 用时 {elapsed:.2f}s "
+            f"({total_points / max(elapsed, 1e-9):,.0f} 点/秒)"
+        )
+    return sorted(results, key=lambda r: r["session"])
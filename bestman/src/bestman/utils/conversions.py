@@ -0,0 +1,257 @@
+"""
+Closed-form SO(3)/SE(3) conversion kernels.
+闭式旋转/位姿转换核函数，避免在 200 Hz 控制循环里为单个位姿创建 scipy Rotation 对象。
+
+Conventions / 约定:
+    quaternion  [qx, qy, qz, qw]（与 scipy 一致，标量在后）
+    euler       'xyz' 外旋 [roll, pitch, yaw]，弧度，即 R = Rz(yaw) @ Ry(pitch) @ Rx(roll)
+    rotvec      轴角向量 axis * angle，弧度
+
+Every kernel accepts a single value (4,) / (3,) / (3,3) or a batch (N,4) / (N,3) / (N,3,3),
+and writes into `out` when a preallocated buffer is given.
+所有核函数同时支持单个输入与 (N, ...) 批量输入，并可写入预分配的 `out` 缓冲区。
+"""
+import math
+
+import numpy as np
+
+# 接近万向锁时 |sin(pitch)| 的阈值
+_GIMBAL_EPS = 1e-9
+
+
+def _output(out, shape):
+    if out is None:
+        return np.empty(shape)
+    if out.shape != shape:
+        raise ValueError(f"out must have shape {shape}, got {out.shape}")
+    return out
+
+
+# 单个输入走 Python float + math 路径（numpy 标量运算的开销比运算本身还大），
+# 批量输入走 numpy 向量化路径；两条路径共用下面的 *_terms 公式。
+def _quat_to_matrix_terms(x, y, z, w):
+    s = 2.0 / (x * x + y * y + z * z + w * w)
+    xx, yy, zz = s * x * x, s * y * y, s * z * z
+    xy, xz, yz = s * x * y, s * x * z, s * y * z
+    wx, wy, wz = s * w * x, s * w * y, s * w * z
+    return (
+        (1.0 - yy - zz, xy - wz, xz + wy),
+        (xy + wz, 1.0 - xx - zz, yz - wx),
+        (xz - wy, yz + wx, 1.0 - xx - yy),
+    )
+
+
+def _euler_to_matrix_terms(cr, sr, cp, sp, cy, sy):
+    return (
+        (cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr),
+        (sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr),
+        (-sp, cp * sr, cp * cr),
+    )
+
+
+def _euler_to_quat_terms(cr, sr, cp, sp, cy, sy):
+    return (
+        sr * cp * cy - cr * sp * sy,
+        cr * sp * cy + sr * cp * sy,
+        cr * cp * sy - sr * sp * cy,
+        cr * cp * cy + sr * sp * sy,
+    )
+
+
+def _fill_matrix(out, terms):
+    for i in range(3):
+        for j in range(3):
+            out[..., i, j] = terms[i][j]
+    return out
+
+
+def quat_to_matrix(quat, out=None):
+    """(...,4) [qx, qy, qz, qw] -> (...,3,3); the quaternion does not need to be normalized."""
+    q = np.asarray(quat, dtype=float)
+    out = _output(out, q.shape[:-1] + (3, 3))
+    if q.ndim == 1:
+        out[:] = _quat_to_matrix_terms(*q.tolist())
+        return out
+    return _fill_matrix(out, _quat_to_matrix_terms(q[..., 0], q[..., 1], q[..., 2], q[..., 3]))
+
+
+def matrix_to_quat(matrix, out=None):
+    """
+    (...,3,3) -> (...,4) [qx, qy, qz, qw], unit norm with qw >= 0.
+    Shepperd 方法：按迹与对角元中最大者选择主元分支，数值稳定。
+    """
+    m = np.asarray(matrix, dtype=float)
+    out = _output(out, m.shape[:-2] + (4,))
+    if m.ndim == 2:
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = m.tolist()
+        trace = m00 + m11 + m22
+        pivot = max(range(4), key=(m00, m11, m22, trace).__getitem__)
+        if pivot == 0:
+            q = (1 + m00 - m11 - m22, m01 + m10, m02 + m20, m21 - m12)
+        elif pivot == 1:
+            q = (m01 + m10, 1 - m00 + m11 - m22, m12 + m21, m02 - m20)
+        elif pivot == 2:
+            q = (m02 + m20, m12 + m21, 1 - m00 - m11 + m22, m10 - m01)
+        else:
+            q = (m21 - m12, m02 - m20, m10 - m01, 1 + trace)
+        scale = math.copysign(1.0 / math.sqrt(sum(c * c for c in q)), q[3])
+        out[:] = [c * scale for c in q]
+        return out
+
+    m00, m01, m02 = m[..., 0, 0], m[..., 0, 1], m[..., 0, 2]
+    m10, m11, m12 = m[..., 1, 0], m[..., 1, 1], m[..., 1, 2]
+    m20, m21, m22 = m[..., 2, 0], m[..., 2, 1], m[..., 2, 2]
+    trace = m00 + m11 + m22
+    # 四个分支均为 4*q_i*q，主元分量 4*q_i^2 越大数值越稳定
+    candidates = np.stack([
+        np.stack([1 + m00 - m11 - m22, m01 + m10, m02 + m20, m21 - m12], axis=-1),
+        np.stack([m01 + m10, 1 - m00 + m11 - m22, m12 + m21, m02 - m20], axis=-1),
+        np.stack([m02 + m20, m12 + m21, 1 - m00 - m11 + m22, m10 - m01], axis=-1),
+        np.stack([m21 - m12, m02 - m20, m10 - m01, 1 + trace], axis=-1),
+    ], axis=-2)                                                             # (...,4,4)
+    pivot = np.argmax(np.stack([m00, m11, m22, trace], axis=-1), axis=-1)
+    q = np.take_along_axis(candidates, pivot[..., None, None], axis=-2)[..., 0, :]
+    q /= np.linalg.norm(q, axis=-1, keepdims=True)
+    np.multiply(q, np.where(q[..., 3:] < 0, -1.0, 1.0), out=out)
+    return out
+
+
+def euler_to_matrix(rpy, out=None):
+    """(...,3) [roll, pitch, yaw] ('xyz' extrinsic, rad) -> (...,3,3)"""
+    e = np.asarray(rpy, dtype=float)
+    out = _output(out, e.shape[:-1] + (3, 3))
+    if e.ndim == 1:
+        r, p, y = e.tolist()
+        out[:] = _euler_to_matrix_terms(
+            math.cos(r), math.sin(r), math.cos(p), math.sin(p), math.cos(y), math.sin(y)
+        )
+        return out
+    c, s = np.cos(e), np.sin(e)
+    return _fill_matrix(out, _euler_to_matrix_terms(
+        c[..., 0], s[..., 0], c[..., 1], s[..., 1], c[..., 2], s[..., 2]
+    ))
+
+
+def matrix_to_euler(matrix, out=None):
+    """
+    (...,3,3) -> (...,3) [roll, pitch, yaw] ('xyz' extrinsic, rad)
+    万向锁（pitch = ±pi/2）时与 scipy 相同，令 yaw = 0。
+    """
+    m = np.asarray(matrix, dtype=float)
+    out = _output(out, m.shape[:-2] + (3,))
+    if m.ndim == 2:
+        (m00, _, _), (m10, m11, m12), (m20, m21, m22) = m.tolist()
+        sp = min(max(-m20, -1.0), 1.0)
+        if abs(sp) > 1.0 - _GIMBAL_EPS:
+            out[:] = (math.atan2(-m12, m11), math.asin(sp), 0.0)
+        else:
+            out[:] = (math.atan2(m21, m22), math.asin(sp), math.atan2(m10, m00))
+        return out
+
+    sp = np.clip(-m[..., 2, 0], -1.0, 1.0)
+    locked = np.abs(sp) > 1.0 - _GIMBAL_EPS
+    out[..., 1] = np.arcsin(sp)
+    out[..., 0] = np.where(locked, np.arctan2(-m[..., 1, 2], m[..., 1, 1]), np.arctan2(m[..., 2, 1], m[..., 2, 2]))
+    out[..., 2] = np.where(locked, 0.0, np.arctan2(m[..., 1, 0], m[..., 0, 0]))
+    return out
+
+
+def euler_to_quat(rpy, out=None):
+    """(...,3) [roll, pitch, yaw] ('xyz' extrinsic, rad) -> (...,4) [qx, qy, qz, qw]"""
+    e = np.asarray(rpy, dtype=float)
+    out = _output(out, e.shape[:-1] + (4,))
+    if e.ndim == 1:
+        r, p, y = (0.5 * a for a in e.tolist())
+        out[:] = _euler_to_quat_terms(
+            math.cos(r), math.sin(r), math.cos(p), math.sin(p), math.cos(y), math.sin(y)
+        )
+        return out
+    c, s = np.cos(0.5 * e), np.sin(0.5 * e)
+    terms = _euler_to_quat_terms(c[..., 0], s[..., 0], c[..., 1], s[..., 1], c[..., 2], s[..., 2])
+    for i in range(4):
+        out[..., i] = terms[i]
+    return out
+
+
+def quat_to_euler(quat, out=None):
+    """(...,4) [qx, qy, qz, qw] -> (...,3) [roll, pitch, yaw] ('xyz' extrinsic, rad)"""
+    return matrix_to_euler(quat_to_matrix(quat), out=out)
+
+
+def rotvec_to_quat(rotvec, out=None):
+    """(...,3) axis * angle (rad) -> (...,4) [qx, qy, qz, qw]"""
+    v = np.asarray(rotvec, dtype=float)
+    out = _output(out, v.shape[:-1] + (4,))
+    angle = np.linalg.norm(v, axis=-1)
+    half = 0.5 * angle
+    # sin(angle/2)/angle，小角度用泰勒展开避免 0/0
+    small = angle < 1e-6
+    scale = np.where(small, 0.5 - angle * angle / 48.0, np.sin(half) / np.where(small, 1.0, angle))
+    out[..., :3] = v * scale[..., None]
+    out[..., 3] = np.cos(half)
+    return out
+
+
+def quat_to_rotvec(quat, out=None):
+    """(...,4) [qx, qy, qz, qw] -> (...,3) axis * angle (rad), angle in [0, pi]"""
+    q = np.asarray(quat, dtype=float)
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    q = q * np.where(q[..., 3:] < 0, -1.0, 1.0)
+    out = _output(out, q.shape[:-1] + (3,))
+    sin_half = np.linalg.norm(q[..., :3], axis=-1)
+    angle = 2.0 * np.arctan2(sin_half, q[..., 3])
+    small = sin_half < 1e-9
+    scale = np.where(small, 2.0 / np.where(small, q[..., 3], 1.0), angle / np.where(small, 1.0, sin_half))
+    np.multiply(q[..., :3], scale[..., None], out=out)
+    return out
+
+
+def rotvec_to_matrix(rotvec, out=None):
+    """(...,3) axis * angle (rad) -> (...,3,3)"""
+    return quat_to_matrix(rotvec_to_quat(rotvec), out=out)
+
+
+def matrix_to_rotvec(matrix, out=None):
+    """(...,3,3) -> (...,3) axis * angle (rad)"""
+    return quat_to_rotvec(matrix_to_quat(matrix), out=out)
+
+
+# ======== SE(3) ========
+def pose_quat_to_T(pose, out=None):
+    """(...,7) [x, y, z, qx, qy, qz, qw] -> (...,4,4)"""
+    p = np.asarray(pose, dtype=float)
+    out = _output(out, p.shape[:-1] + (4, 4))
+    quat_to_matrix(p[..., 3:7], out=out[..., :3, :3])
+    out[..., :3, 3] = p[..., :3]
+    out[..., 3, :3] = 0.0
+    out[..., 3, 3] = 1.0
+    return out
+
+
+def pose_euler_to_T(pose, out=None):
+    """(...,6) [x, y, z, roll, pitch, yaw] -> (...,4,4)"""
+    p = np.asarray(pose, dtype=float)
+    out = _output(out, p.shape[:-1] + (4, 4))
+    euler_to_matrix(p[..., 3:6], out=out[..., :3, :3])
+    out[..., :3, 3] = p[..., :3]
+    out[..., 3, :3] = 0.0
+    out[..., 3, 3] = 1.0
+    return out
+
+
+def T_to_pose_quat(T, out=None):
+    """(...,4,4) -> (...,7) [x, y, z, qx, qy, qz, qw]"""
+    T = np.asarray(T, dtype=float)
+    out = _output(out, T.shape[:-2] + (7,))
+    out[..., :3] = T[..., :3, 3]
+    matrix_to_quat(T[..., :3, :3], out=out[..., 3:7])
+    return out
+
+
+def T_to_pose_euler(T, out=None):
+    """(...,4,4) -> (...,6) [x, y, z, roll, pitch, yaw]"""
+    T = np.asarray(T, dtype=float)
+    out = _output(out, T.shape[:-2] + (6,))
+    out[..., :3] = T[..., :3, 3]
+    matrix_to_euler(T[..., :3, :3], out=out[..., 3:6])
+    return out
@@ -0,0 +1,109 @@
+import threading
+import time
+from typing import Callable, Optional
+
+
+class GripperChannel:
+    """
+    Rate-limited gripper command channel on its own worker thread.
+    独立线程上的限频夹爪指令通道。
+
+    `post()` 只覆盖最新值（latest-value 语义）并立即返回，不阻塞机械臂伺服循环；
+    工作线程仅在指令与上一次发送值的差超过 `deadband` 时发送，且频率不超过 `max_rate_hz`。
+
+    Example:
+        with GripperChannel(robot.move_gripper, deadband=0.01, max_rate_hz=20) as gripper:
+            for pose, width in traj:
+                robot.servo_to_ee_pose(pose)
+                gripper.post(width)
+    """
+
+    def __init__(
+        self,
+        send: Callable[[float], object],
+        deadband: float = 0.01,
+        max_rate_hz: float = 20.0,
+    ):
+        self.send = send
+        self.deadband = deadband
+        self.min_interval = 1.0 / max_rate_hz if max_rate_hz else 0.0
+        self.sent = 0            # 实际发送次数
+        self.skipped = 0         # 因死区被忽略的次数
+        self.last_error: Optional[BaseException] = None
+
+        self._cond = threading.Condition()
+        self._latest: Optional[float] = None
+        self._last_sent: Optional[float] = None
+        self._closed = False
+        self._discard = False    # close(flush=False)：丢弃尚未发送的指令
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "GripperChannel":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="bestman-gripper", daemon=True)
+            self._thread.start()
+        return self
+
+    def post(self, command: float) -> None:
+        """Publish the latest gripper command (non-blocking). / 发布最新夹爪指令（非阻塞）。"""
+        with self._cond:
+            self._latest = command
+            self._cond.notify()
+
+    def close(self, flush: bool = True) -> None:
+        """Stop the worker; by default the last posted command is still sent. / 停止工作线程。"""
+        with self._cond:
+            self._closed = True
+            if not flush:
+                self._latest = None
+                self._discard = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _in_deadband(self, command: float) -> bool:
+        if self._last_sent is not None and abs(command - self._last_sent) <= self.deadband:
+            self.skipped += 1
+            return True
+        return False
+
+    def _run(self) -> None:
+        next_send = 0.0
+        while True:
+            with self._cond:
+                while self._latest is None and not self._closed:
+                    self._cond.wait()
+                if self._latest is None:
+                    return
+                command, self._latest = self._latest, None
+                closed = self._closed
+
+            if self._in_deadband(command):
+                continue
+
+            delay = next_send - time.perf_counter()
+            if delay > 0 and not closed:
+                time.sleep(delay)
+                # 睡眠期间可能有更新的指令（或已 close(flush=False)），取最新值并重新判断死区
+                with self._cond:
+                    if self._discard:
+                        return
+                    if self._latest is not None:
+                        command, self._latest = self._latest, None
+                if self._in_deadband(command):
+                    continue
+            try:
+                self.send(command)
+                self._last_sent = command
+                self.sent += 1
+            except Exception as e:
+                self.last_error = e
+                print(f"[WARN]: gripper command failed: {e}")
+            next_send = time.perf_counter() + self.min_interval
+
+    def __enter__(self) -> "GripperChannel":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close(flush=exc_type is None)
@@ -1,94 +1,246 @@
 import numpy as np
 import os
 from ..file_utils import select_multi_sessions_dir,select_session_subdir
-from ..utils import map_sensor_to_robot
+from ..utils import transform_traj, MAX_CLAMP_WIDTH
+from ..traj_cache import load_tum
+from ..batch import load_preprocessed
+from ..session_index import SessionRecord, CLAMP_REL_PATH, TRAJ_REL_PATH
+from ..resample import iter_resampled_chunks
+from bestman.robots.scheduler import RealtimeScheduler
+from ..traj_stream import iter_transformed_chunks, DEFAULT_CHUNK_SIZE
+from .gripper_channel import GripperChannel
+from .sinks import NullSink, RecordingSink
 import time
 class TrajReplayer:
     def __init__(self,robot=None):
         self.robot = robot
+        self.stream = False
+        self.timings = {}   # 各阶段耗时（秒）：load / transform / pipeline / tick_*
+        self.dry_run_sink = None
 
-    def load_data(self,data_root):
-        dir1 = select_multi_sessions_dir(data_root)#选择multisessions
-        selected_session = select_session_subdir(dir1)#选择session
-        clamp_path = os.path.join(selected_session,"Clamp_Data","clamp_data_tum.txt")    #"./session_001/Clamp_Data/clamp_data_tum.txt"
-        traj_path = os.path.join(selected_session,"Merged_Trajectory","merged_trajectory.txt")#"./session_001/Merged_Trajectory/merged_trajectory.txt"\
-       
+    def load_data(self,data_root=None,use_cache=True,stream=False,chunk_size=DEFAULT_CHUNK_SIZE,session=None):
+        '''
+        data_root: 数据根目录（交互式选择会话），None 时使用 select_multi_sessions_dir 的默认目录
+        session: 直接指定会话（session 目录路径或 SessionIndex 返回的 SessionRecord），不再交互式选择
+        stream=True: 不一次性读入整条轨迹，replay 时按 chunk_size 分块流式读取、对齐、变换并执行，
+                     内存占用与会话长度无关
+        '''
+        if session is not None:
+            selected_session = session.path if isinstance(session, SessionRecord) else session
+        else:
+            # 选择 multisessions；data_root 为 None 时使用 select_multi_sessions_dir 的默认数据目录
+            dir1 = select_multi_sessions_dir() if data_root is None else select_multi_sessions_dir(data_root)
+            selected_session = select_session_subdir(dir1)#选择session
+        clamp_path = os.path.join(selected_session,*CLAMP_REL_PATH)    #"./session_001/Clamp_Data/clamp_data_tum.txt"
+        # "./session_001/Merged_Trajectory/merged_trajectory.txt"
+        traj_path = os.path.join(selected_session,*TRAJ_REL_PATH)
+
+        self.clamp_path, self.traj_path = clamp_path, traj_path
+        self.timings = {}
+        self.use_cache = use_cache
+        self.stream = stream
+        self.chunk_size = chunk_size
+        if stream:
+            return
+
+        t_start = time.perf_counter()
         try:
-            self.raw_clamp = np.loadtxt(clamp_path)
-            self.raw_pose = np.loadtxt(traj_path)
+            self.raw_clamp = load_tum(clamp_path, use_cache=use_cache)
+            self.raw_pose = load_tum(traj_path, use_cache=use_cache)
             self.pose_timestamps = self.raw_pose[:,0]
             self.raw_pose = self.raw_pose[:,1:]
         except Exception as e:
             print(e)
+        self.timings["load"] = time.perf_counter() - t_start
+
+    def load_preprocessed(self,session,T_robot_init=None):
+        '''
+        load ready-to-replay arrays written by `bestman preprocess` / preprocess_multi_session,
+        no transform_traj needed afterwards
+        读取批量预处理结果，之后无需再调用 transform_traj
+        '''
+        session_dir = session.path if isinstance(session, SessionRecord) else session
+        self.stream = False
+        self.timings = {}
+        t_start = time.perf_counter()
+        self.pose_timestamps, self.target_pose, self.target_clamp_width = load_preprocessed(session_dir, T_robot_init)
+        self.timings["load"] = time.perf_counter() - t_start
+        self.timings["transform"] = 0.0
 
     def transform_traj(self,T_robot_init):
-        self.target_pose = []   
-        self.target_clamp_width=[]
-        
-        clamp_timestamps = self.raw_clamp[:,0]
-        umi_clamp_widths = self.raw_clamp[:,-1]
-
-        for i,(p, pose_ts) in enumerate(zip(self.raw_pose,self.pose_timestamps)):
-
-            idx = np.abs(clamp_timestamps - pose_ts).argmin()
-            real_width = np.clip(umi_clamp_widths[idx], 0, 88)
-            self.target_clamp_width.append(real_width)
-            
-            self.target_pose.append(map_sensor_to_robot(*p,T_robot_init=T_robot_init))
-
-
-    
-
-    def replay(self,interval=1,speed_rate=1.0):
-        if not hasattr(self,"raw_pose"):
-            raise ValueError("call load_data fisrt")
-        if not hasattr(self,"target_pose"):
-            raise ValueError("call transform_traj fisrt")
-        
-        if  not hasattr(self,"target_clamp_width") or self.target_clamp_width is None :
-            print("clamp miss, replay traj only")
-        
-        # 1. 下采样
-        sampled_indices = slice(0, None, interval)
-        sampled_timestamps = self.pose_timestamps[sampled_indices]
-        sampled_pose = self.target_pose[sampled_indices]
-        sampled_clamp = self.target_clamp_width[sampled_indices]
-
-        # 2. 转为相对时间并应用速率
-        # 这里的 timestamps 是每一帧应该被执行的“理想时刻”
-        timestamps = (sampled_timestamps - sampled_timestamps[0]) / speed_rate
-        
-        start_time = time.time()
-        total_points = len(sampled_pose)
-        
-        print(f"开始同步轨迹复现: {total_points} 个点, 预计时长: {timestamps[-1]/speed_rate:.2f} 秒")
-
-        inter_w = sampled_clamp[0]
-
-        for i in range(total_points):
-            # 计算当前点应该在什么时候执行
-            target_execution_time = timestamps[i]
-            
-            # 计算当前实际已经过去了多久
-            actual_elapsed = time.time() - start_time
-            
-            # 需要等待的差值
-            wait_time = target_execution_time - actual_elapsed
-            
-            if wait_time > 0:
-                time.sleep(wait_time)
-            elif wait_time < -0.01:
-                # 如果实际耗时已经超过了目标时刻，说明落后于时间表
-                print(f"[WARN]: 滞后于时间轴 {abs(wait_time):.3f}s (Point {i})")
-
-            # if i % 20 == 0:
-            #     inter_w = sampled_clamp[i]
-
-            # 同步执行机器人指令
-            # 注意：如果 self._robot_sdk 内部非常耗时，会直接影响下一帧的准时性
-            # self._robot_sdk(sampled_pose[i], inter_w)
-            self.robot.servo_to_ee_pose(sampled_pose[i])
-            self.robot.move_gripper(sampled_clamp[i]/88)
-            # self.robot.move_gripper(0)
-        print("轨迹复现完成")
+        if self.stream:
+            # 流式模式下变换在 replay 时逐块进行
+            self.T_robot_init = T_robot_init
+            return
+        t_start = time.perf_counter()
+        self.target_pose, self.target_clamp_width = transform_traj(
+            self.raw_pose, self.raw_clamp, self.pose_timestamps, T_robot_init
+        )
+        self.timings["transform"] = time.perf_counter() - t_start
+
+    def _iter_target_chunks(self, rate_hz=None, speed_rate=1.0):
+        '''yield (timestamps, target_pose, clamp_widths) chunks to be replayed'''
+        if self.stream:
+            chunks = iter_transformed_chunks(
+                self.traj_path, self.clamp_path, self.T_robot_init, self.chunk_size, self.use_cache
+            )
+        else:
+            chunks = [(self.pose_timestamps, self.target_pose, getattr(self, "target_clamp_width", None))]
+        if rate_hz is not None:
+            # 在轨迹时间上按 rate_hz/speed_rate 采样，执行时的指令频率即为 rate_hz
+            chunks = iter_resampled_chunks(chunks, rate_hz / speed_rate)
+        yield from chunks
+
+    def replay(self,interval=1,speed_rate=1.0,rate_hz=None,lag_policy="stretch",max_lag=0.01,spin_window=0.002,
+               async_gripper=True,gripper_deadband=0.01,gripper_rate_hz=20.0,dry_run=False,realtime=True,
+               record=True):
+        '''
+        interval: 下采样步长（仅在 rate_hz 为 None 时生效）
+        speed_rate: 复现速率倍数
+        rate_hz: 若指定，先将轨迹重采样为该频率的均匀网格（位置线性插值、姿态 SLERP），
+                 指令频率与机械臂伺服频率一致而不随传感器抖动
+        lag_policy: 某帧滞后超过 max_lag 秒时的处理方式，"drop"（丢帧）/"stretch"（时间拉伸）/"abort"（中止）
+        spin_window: 每帧最后 spin_window 秒改为忙等，提高定时精度
+        async_gripper: 夹爪指令经独立线程的 GripperChannel 发送，不阻塞伺服循环；
+                       仅当归一化宽度变化超过 gripper_deadband 时发送，且频率不超过 gripper_rate_hz
+        dry_run: 不连接硬件，指令发往 RecordingSink（走同一条代码路径），结束后可通过
+                 self.dry_run_sink.commands() 查看将会发送的指令
+        record: 仅 dry_run 时生效；False 时指令发往 NullSink 不做记录（长时间空跑只评估耗时，不占用内存）
+        realtime: False 时不等待时间表，尽可能快地执行（配合 dry_run 评估每帧计算耗时是否满足时间表）
+
+        Returns:
+            dict: 每帧滞后统计（p50/p99/max 等，单位秒，见 RealtimeScheduler.stats），
+                  以及 "timings"（各阶段耗时）与 "commands"（已发送的指令数）
+        '''
+        if self.stream:
+            if not hasattr(self,"traj_path"):
+                raise ValueError("call load_data fisrt")
+            if not hasattr(self,"T_robot_init"):
+                raise ValueError("call transform_traj fisrt")
+        else:
+            if not hasattr(self,"target_pose"):
+                if not hasattr(self,"raw_pose"):
+                    raise ValueError("call load_data fisrt")
+                raise ValueError("call transform_traj fisrt")
+
+            if  not hasattr(self,"target_clamp_width") or self.target_clamp_width is None :
+                print("clamp miss, replay traj only")
+
+        if rate_hz is not None:
+            interval = 1
+        if self.stream:
+            print(f"开始流式轨迹复现: 每块 {self.chunk_size} 个点")
+        else:
+            # 空轨迹时长为 0，不发送任何指令
+            n_total = len(self.pose_timestamps)
+            duration = (self.pose_timestamps[-1] - self.pose_timestamps[0]) / speed_rate if n_total else 0.0
+            if rate_hz is not None:
+                n_points = int(duration * rate_hz) + 1 if n_total else 0
+            else:
+                n_points = len(range(0, len(self.target_pose), interval))
+            print(f"开始同步轨迹复现: {n_points} 个点, 预计时长: {duration:.2f} 秒")
+
+        if dry_run:
+            robot = self.dry_run_sink = RecordingSink() if record else NullSink()
+        else:
+            robot = self.robot
+        scheduler = RealtimeScheduler(spin_window=spin_window, lag_policy=lag_policy, max_lag=max_lag)
+        gripper = None
+        if async_gripper:
+            gripper = GripperChannel(robot.move_gripper, deadband=gripper_deadband, max_rate_hz=gripper_rate_hz)
+            gripper.start()
+            send_gripper = gripper.post
+        else:
+            send_gripper = robot.move_gripper
+        try:
+            tick_times, n_servo, n_gripper = self._replay_loop(
+                robot, scheduler, send_gripper, interval, speed_rate, rate_hz, realtime
+            )
+        except BaseException:
+            # 中止（ScheduleLagError、Ctrl-C 等）时丢弃排队中的夹爪指令，不再发往硬件
+            if gripper is not None:
+                gripper.close(flush=False)
+            raise
+        if gripper is not None:
+            gripper.close()
+
+        stats = scheduler.stats()
+        tick_times = np.asarray(tick_times) if len(tick_times) else np.zeros(1)
+        self.timings.update(
+            tick_p50=float(np.percentile(tick_times, 50)),
+            tick_p99=float(np.percentile(tick_times, 99)),
+            tick_max=float(tick_times.max()),
+        )
+        stats["timings"] = dict(self.timings)
+        stats["commands"] = {"servo": n_servo, "gripper": gripper.sent if gripper is not None else n_gripper}
+        print(
+            f"轨迹复现完成: {n_servo} 帧, 丢帧 {stats['dropped']}, 时间拉伸 {stats['stretched']:.3f}s, "
+            f"滞后 p50/p99/max = {stats['lateness_p50']*1e3:.2f}/{stats['lateness_p99']*1e3:.2f}/"
+            f"{stats['lateness_max']*1e3:.2f} ms"
+        )
+        if dry_run:
+            self.print_timings()
+        return stats
+
+    def print_timings(self):
+        '''print per-stage timings of the last load/transform/replay / 打印各阶段耗时'''
+        labels = {
+            "load": "读取轨迹", "transform": "坐标变换", "pipeline": "分块流水线/重采样",
+            "tick_p50": "每帧计算 p50", "tick_p99": "每帧计算 p99", "tick_max": "每帧计算 max",
+        }
+        print("─" * 40)
+        for key, label in labels.items():
+            if key in self.timings:
+                print(f"{label:<16}{self.timings[key]*1e3:>12.3f} ms")
+        print("─" * 40)
+
+    def _replay_loop(self, robot, scheduler, send_gripper, interval, speed_rate, rate_hz, realtime=True):
+        '''Returns: (per-tick compute times, servo commands sent, gripper commands posted)'''
+        clock = time.perf_counter
+        tick_times = []
+        n_servo = n_gripper = 0
+        pipeline_time = 0.0
+        t0 = None
+        offset = 0  # 已处理点数，用于跨块保持下采样步长
+        chunks = self._iter_target_chunks(rate_hz, speed_rate)
+        while True:
+            # 分块读取/对齐/变换/重采样（流式模式下）的耗时
+            t_start = clock()
+            chunk = next(chunks, None)
+            pipeline_time += clock() - t_start
+            if chunk is None:
+                break
+            chunk_timestamps, chunk_pose, chunk_clamp = chunk
+            # 1. 下采样
+            sampled_indices = slice((-offset) % interval, None, interval)
+            offset += len(chunk_timestamps)
+            sampled_timestamps = chunk_timestamps[sampled_indices]
+            sampled_pose = chunk_pose[sampled_indices]
+            sampled_clamp = None if chunk_clamp is None else chunk_clamp[sampled_indices]
+            if len(sampled_timestamps) == 0:
+                continue
+
+            # 2. 转为相对时间并应用速率
+            # 这里的 timestamps 是每一帧应该被执行的“理想时刻”
+            if t0 is None:
+                t0 = sampled_timestamps[0]
+                scheduler.start()
+            timestamps = (sampled_timestamps - t0) / speed_rate
+
+            for i in range(len(sampled_pose)):
+                # 等待至当前点的执行时刻；落后于时间表时按 lag_policy 处理（drop 策略返回 False）
+                if realtime and not scheduler.wait(timestamps[i]):
+                    continue
+
+                # 同步执行机器人指令
+                # 注意：如果 self._robot_sdk 内部非常耗时，会直接影响下一帧的准时性
+                t_tick = clock()
+                robot.servo_to_ee_pose(sampled_pose[i])
+                n_servo += 1
+                if sampled_clamp is not None:
+                    send_gripper(sampled_clamp[i]/MAX_CLAMP_WIDTH)
+                    n_gripper += 1
+                tick_times.append(clock() - t_tick)
 
+        self.timings["pipeline"] = pipeline_time
+        return tick_times, n_servo, n_gripper
@@ -0,0 +1,54 @@
+import threading
+import time
+
+import numpy as np
+
+
+class NullSink:
+    """
+    Command sink that accepts everything and does nothing (hardware-free replay).
+    空指令接收端：接受所有指令但不做任何事，用于无硬件空跑。
+    """
+
+    def servo_to_ee_pose(self, pose) -> bool:
+        return True
+
+    def move_gripper(self, command: float) -> bool:
+        return True
+
+
+class RecordingSink(NullSink):
+    """
+    Command sink that records every command with a perf_counter timestamp.
+    记录每条指令及其时间戳（perf_counter）的接收端，用于检查复现将会发送的指令。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()   # move_gripper 可能来自 GripperChannel 线程，两类指令都在锁内记录
+        self.servo_times, self.servo_poses = [], []
+        self.gripper_times, self.gripper_commands = [], []
+
+    def servo_to_ee_pose(self, pose) -> bool:
+        with self._lock:
+            self.servo_times.append(time.perf_counter())
+            self.servo_poses.append(pose)
+        return True
+
+    def move_gripper(self, command: float) -> bool:
+        with self._lock:
+            self.gripper_times.append(time.perf_counter())
+            self.gripper_commands.append(command)
+        return True
+
+    def commands(self):
+        """
+        Returns:
+            dict of arrays: servo_times (N,), servo_poses (N,6), gripper_times (M,), gripper_commands (M,)
+        """
+        with self._lock:
+            return {
+                "servo_times": np.asarray(self.servo_times),
+                "servo_poses": np.asarray(self.servo_poses, dtype=float).reshape(-1, 6),
+                "gripper_times": np.asarray(self.gripper_times),
+                "gripper_commands": np.asarray(self.gripper_commands, dtype=float),
+            }
@@ -0,0 +1,85 @@
+import numpy as np
+from scipy.spatial.transform import Rotation as R
+from scipy.spatial.transform import Slerp
+
+
+def _strictly_increasing(timestamps):
+    '''mask keeping the first sample of every run of non-increasing timestamps'''
+    keep = np.ones(len(timestamps), dtype=bool)
+    keep[1:] = timestamps[1:] > np.maximum.accumulate(timestamps)[:-1]
+    return keep
+
+
+def resample_traj(timestamps, poses, widths=None, rate_hz=200.0, t_start=None, degrees=False):
+    '''
+    resample a transformed trajectory onto a uniform time grid
+    将变换后的轨迹重采样到固定频率的均匀时间网格上
+
+    位置与夹爪宽度线性插值，姿态（xyz 欧拉角）转四元数后做 SLERP，全部向量化计算。
+
+    Args:
+        timestamps: (N,) seconds, ascending
+        poses: (N,6) [x, y, z, roll, pitch, yaw]
+        widths: (N,) clamp widths or None
+        rate_hz: grid frequency
+        t_start: first grid time, defaults to timestamps[0]
+    Returns:
+        grid (M,), poses (M,6), widths (M,) or None
+    '''
+    timestamps = np.asarray(timestamps, dtype=float)
+    poses = np.asarray(poses, dtype=float)
+    keep = _strictly_increasing(timestamps)
+    timestamps, poses = timestamps[keep], poses[keep]
+    if widths is not None:
+        widths = np.asarray(widths, dtype=float)[keep]
+
+    empty = np.empty(0), np.empty((0, 6)), None if widths is None else np.empty(0)
+    if len(timestamps) == 0:
+        return empty
+    if t_start is None:
+        t_start = timestamps[0]
+    period = 1.0 / rate_hz
+    if timestamps[-1] < t_start:
+        return empty
+    # 网格按整数步长生成，避免累加误差
+    n = int(np.floor((timestamps[-1] - t_start) * rate_hz + 1e-9)) + 1
+    grid = t_start + np.arange(n) * period
+
+    out = np.empty((n, 6))
+    if len(timestamps) == 1:
+        out[:] = poses[0]
+    else:
+        for k in range(3):
+            out[:, k] = np.interp(grid, timestamps, poses[:, k])
+        slerp = Slerp(timestamps, R.from_euler('xyz', poses[:, 3:], degrees=degrees))
+        out[:, 3:] = slerp(np.clip(grid, timestamps[0], timestamps[-1])).as_euler('xyz', degrees=degrees)
+
+    out_widths = None if widths is None else np.interp(grid, timestamps, widths)
+    return grid, out, out_widths
+
+
+def iter_resampled_chunks(chunks, rate_hz=200.0):
+    '''
+    streaming version of resample_traj over (timestamps, poses, widths) chunks
+    流式重采样：跨块保留上一块最后一个样本，网格在整个会话上连续
+    '''
+    period = 1.0 / rate_hz
+    t0 = None
+    k = 0                 # 下一个网格点序号
+    carry = None          # 上一块的最后一个样本
+    for timestamps, poses, widths in chunks:
+        if len(timestamps) == 0:
+            continue
+        if carry is not None:
+            timestamps = np.concatenate([carry[0], timestamps])
+            poses = np.concatenate([carry[1], poses])
+            widths = None if widths is None else np.concatenate([carry[2], widths])
+        else:
+            t0 = timestamps[0]
+        carry = (timestamps[-1:], poses[-1:], None if widths is None else widths[-1:])
+
+        grid, out, out_widths = resample_traj(timestamps, poses, widths, rate_hz, t_start=t0 + k * period)
+        if len(grid) == 0:
+            continue
+        k += len(grid)
+        yield grid, out, out_widths
@@ -0,0 +1,297 @@
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .file_utils import parse_timestamp_from_name
+from .traj_cache import load_cached
+
+INDEX_FILE_NAME = ".bestman_session_index.json"
+INDEX_VERSION = 1
+TRAJ_REL_PATH = ("Merged_Trajectory", "merged_trajectory.txt")
+CLAMP_REL_PATH = ("Clamp_Data", "clamp_data_tum.txt")
+
+
+@dataclass
+class SessionRecord:
+    """
+    One `multi_sessions_*/session_*` entry of the index.
+    索引中的一条会话记录。
+    """
+    multi_session: str
+    session: str
+    path: str
+    timestamp: Optional[str]     # multi_sessions 目录名中的采集时间（ISO 格式）
+    n_points: int                # 轨迹点数
+    duration: float              # 轨迹时长（秒）
+    traj_size: int               # merged_trajectory.txt 字节数
+    clamp_size: int              # clamp_data_tum.txt 字节数
+    traj_mtime_ns: int = 0
+    clamp_mtime_ns: int = 0
+
+    @property
+    def started_at(self) -> Optional[datetime]:
+        """Recording time parsed from `timestamp`. / 采集时间。"""
+        return datetime.fromisoformat(self.timestamp) if self.timestamp else None
+
+    @property
+    def traj_path(self) -> Path:
+        return Path(self.path).joinpath(*TRAJ_REL_PATH)
+
+    @property
+    def clamp_path(self) -> Path:
+        return Path(self.path).joinpath(*CLAMP_REL_PATH)
+
+
+def _stat(path: Path):
+    try:
+        st = path.stat()
+        return st.st_mtime_ns, st.st_size
+    except FileNotFoundError:
+        return 0, 0
+
+
+def _first_last_line(path: Path):
+    '''first and last non-empty line without reading the whole file'''
+    with open(path, "rb") as f:
+        first = b""
+        for line in f:
+            if line.strip() and not line.lstrip().startswith(b"#"):
+                first = line
+                break
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        block = b""
+        pos = end
+        while pos > 0:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step) + block
+            lines = [ln for ln in block.splitlines() if ln.strip()]
+            if len(lines) > 1 or (lines and pos == 0):
+                return first, lines[-1]
+    return first, first
+
+
+def _count_lines(path: Path) -> int:
+    '''number of data lines: non-empty and not starting with "#" (same rule as _first_last_line)'''
+    with open(path, "rb") as f:
+        return sum(1 for line in f if line.strip() and not line.lstrip().startswith(b"#"))
+
+
+def _scan_trajectory(traj_path: Path):
+    '''(n_points, duration) of a trajectory, from its cache when available'''
+    cached = load_cached(traj_path)
+    if cached is not None:
+        cached = cached.reshape(len(cached), -1)
+        if len(cached) == 0:
+            return 0, 0.0
+        return len(cached), float(cached[-1, 0] - cached[0, 0])
+    if not traj_path.exists():
+        return 0, 0.0
+    first, last = _first_last_line(traj_path)
+    if not first:
+        return 0, 0.0
+    duration = float(last.split()[0]) - float(first.split()[0])
+    return _count_lines(traj_path), duration
+
+
+class SessionIndex:
+    """
+    Persistent index of `multi_sessions_*/session_*` directories under a data root.
+    数据根目录下会话的持久化索引。
+
+    索引保存在 `<data_root>/.bestman_session_index.json`，`refresh()` 依据目录与文件的
+    mtime/size 增量更新，只重新扫描发生变化的会话。查询接口不需要交互输入，可用于批处理/无头复现。
+
+    Example:
+        index = SessionIndex("/media/ark/B2D6-285E").refresh()
+        record = index.select()                  # 最新 multi_sessions 下的最新 session
+        record = index.select(multi=2, session=1)  # 与交互式选择的编号一致（从 1 开始）
+        records = index.query(after=datetime(2025, 11, 14))
+    """
+
+    def __init__(self, data_root, index_path=None):
+        self.data_root = Path(data_root).expanduser()
+        self.index_path = Path(index_path) if index_path else self.data_root / INDEX_FILE_NAME
+        # multi_session name -> {"mtime_ns": int, "sessions": {session name -> record}}
+        self._entries: Dict[str, dict] = {}
+        self.load()
+
+    # ======== Persistence / 持久化 ========
+    def load(self) -> "SessionIndex":
+        try:
+            with open(self.index_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if data.get("version") != INDEX_VERSION:
+            return self
+        self._entries = {
+            name: {
+                "mtime_ns": entry["mtime_ns"],
+                "sessions": {s["session"]: SessionRecord(**s) for s in entry["sessions"]},
+            }
+            for name, entry in data.get("multi_sessions", {}).items()
+        }
+        return self
+
+    def save(self) -> None:
+        data = {
+            "version": INDEX_VERSION,
+            "multi_sessions": {
+                name: {
+                    "mtime_ns": entry["mtime_ns"],
+                    "sessions": [asdict(r) for r in entry["sessions"].values()],
+                }
+                for name, entry in self._entries.items()
+            },
+        }
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"[WARN]: 无法写入会话索引 {self.index_path}: {e}")
+
+    # ======== Scanning / 扫描 ========
+    def refresh(self, save: bool = True) -> "SessionIndex":
+        """Incrementally rescan the data root. / 增量扫描数据根目录。"""
+        if not self.data_root.is_dir():
+            raise FileNotFoundError(f"数据根目录不存在: '{self.data_root}'")
+
+        entries = {}
+        for multi_dir in self.data_root.glob("multi_sessions*"):
+            if not multi_dir.is_dir():
+                continue
+            mtime_ns = multi_dir.stat().st_mtime_ns
+            old = self._entries.get(multi_dir.name, {"mtime_ns": None, "sessions": {}})
+            if old["mtime_ns"] == mtime_ns:
+                names = list(old["sessions"])
+            else:
+                names = sorted(p.name for p in multi_dir.glob("session_*") if p.is_dir())
+            sessions = {}
+            for name in names:
+                record = self._scan_session(multi_dir / name, old["sessions"].get(name))
+                if record is not None:
+                    sessions[name] = record
+            entries[multi_dir.name] = {"mtime_ns": mtime_ns, "sessions": sessions}
+
+        self._entries = entries
+        if save:
+            self.save()
+        return self
+
+    def _scan_session(self, session_dir: Path, old: Optional[SessionRecord]) -> Optional[SessionRecord]:
+        if not session_dir.is_dir():
+            return None
+        traj_path = session_dir.joinpath(*TRAJ_REL_PATH)
+        traj_mtime_ns, traj_size = _stat(traj_path)
+        clamp_mtime_ns, clamp_size = _stat(session_dir.joinpath(*CLAMP_REL_PATH))
+        if old is not None and (old.traj_mtime_ns, old.traj_size, old.clamp_mtime_ns, old.clamp_size) == (
+            traj_mtime_ns, traj_size, clamp_mtime_ns, clamp_size
+        ):
+            return old
+
+        dt = parse_timestamp_from_name(session_dir.parent.name)
+        n_points, duration = _scan_trajectory(traj_path)
+        return SessionRecord(
+            multi_session=session_dir.parent.name,
+            session=session_dir.name,
+            path=str(session_dir),
+            timestamp=dt.isoformat() if dt else None,
+            n_points=n_points,
+            duration=duration,
+            traj_size=traj_size,
+            clamp_size=clamp_size,
+            traj_mtime_ns=traj_mtime_ns,
+            clamp_mtime_ns=clamp_mtime_ns,
+        )
+
+    # ======== Query / 查询 ========
+    def multi_sessions(self) -> List[str]:
+        """multi_sessions names, newest first (same order as select_multi_sessions_dir)."""
+        def sort_key(name):
+            return (parse_timestamp_from_name(name) or datetime.min, name)
+        return sorted(self._entries, key=sort_key, reverse=True)
+
+    def sessions(self, multi: Optional[str] = None) -> List[SessionRecord]:
+        """Records of one multi_sessions directory (ascending), or all of them."""
+        names = [multi] if multi is not None else self.multi_sessions()
+        records = []
+        for name in names:
+            if name not in self._entries:
+                raise KeyError(f"未找到多会话: {name}")
+            sessions = self._entries[name]["sessions"]
+            records.extend(sessions[s] for s in sorted(sessions))
+        return records
+
+    def query(
+        self,
+        after: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        min_points: int = 0,
+    ) -> List[SessionRecord]:
+        """Filter sessions by recording time and size. / 按采集时间与点数筛选会话。"""
+        records = []
+        for r in self.sessions():
+            dt = r.started_at
+            if after is not None and (dt is None or dt < after):
+                continue
+            if before is not None and (dt is None or dt >= before):
+                continue
+            if r.n_points < min_points:
+                continue
+            records.append(r)
+        return records
+
+    def select(
+        self,
+        multi: Union[int, str, None] = None,
+        session: Union[int, str, None] = None,
+    ) -> SessionRecord:
+        """
+        Non-interactive counterpart of select_multi_sessions_dir + select_session_subdir.
+        非交互式选择会话。
+
+        Args:
+            multi: 1-based index (1 = newest) or directory name; None = newest.
+                   从 1 开始的编号（1 为最新）或目录名；None 为最新。
+            session: 1-based index (ascending) or directory name; None = last session.
+                     从 1 开始的编号（升序）或目录名；None 为最后一个会话。
+        """
+        multis = self.multi_sessions()
+        if not multis:
+            raise FileNotFoundError("未找到任何 'multi_sessions*' 目录。")
+        if multi is None:
+            multi_name = multis[0]
+        elif isinstance(multi, int):
+            if not 1 <= multi <= len(multis):
+                raise IndexError(f"编号无效，请输入 1–{len(multis)} 之间的数字。")
+            multi_name = multis[multi - 1]
+        else:
+            multi_name = multi
+
+        records = self.sessions(multi_name)
+        if not records:
+            raise FileNotFoundError(f"在 '{multi_name}' 下未找到任何 'session_*' 子目录。")
+        if session is None:
+            return records[-1]
+        if isinstance(session, int):
+            if not 1 <= session <= len(records):
+                raise IndexError(f"编号无效，请输入 1–{len(records)} 之间的数字。")
+            return records[session - 1]
+        for r in records:
+            if r.session == session:
+                return r
+        raise KeyError(f"在 '{multi_name}' 下未找到子会话: {session}")
+
+    def latest(self) -> SessionRecord:
+        return self.select()
+
+    def __len__(self) -> int:
+        return sum(len(e["sessions"]) for e in self._entries.values())
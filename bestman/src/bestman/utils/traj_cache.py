@@ -0,0 +1,81 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+# 缓存目录，与源文件放在同一目录下（如 session_001/Merged_Trajectory/.bestman_cache/）
+CACHE_DIR_NAME = ".bestman_cache"
+CACHE_VERSION = 1
+
+
+def cache_paths(src_path):
+    '''return (npy_path, meta_path) of the cache for a TUM text file'''
+    src = Path(src_path)
+    cache_dir = src.parent / CACHE_DIR_NAME
+    return cache_dir / (src.name + ".npy"), cache_dir / (src.name + ".json")
+
+
+def _source_key(src: Path):
+    st = src.stat()
+    return {"version": CACHE_VERSION, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def load_cached(path):
+    '''return the memmap view of a valid cache, or None (never parses the text file)'''
+    src = Path(path)
+    npy_path, meta_path = cache_paths(src)
+    try:
+        with open(meta_path) as f:
+            if json.load(f) == _source_key(src):
+                return np.load(npy_path, mmap_mode="r")
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def load_tum(path, use_cache=True):
+    '''
+    read a TUM style text file (timestamp x y z qx qy qz qw / timestamp ... width)
+    读取 TUM 文本文件，首次解析后转存为 .npy，之后以 np.memmap 零拷贝方式加载
+
+    缓存以源文件 mtime 与 size 作为失效依据；缓存目录不可写时（如只读 U 盘）退化为直接解析。
+
+    Returns:
+        np.ndarray (read-only np.memmap when served from cache)
+    '''
+    src = Path(path)
+    if not use_cache:
+        return np.loadtxt(src)
+
+    cached = load_cached(src)
+    if cached is not None:
+        return cached
+
+    npy_path, meta_path = cache_paths(src)
+    key = _source_key(src)
+    data = np.loadtxt(src)
+    try:
+        npy_path.parent.mkdir(exist_ok=True)
+        tmp_path = npy_path.with_name(npy_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, data)
+        os.replace(tmp_path, npy_path)
+        # meta 最后写入，作为缓存有效的提交点
+        tmp_path = meta_path.with_name(meta_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(key, f)
+        os.replace(tmp_path, meta_path)
+    except OSError as e:
+        print(f"[WARN]: 无法写入轨迹缓存 {npy_path}: {e}")
+        return data
+    return np.load(npy_path, mmap_mode="r")
+
+
+def clear_cache(path):
+    '''remove the cache of a TUM text file if present'''
+    for p in cache_paths(path):
+        try:
+            p.unlink()
+        except FileNotFoundError:
+            pass
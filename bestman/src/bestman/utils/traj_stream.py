@@ -0,0 +1,80 @@
+from itertools import islice
+
+import numpy as np
+
+from .traj_cache import load_cached
+from .utils import align_clamp_widths, map_sensor_to_robot_batch
+
+DEFAULT_CHUNK_SIZE = 4096
+
+
+def iter_tum_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, use_cache=True):
+    '''
+    yield a TUM text file as (n, cols) arrays of at most `chunk_size` rows
+    按固定行数分块读取 TUM 文件；若存在有效缓存则直接切片 memmap，否则逐块解析文本
+
+    内存占用只与 chunk_size 有关，与文件长度无关。
+    '''
+    cached = load_cached(path) if use_cache else None
+    if cached is not None:
+        cached = cached.reshape(len(cached), -1)
+        for start in range(0, len(cached), chunk_size):
+            yield np.asarray(cached[start:start + chunk_size])
+        return
+
+    with open(path) as f:
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            chunk = np.loadtxt(lines, ndmin=2)
+            if len(chunk):
+                yield chunk
+
+
+def iter_aligned_chunks(traj_path, clamp_path, chunk_size=DEFAULT_CHUNK_SIZE, use_cache=True):
+    '''
+    stream poses together with their nearest clamp width
+    流式读取位姿并按最近时间戳对齐夹爪宽度
+
+    两个文件都需按时间戳升序（采集数据即如此）。夹爪数据只保留覆盖当前块所需的滑动窗口。
+
+    Yields:
+        (pose_timestamps (n,), raw_pose (n,7), clamp_widths (n,))
+    '''
+    clamp_chunks = iter_tum_chunks(clamp_path, chunk_size, use_cache)
+    clamp_buf = np.empty((0, 2))
+    clamp_done = False
+
+    for chunk in iter_tum_chunks(traj_path, chunk_size, use_cache):
+        pose_ts = chunk[:, 0]
+        # 读到越过本块最后一个时间戳为止，保证最近邻的右侧候选已在窗口内
+        while not clamp_done and (len(clamp_buf) == 0 or clamp_buf[-1, 0] < pose_ts[-1]):
+            nxt = next(clamp_chunks, None)
+            if nxt is None:
+                clamp_done = True
+            else:
+                clamp_buf = np.vstack([clamp_buf, nxt[:, [0, -1]]])
+        if len(clamp_buf) == 0:
+            raise ValueError(f"no clamp data in {clamp_path}")
+
+        widths = align_clamp_widths(clamp_buf[:, 0], clamp_buf[:, 1], pose_ts)
+
+        # 丢弃后续位姿不可能再匹配到的夹爪样本（保留最后一个时间戳的左邻及其重复项）
+        keep = max(np.searchsorted(clamp_buf[:, 0], pose_ts[-1], side="left") - 1, 0)
+        keep = np.searchsorted(clamp_buf[:, 0], clamp_buf[keep, 0], side="left")
+        clamp_buf = clamp_buf[keep:]
+
+        yield pose_ts, chunk[:, 1:], widths
+
+
+def iter_transformed_chunks(traj_path, clamp_path, T_robot_init, chunk_size=DEFAULT_CHUNK_SIZE, use_cache=True):
+    '''
+    generator pipeline: load -> clamp alignment -> map_sensor_to_robot
+    生成器流水线：分块读取 → 夹爪对齐 → 坐标变换
+
+    Yields:
+        (pose_timestamps (n,), target_pose (n,6), clamp_widths (n,))
+    '''
+    for pose_ts, raw_pose, widths in iter_aligned_chunks(traj_path, clamp_path, chunk_size, use_cache):
+        yield pose_ts, map_sensor_to_robot_batch(raw_pose, T_robot_init), widths
@@ -0,0 +1,205 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .conversions import T_to_pose_quat, euler_to_matrix, pose_quat_to_T
+
+
+def _se3_inv(T):
+    '''closed-form inverse of a rigid transform'''
+    T_inv = np.eye(4)
+    T_inv[:3, :3] = T[:3, :3].T
+    T_inv[:3, 3] = -T[:3, :3].T @ T[:3, 3]
+    return T_inv
+
+
+def _frozen(T):
+    T = np.array(T, dtype=float)
+    T.setflags(write=False)
+    return T
+
+
+class TransformTree:
+    """
+    Frame-transform tree with memoized chains.
+    坐标系变换树：各坐标系只注册一次，任意两坐标系间的合成变换会被缓存。
+
+    每条边保存 T_parent_child（child 坐标系在 parent 坐标系下的位姿，即 x_parent = T_parent_child · x_child）。
+    `get(target, source)` 返回 T_target_source，沿最近公共祖先合成，结果缓存；
+    `set_transform()` 修改某条边时，只失效经过该边的缓存。
+
+    Example:
+        tree = make_umi_tree(T_robot_init)
+        T = tree.get("base", "sensor_init")
+        poses_in_base = tree.express(poses, "sensor_init", "base")        # (N,7) 批量变换
+        gripper_poses = tree.conjugate(vive_poses, "vive", "gripper")    # 参考系与刚体坐标系同时变换
+    """
+
+    def __init__(self):
+        self._parent: Dict[str, Optional[str]] = {}
+        self._edge: Dict[str, np.ndarray] = {}              # child -> T_parent_child
+        # (target, source) -> (T_target_source, edges used on the path)
+        self._cache: Dict[Tuple[str, str], Tuple[np.ndarray, frozenset]] = {}
+
+    # ======== Registration / 注册 ========
+    def add_frame(self, name: str) -> None:
+        """Register a root frame (no parent). / 注册一个根坐标系。"""
+        self._parent.setdefault(name, None)
+
+    def set_transform(self, parent: str, child: str, T) -> None:
+        """
+        Register or update the edge T_parent_child.
+        注册或更新边 T_parent_child；每个坐标系只能有一个父坐标系。
+        """
+        T = np.asarray(T, dtype=float)
+        if T.shape != (4, 4):
+            raise ValueError(f"T must be (4,4), got {T.shape}")
+        if parent == child:
+            raise ValueError("parent and child must be different frames")
+        old_parent = self._parent.get(child)
+        if old_parent is not None and old_parent != parent:
+            raise ValueError(f"frame '{child}' already has parent '{old_parent}'")
+        if child in self._ancestors(parent):
+            raise ValueError(f"adding '{parent}' -> '{child}' would create a cycle")
+
+        self.add_frame(parent)
+        self._parent[child] = parent
+        self._edge[child] = _frozen(T)
+        # 只失效经过这条边的缓存
+        self._cache = {k: v for k, v in self._cache.items() if child not in v[1]}
+
+    @property
+    def frames(self) -> List[str]:
+        return list(self._parent)
+
+    # ======== Query / 查询 ========
+    def _ancestors(self, frame: str) -> List[str]:
+        '''[frame, parent, grandparent, ..., root]'''
+        if frame not in self._parent:
+            return []
+        chain = [frame]
+        parent = self._parent[frame]
+        while parent is not None:
+            chain.append(parent)
+            parent = self._parent[parent]
+        return chain
+
+    def _down(self, ancestor: str, frame: str) -> np.ndarray:
+        '''T_ancestor_frame'''
+        T = np.eye(4)
+        while frame != ancestor:
+            T = self._edge[frame] @ T
+            frame = self._parent[frame]
+        return T
+
+    def get(self, target: str, source: str) -> np.ndarray:
+        """
+        T_target_source: maps coordinates in `source` to coordinates in `target` (read-only, memoized).
+        返回 T_target_source（只读，已缓存）。
+        """
+        key = (target, source)
+        hit = self._cache.get(key)
+        if hit is not None:
+            return hit[0]
+        for name in (target, source):
+            if name not in self._parent:
+                raise KeyError(f"unknown frame '{name}', registered: {self.frames}")
+
+        up_target = self._ancestors(target)
+        up_source = self._ancestors(source)
+        common = next((f for f in up_source if f in set(up_target)), None)
+        if common is None:
+            raise ValueError(f"frames '{target}' and '{source}' are not connected")
+
+        T = _se3_inv(self._down(common, target)) @ self._down(common, source)
+        edges = frozenset(up_target[:up_target.index(common)] + up_source[:up_source.index(common)])
+        T = _frozen(T)
+        self._cache[key] = (T, edges)
+        return T
+
+    # ======== Batch transforms / 批量变换 ========
+    @staticmethod
+    def _to_matrices(poses):
+        poses = np.asarray(poses, dtype=float)
+        if poses.shape[-2:] == (4, 4):
+            return poses.reshape(-1, 4, 4), True
+        return pose_quat_to_T(poses.reshape(-1, 7)), False
+
+    @staticmethod
+    def _from_matrices(M, as_matrix):
+        if as_matrix:
+            return M
+        return T_to_pose_quat(M)
+
+    def express(self, poses, source: str, target: str):
+        """
+        Re-express poses given in `source` in `target`: T_target_source @ P.
+        将 source 坐标系下的位姿批量表示到 target 坐标系下。
+
+        Args:
+            poses: (N,7) [x, y, z, qx, qy, qz, qw] or (N,4,4)
+        Returns:
+            same layout as the input, (N,7) or (N,4,4)
+        """
+        M, as_matrix = self._to_matrices(poses)
+        return self._from_matrices(self.get(target, source) @ M, as_matrix)
+
+    def conjugate(self, poses, source: str, target: str):
+        """
+        Change both the reference and the body frame: T_target_source @ P @ T_source_target.
+        参考系与刚体坐标系同时变换（如 VIVE → Gripper 转换链）。
+        """
+        M, as_matrix = self._to_matrices(poses)
+        return self._from_matrices(self.get(target, source) @ M @ self.get(source, target), as_matrix)
+
+
+def _translation(d):
+    T = np.eye(4)
+    T[:3, 3] = d
+    return T
+
+
+def make_umi_tree(T_robot_init=None, T_base_tcp=None) -> TransformTree:
+    """
+    Tree with the UMI / robot frames used by the replay tools.
+    构建回放工具使用的默认坐标系树。
+
+    Frames / 坐标系:
+        base -> sensor_init   T_robot_init：传感器零点（回家位姿时的 TCP）在基座系下的位姿
+        base -> tcp           当前 TCP 位姿（可随时 set_transform 更新）
+        gripper -> xv -> vive_flat -> vive
+                              VIVE → VIVE_FLAT → XV → Gripper 标定链（常量）
+    """
+    tree = TransformTree()
+    tree.add_frame("base")
+    tree.set_transform("base", "sensor_init", np.eye(4) if T_robot_init is None else T_robot_init)
+    tree.set_transform("base", "tcp", np.eye(4) if T_base_tcp is None else T_base_tcp)
+
+    # VIVE → VIVE_FLAT：绕 x 轴 30°
+    T_flat_vive = np.eye(4)
+    T_flat_vive[:3, :3] = euler_to_matrix(np.deg2rad([30.0, 0.0, 0.0]))
+    tree.set_transform("vive_flat", "vive", T_flat_vive)
+    # VIVE_FLAT → XV：left_right, front_back, up_down = 0.02220, -0.04020, -0.01003
+    tree.set_transform("xv", "vive_flat", np.array([
+        [1, 0, 0, 0],
+        [0, 0, 1, 0],
+        [0, -1, 0, 0],
+        [0, 0, 0, 1]
+    ], dtype=float) @ _translation([-0.02220, 0.04020, -0.01003]))
+    # XV → Gripper：left_right, front_back, up_down = 0.02268, 0.08745, 0.09240
+    tree.set_transform("gripper", "xv", np.array([
+        [0, 0, 1, 0],
+        [-1, 0, 0, 0],
+        [0, -1, 0, 0],
+        [0, 0, 0, 1]
+    ], dtype=float) @ _translation([-0.02268, -0.09240, -0.08745]))
+    return tree
+
+
+def _umi_calibration() -> Tuple[np.ndarray, np.ndarray]:
+    tree = make_umi_tree()
+    return tree.get("gripper", "vive"), tree.get("vive", "gripper")
+
+
+# VIVE → Gripper 常量标定链的合成变换（只读数组）；不保留可被修改的模块级坐标系树
+T_GRIPPER_VIVE, T_VIVE_GRIPPER = _umi_calibration()
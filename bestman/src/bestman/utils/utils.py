@@ -1,23 +1,25 @@
 
+import numpy as np
 from scipy.spatial.transform import Rotation as R
 
-import numpy as np
+from .conversions import (
+    matrix_to_euler,
+    matrix_to_quat,
+    pose_euler_to_T,
+    pose_quat_to_T,
+    quat_to_matrix,
+)
+from .traj_cache import load_tum
+from .transform_tree import T_GRIPPER_VIVE, T_VIVE_GRIPPER
+
+# UMI clamp width upper bound (mm)
+MAX_CLAMP_WIDTH = 88
 
 def quat2T(qpose):
-    pos = qpose[:3]
-    rot_matrix = R.from_quat(qpose[3:7]).as_matrix()
-    T = np.eye(4)
-    T[:3, :3] = rot_matrix
-    T[:3, 3] = pos
-    return T
+    return pose_quat_to_T(np.asarray(qpose, dtype=float)[:7])
 
 def rpy2T(pose):
-    pos = pose[:3]
-    rot_matrix = R.from_euler('xyz', pose[3:]).as_matrix()
-    T = np.eye(4)
-    T[:3, :3] = rot_matrix
-    T[:3, 3] = pos
-    return T
+    return pose_euler_to_T(np.asarray(pose, dtype=float)[:6])
 
 
 def map_sensor_to_robot(x, y, z, qx, qy, qz, qw, T_robot_init,degrees=False):
@@ -28,13 +30,64 @@ def map_sensor_to_robot(x, y, z, qx, qy, qz, qw, T_robot_init,degrees=False):
     
    
     pos_final = T_final[:3, 3]
-    euler_final = R.from_matrix(T_final[:3, :3]).as_euler('xyz', degrees=degrees)
+    euler_final = matrix_to_euler(T_final[:3, :3])
+    if degrees:
+        euler_final = np.degrees(euler_final)
     
     return list(pos_final)+list( euler_final)
 
 
+def map_sensor_to_robot_batch(poses, T_robot_init, degrees=False):
+    '''
+    batch version of map_sensor_to_robot
+    批量版本：一次变换整条轨迹
+
+    Args:
+        poses: (N,7) [x, y, z, qx, qy, qz, qw]
+        T_robot_init: (4,4)
+    Returns:
+        (N,6) [x, y, z, roll, pitch, yaw]
+    '''
+    poses = np.asarray(poses, dtype=float).reshape(-1, 7)
+    T_robot_init = np.asarray(T_robot_init, dtype=float)
+
+    rot_init = T_robot_init[:3, :3]
+    rot_final = rot_init @ quat_to_matrix(poses[:, 3:7])                        # (N,3,3)
+    pos_final = poses[:, :3] @ rot_init.T + T_robot_init[:3, 3]
+
+    out = np.empty((len(poses), 6))
+    out[:, :3] = pos_final
+    matrix_to_euler(rot_final, out=out[:, 3:])
+    if degrees:
+        np.degrees(out[:, 3:], out=out[:, 3:])
+    return out
 
 
+def align_clamp_widths(clamp_timestamps, clamp_widths, pose_timestamps, max_width=MAX_CLAMP_WIDTH):
+    '''
+    nearest-timestamp clamp width for every pose, O((N+M)logM)
+    为每个位姿按最近时间戳匹配夹爪宽度（排序二分查找），结果与逐点 argmin 一致
+    '''
+    clamp_timestamps = np.asarray(clamp_timestamps, dtype=float)
+    clamp_widths = np.asarray(clamp_widths, dtype=float)
+    pose_timestamps = np.asarray(pose_timestamps, dtype=float)
+
+    if np.any(clamp_timestamps[1:] < clamp_timestamps[:-1]):
+        # stable: ties keep file order, same as argmin picking the first one
+        order = np.argsort(clamp_timestamps, kind='stable')
+        clamp_timestamps = clamp_timestamps[order]
+        clamp_widths = clamp_widths[order]
+
+    right = np.searchsorted(clamp_timestamps, pose_timestamps, side='left')
+    right = np.clip(right, 0, len(clamp_timestamps) - 1)
+    left = np.clip(right - 1, 0, None)
+    # first sample of a run of duplicated timestamps
+    left = np.searchsorted(clamp_timestamps, clamp_timestamps[left], side='left')
+
+    use_right = np.abs(clamp_timestamps[right] - pose_timestamps) < np.abs(clamp_timestamps[left] - pose_timestamps)
+    idx = np.where(use_right, right, left)
+    return np.clip(clamp_widths[idx], 0, max_width)
+
 
 
 
@@ -63,12 +116,13 @@ from scipy.spatial.transform import Rotation as R
 
 def load_trajectory(
     traj_path: str,
-    clamp_path: str
+    clamp_path: str,
+    use_cache: bool = True,
 ) :
     '''read traj(x,y,z,qx,qy,qz,qw) and clamp width'''
     try:
-        raw_clamp = np.loadtxt(clamp_path)
-        raw_pose = np.loadtxt(traj_path)
+        raw_clamp = load_tum(clamp_path, use_cache=use_cache)
+        raw_pose = load_tum(traj_path, use_cache=use_cache)
         pose_timestamps = raw_pose[:,0]
         raw_pose = raw_pose[:,1:]
     except Exception as e:
@@ -76,68 +130,65 @@ def load_trajectory(
     return raw_pose, raw_clamp, pose_timestamps
 
 def transform_traj(raw_pose, raw_clamp, pose_timestamps, T_robot_init):
-    '''unit:mm'''
-    target_poses = []   
-    target_clamp_widths=[]
-    
-    clamp_timestamps = raw_clamp[:,0]
-    umi_clamp_widths = raw_clamp[:,-1]
-
-    for i,(p, pose_ts) in enumerate(zip(raw_pose,pose_timestamps)):
-
-        idx = np.abs(clamp_timestamps - pose_ts).argmin()
-        real_width = np.clip(umi_clamp_widths[idx], 0, 88)
-        target_clamp_widths.append(real_width)
-        
-        target_poses.append(map_sensor_to_robot(*p,T_robot_init=T_robot_init))
-
+    '''
+    unit:mm
+    Returns:
+        target_poses: (N,6) [x, y, z, roll, pitch, yaw]
+        target_clamp_widths: (N,) clipped to [0, MAX_CLAMP_WIDTH]
+    '''
+    target_clamp_widths = align_clamp_widths(raw_clamp[:,0], raw_clamp[:,-1], pose_timestamps)
+    target_poses = map_sensor_to_robot_batch(raw_pose, T_robot_init)
     return target_poses, target_clamp_widths
 
-def transform_to_base_quat(x, y, z, qx, qy, qz, qw, T_base_to_local,dgrees=False):
-    '''transform the pose of fastumi to robot base
-        unit:m
-    '''
-    rotation_local = R.from_quat([qx, qy, qz, qw]).as_matrix()
-    T_local = np.eye(4)
-    T_local[:3, :3] = rotation_local
-    T_local[:3, 3] = [x, y, z]
+def transform_vive_to_gripper(qpos, tree=None):
+    """
+    完整转换链：VIVE → VIVE_FLAT → XV → Gripper
     
-    T_base_r = np.matmul(T_local[:3, :3] , T_base_to_local[:3, :3] )
+    参数：
+        qpos: list or array, [x, y, z, qx, qy, qz, qw]
+        tree: 提供 vive / gripper 坐标系的 TransformTree，None 时使用默认标定链
     
-    x_base, y_base, z_base = T_base_to_local[:3, 3] + T_local[:3, 3]
-    rotation_base = R.from_matrix(T_base_r)
-    roll_base, pitch_base, yaw_base = rotation_base.as_euler('xyz', degrees=dgrees)
-    return x_base, y_base, z_base,  roll_base, pitch_base, yaw_base
-
-
+    返回：
+        list, [x, y, z, qx, qy, qz, qw] in Gripper coordinate
+    """
+    return list(transform_vive_to_gripper_batch(qpos, tree)[0])
 
 
+def _vive_to_gripper_operator(tree=None):
+    """
+    VIVE → VIVE_FLAT → XV → Gripper 三个阶段均为共轭变换 M' = L·M·L⁻¹，
+    合成算子 C = T_gripper_vive，返回 (C, C⁻¹)。
+    tree 为 None 时使用默认标定链的只读常量，否则由传入的坐标系树合成（树内缓存）。
+    """
+    if tree is None:
+        return T_GRIPPER_VIVE, T_VIVE_GRIPPER
+    return tree.get("gripper", "vive"), tree.get("vive", "gripper")
 
 
-def transform_vive_to_gripper(qpos):
+def transform_vive_to_gripper_batch(qposes, tree=None):
     """
-    完整转换链：VIVE → VIVE_FLAT → XV → Gripper
+    批量转换链：VIVE → VIVE_FLAT → XV → Gripper，一次向量化计算
     
     参数：
-        qpos: list or array, [x, y, z, qx, qy, qz, qw]
+        qposes: (N,7) or (7,), [x, y, z, qx, qy, qz, qw]
+        tree: 提供 vive / gripper 坐标系的 TransformTree，None 时使用默认标定链
     
     返回：
-        list, [x, y, z, qx, qy, qz, qw] in Gripper coordinate
+        (N,7) ndarray, [x, y, z, qx, qy, qz, qw] in Gripper coordinate
     """
-    # 定义 VIVE 到 VIVE_FLAT 的变换
-    TRANSFORMATION = np.eye(4)
-    TRANSFORMATION[:3, :3] = R.from_euler('xyz', [30, 0, 0], degrees=True).as_matrix()
-    
-    # VIVE → VIVE_FLAT
-    qpos = VIVE2VIVE_FLAT(qpos, TRANSFORMATION)
-    
-    # VIVE_FLAT → XV
-    qpos = VIVEFLAT2XV(qpos)
-    
-    # XV → Gripper
-    qpos = XV2Gripper(qpos)
-    
-    return qpos
+    qposes = np.asarray(qposes, dtype=float).reshape(-1, 7)
+    C, C_inv = _vive_to_gripper_operator(tree)
+
+    rot = quat_to_matrix(qposes[:, 3:7])                               # (N,3,3)
+    rot_out = C[:3, :3] @ rot @ C_inv[:3, :3]
+    pos_out = (rot @ C_inv[:3, 3] + qposes[:, :3]) @ C[:3, :3].T + C[:3, 3]
+
+    out = np.empty_like(qposes)
+    out[:, :3] = pos_out
+    matrix_to_quat(rot_out, out=out[:, 3:])
+    return out
+
+
 def VIVE2VIVE_FLAT(qpos, TRANSFORMATION):
     """
     qpos : x y z qx qy qz qw
@@ -0,0 +1,12 @@
+"""Robot stubs shared by the tests. / 测试共用的机器人桩。"""
+from bestman.robots import BaseRobot
+
+
+def _not_implemented(*args, **kwargs):
+    raise NotImplementedError
+
+
+# 所有抽象接口都抛出 NotImplementedError 的机器人桩，测试只覆盖用到的接口
+StubRobot = type(BaseRobot)("StubRobot", (BaseRobot,), {
+    name: _not_implemented for name in BaseRobot.__abstractmethods__
+})
@@ -0,0 +1,99 @@
+"""Tests for `bestman.robots.aio`."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from bestman.robots import BaseRobot
+
+from ._stubs import StubRobot
+
+
+class Config:
+    initial_joints = [0.0] * 6
+
+
+class MovingRobot(StubRobot):
+    """Simulated 0.3 s motions on a background thread. / 后台线程模拟 0.3 s 的运动。"""
+
+    def __init__(self, motion_time=0.3):
+        super().__init__(config=Config())
+        self.motion_time = motion_time
+        self.stopped = threading.Event()
+        self.finished = 0
+        self._moving = False
+
+    def move_to_joint_positions(self, joint_positions, is_radian=False, wait=True):
+        self._moving = True
+
+        def motion():
+            if not self.stopped.wait(self.motion_time):
+                self.finished += 1
+            self._moving = False
+
+        thread = threading.Thread(target=motion)
+        thread.start()
+        if wait:
+            thread.join()
+        return True
+
+    def get_joint_positions(self):
+        return [0.0] * 6
+
+    def is_moving(self):
+        return self._moving
+
+    def stop_motion(self):
+        self.stopped.set()
+
+
+class BlockingRobot(MovingRobot):
+    is_moving = BaseRobot.is_moving
+    stop_motion = BaseRobot.stop_motion
+
+
+def test_calls_overlap_on_the_executor():
+    robot = MovingRobot()
+
+    async def main():
+        async with robot.aio() as r:
+            t0 = time.perf_counter()
+            moved, joints = await asyncio.gather(r.move_to_joint_positions([0.1] * 6), r.get_joint_positions())
+            return time.perf_counter() - t0, moved, joints
+
+    elapsed, moved, joints = asyncio.run(main())
+    assert moved is True and joints == [0.0] * 6
+    assert robot.finished == 1
+    assert 0.25 < elapsed < 1.0
+
+
+def test_cancelling_a_waited_motion_stops_the_arm():
+    robot = MovingRobot(motion_time=5.0)
+
+    async def main():
+        async with robot.aio() as r:
+            assert r.cancellable
+            task = asyncio.create_task(r.go_home())
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    t0 = time.perf_counter()
+    asyncio.run(main())
+    assert robot.stopped.is_set()
+    assert robot.finished == 0
+    assert time.perf_counter() - t0 < 2.0
+
+
+def test_without_motion_status_falls_back_to_blocking_call():
+    robot = BlockingRobot(motion_time=0.05)
+
+    async def main():
+        async with robot.aio() as r:
+            assert not r.cancellable
+            return await r.move_to_joint_positions([0.1] * 6, wait=True)
+
+    assert asyncio.run(main()) is True
+    assert robot.finished == 1
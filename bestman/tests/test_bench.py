@@ -0,0 +1,69 @@
+"""Tests for `bestman.robots.bench` and the `bestman bench` CLI."""
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from bestman.cli import app
+from bestman.robots import load_robot_config, make_robot_from_config
+from bestman.robots.bench import format_result, format_table, run_benchmarks, summarize
+from bestman.robots.sim import SimConfig
+
+TEMPLATE = Path(__file__).parents[1] / "assets" / "configs" / "xarm6_template.yaml"
+
+SIM_YAML = """
+robot:
+  type: sim
+  id: bench-sim
+  time_scale: 2.0
+"""
+
+
+def test_load_robot_config_nested_and_flat(tmp_path):
+    nested = tmp_path / "nested.yaml"
+    nested.write_text(SIM_YAML)
+    flat = tmp_path / "flat.yaml"
+    flat.write_text("type: xarm\ndof: 7\nbackend: fake\ninitial_joints: [0, 0, 0, 0, 0, 0, 0]\n")
+    config = load_robot_config(nested)
+    assert isinstance(config, SimConfig) and config.id == "bench-sim" and config.time_scale == 2.0
+    xarm = load_robot_config(flat)
+    assert xarm.type == "xarm" and xarm.backend == "fake" and xarm.dof == 7
+
+
+def test_load_shipped_xarm_template():
+    config = load_robot_config(TEMPLATE)
+    assert config.type == "xarm" and config.dof == 6
+    assert config.sdk_kwargs["port"] == "192.168.1.224"
+
+
+def test_summarize_empty_is_json_null():
+    summary = summarize([])
+    assert summary["count"] == 0 and summary["p99"] is None
+    assert json.loads(json.dumps(summary, allow_nan=False))["mean"] is None
+    assert "-" in format_table({"empty": summary}, "method").splitlines()[1]
+
+
+def test_run_benchmarks_on_sim():
+    with make_robot_from_config(SimConfig(call_duration=1e-4)) as robot:
+        results = run_benchmarks(robot, ["servo", "latency", "state", "replay"], duration=0.05, calls=10, rate_hz=200)
+    servo = results["results"]["servo"]["servo_to_joint_positions"]
+    assert servo["failed"] == 0 and 0 < servo["rate_hz"] < 1e4
+    assert results["results"]["latency"]["get_ee_pose"]["count"] == 10
+    assert results["results"]["latency"]["set_mode"]["count"] == 20
+    replay = results["results"]["replay"]
+    assert replay["ticks"] == 10 and replay["sent"] + replay["dropped"] >= 10
+    assert results["environment"]["robot_type"] == "sim"
+    for name, result in results["results"].items():
+        assert "p99 us" in format_result(name, result)
+
+
+def test_cli_bench_writes_json(tmp_path):
+    config = tmp_path / "sim.yaml"
+    config.write_text(SIM_YAML)
+    output = tmp_path / "out" / "bench.json"
+    result = CliRunner().invoke(app, ["bench", "state", str(config), "--duration", "0.02", "-o", str(output)])
+    assert result.exit_code == 0, result.output
+    assert "get_joint_positions" in result.output
+    data = json.loads(output.read_text())
+    assert data["parameters"] == {"duration": 0.02}
+    assert data["results"]["state"]["get_ee_pose"]["rate_hz"] > 0
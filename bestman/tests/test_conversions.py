@@ -0,0 +1,69 @@
+"""Closed-form conversion kernels checked against scipy."""
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+
+from bestman.robots.utils.math_utils import compensate_tcp_for_gripper, pose_to_euler
+from bestman.utils import conversions as cv
+from bestman.utils.utils import quat2T, rpy2T
+
+
+def _canonical(q):
+    return q * np.where(q[..., 3:] < 0, -1.0, 1.0)
+
+
+@pytest.fixture
+def rot():
+    return R.random(500, random_state=7)
+
+
+def test_batch_matches_scipy(rot):
+    q, M, e, v = rot.as_quat(), rot.as_matrix(), rot.as_euler("xyz"), rot.as_rotvec()
+    np.testing.assert_allclose(cv.quat_to_matrix(q), M, atol=1e-12)
+    np.testing.assert_allclose(cv.matrix_to_quat(M), _canonical(q), atol=1e-12)
+    np.testing.assert_allclose(cv.euler_to_matrix(e), M, atol=1e-12)
+    np.testing.assert_allclose(cv.matrix_to_euler(M), e, atol=1e-9)
+    np.testing.assert_allclose(_canonical(cv.euler_to_quat(e)), _canonical(q), atol=1e-12)
+    np.testing.assert_allclose(cv.quat_to_euler(q), e, atol=1e-9)
+    np.testing.assert_allclose(cv.quat_to_rotvec(q), v, atol=1e-12)
+    np.testing.assert_allclose(cv.rotvec_to_matrix(v), M, atol=1e-12)
+
+
+def test_single_matches_batch_and_writes_out(rot):
+    q, M, e = rot.as_quat(), rot.as_matrix(), rot.as_euler("xyz")
+    for i in range(20):
+        np.testing.assert_allclose(cv.quat_to_matrix(q[i]), M[i], atol=1e-12)
+        np.testing.assert_allclose(cv.matrix_to_quat(M[i]), _canonical(q[i]), atol=1e-12)
+        np.testing.assert_allclose(cv.matrix_to_euler(M[i]), e[i], atol=1e-9)
+        np.testing.assert_allclose(cv.euler_to_matrix(e[i]), M[i], atol=1e-12)
+
+    out = np.empty((len(q), 3))
+    assert cv.quat_to_euler(q, out=out) is out
+    with pytest.raises(ValueError):
+        cv.quat_to_matrix(q, out=np.empty((3, 3)))
+
+
+def test_gimbal_lock_and_small_angles():
+    locked = R.from_euler("xyz", [[0.3, np.pi / 2, 0.2], [0.3, -np.pi / 2, -0.4]])
+    with pytest.warns(UserWarning):
+        expected = locked.as_euler("xyz")
+    np.testing.assert_allclose(cv.matrix_to_euler(locked.as_matrix()), expected, atol=1e-6)
+    np.testing.assert_allclose(cv.matrix_to_euler(locked.as_matrix()[0]), expected[0], atol=1e-6)
+
+    tiny = np.array([1e-9, -2e-9, 3e-9])
+    np.testing.assert_allclose(cv.rotvec_to_matrix(tiny), R.from_rotvec(tiny).as_matrix(), atol=1e-15)
+    np.testing.assert_allclose(cv.quat_to_rotvec(R.from_rotvec(tiny).as_quat()), tiny, atol=1e-15)
+
+
+def test_existing_helpers_unchanged(rot):
+    pose = np.r_[0.1, -0.2, 0.3, rot.as_quat()[0]]
+    T = np.eye(4)
+    T[:3, :3], T[:3, 3] = rot[0].as_matrix(), pose[:3]
+    np.testing.assert_allclose(quat2T(pose), T, atol=1e-12)
+    np.testing.assert_allclose(rpy2T(np.r_[pose[:3], rot[0].as_euler("xyz")]), T, atol=1e-12)
+
+    qx, qy, qz, qw = pose[3:]
+    np.testing.assert_allclose(pose_to_euler([*pose[:3], qw, qx, qy, qz]),
+                               np.r_[pose[:3], rot[0].as_euler("xyz")], atol=1e-9)
+    x, y, z, _ = compensate_tcp_for_gripper(*pose[:3], pose[3:], 0.05)
+    np.testing.assert_allclose([x, y, z], pose[:3] - 0.05 * rot[0].as_matrix()[:, 2], atol=1e-12)
@@ -0,0 +1,146 @@
+"""Tests for `bestman.robots.xarm.fake_xarm` and the xArm driver on the fake backend."""
+import contextlib
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from bestman.robots import make_robot_from_config
+from bestman.robots.xarm import BestmanXarm, FakeXArmAPI, XArmConfig
+
+
+def _config(**fake_kwargs):
+    return XArmConfig(
+        dof=7, initial_joints=[0.0] * 7, tcp_offset=[0.0, 0.0, 100.0, 0.0, 0.0, 0.0],
+        backend="fake", fake_kwargs=fake_kwargs,
+    )
+
+
+def test_config_backend():
+    assert _config().sdk_kwargs["port"] == "fake"     # fake 后端不需要 port
+    with pytest.raises(ValueError):
+        XArmConfig(dof=7, initial_joints=[0.0] * 7, backend="mock")
+
+
+def test_connect_sequence_and_latency():
+    robot = make_robot_from_config(_config(latency=0.002, settle_time=0.02))
+    assert isinstance(robot, BestmanXarm)
+    t0 = time.perf_counter()
+    robot.connect()
+    elapsed = time.perf_counter() - t0
+    assert isinstance(robot.arm, FakeXArmAPI)
+    assert robot.arm.call_counts == {
+        "clean_warn": 1, "clean_error": 1, "set_tcp_offset": 1, "motion_enable": 1, "set_mode": 1,
+    }
+    assert elapsed >= 5 * 0.002 + 0.02
+    robot.disconnect()
+    assert not robot.arm.connected
+
+
+def test_servo_and_modes():
+    robot = make_robot_from_config(_config())
+    robot.connect()
+    with pytest.raises(ValueError):
+        robot.servo_to_joint_positions([1.0] * 7)       # 仍在模式 0
+    assert robot.move_to_joint_positions([10.0] * 7, wait=True)
+    assert robot.get_joint_positions() == [10.0] * 7
+
+    with robot.servo_session("ee_pose", meters=True) as servo:
+        assert robot.mode == 1
+        assert servo.send([0.3, 0.0, 0.2, 180.0, 0.0, 0.0])
+    assert robot.mode == 0
+    np.testing.assert_allclose(robot.get_ee_pose(), [0.3, 0.0, 0.2, 180.0, 0.0, 0.0])
+
+    robot.set_mode(1)
+    assert robot.servo_to_joint_positions(np.deg2rad([5.0] * 7).tolist()) is True
+    assert robot.arm.call_counts["set_servo_angle_j"] == 1
+    robot.disconnect()
+
+
+def test_motion_time_and_stop():
+    robot = make_robot_from_config(_config(motion_time=0.5))
+    robot.connect()
+    robot.move_to_joint_positions([1.0] * 7, wait=False)
+    assert robot.is_moving()
+    robot.stop_motion()
+    assert not robot.is_moving()
+    robot.disconnect()
+
+
+def test_observation_reads_sdk_state_into_buffers(monkeypatch):
+    robot = make_robot_from_config(_config())
+    robot.connect()
+    robot.move_to_joint_positions([10.0] * 7, wait=True)
+    robot.move_to_ee_pose([0.3, 0.0, 0.2, 180.0, 0.0, 0.0], wait=True)
+    # 观测直接读取 SDK 缓存，不经过（可能被钩子包裹的）get_* 接口
+    monkeypatch.setattr(robot, "get_joint_positions", None)
+    obs = robot.get_observation()
+    assert obs["joint_pos"].dtype == np.float32
+    np.testing.assert_allclose(obs["joint_pos"], [10.0] * 7)
+    np.testing.assert_allclose(obs["eef_pos"], [0.3, 0.0, 0.2, 180.0, 0.0, 0.0], rtol=1e-6)
+    np.testing.assert_allclose(robot.get_ee_pose(), obs["eef_pos"], rtol=1e-6)
+    assert np.isnan(obs["gripper_pos"])
+    assert robot.get_observation() is obs and robot.get_observation()["eef_pos"] is obs["eef_pos"]
+    assert robot.get_ee_pose() is not robot.get_ee_pose()
+    assert robot.arm.position[:3] == [300.0, 0.0, 200.0]       # SDK 列表未被修改
+
+
+class _ExclusiveFake(FakeXArmAPI):
+    """Fake controller that counts SDK accesses overlapping across threads. / 统计跨线程重叠访问的假控制器。"""
+
+    def __init__(self, *args, **kwargs):
+        self.overlaps = 0
+        self._owner = None
+        self._depth = 0
+        self._guard = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    @contextlib.contextmanager
+    def _access(self):
+        me = threading.get_ident()
+        with self._guard:
+            if self._owner not in (None, me):
+                self.overlaps += 1
+            self._owner = me
+            self._depth += 1
+        time.sleep(0.0002)
+        try:
+            yield
+        finally:
+            with self._guard:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._owner = None
+
+    def _rpc(self, name, extra=0.0):
+        with self._access():
+            super()._rpc(name, extra)
+
+    @property
+    def angles(self):
+        with self._access():
+            return self._angles
+
+    @angles.setter
+    def angles(self, value):
+        self._angles = value
+
+
+def test_commands_and_state_polling_do_not_overlap():
+    robot = make_robot_from_config(_config())
+    robot.connect()
+    robot.arm = _ExclusiveFake(dof=7)
+    robot.set_mode(1)
+    robot.start_state_cache(rate_hz=2000)
+    try:
+        sender = threading.Thread(target=lambda: [robot.servo_to_joint_positions([1.0] * 7) for _ in range(200)])
+        sender.start()
+        with robot.servo_session("joint_positions") as servo:
+            for _ in range(200):
+                servo.send([2.0] * 7)
+        sender.join()
+    finally:
+        robot.stop_state_cache()
+    assert robot.arm.call_counts["set_servo_angle_j"] == 400
+    assert robot.arm.overlaps == 0
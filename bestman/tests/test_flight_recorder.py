@@ -0,0 +1,64 @@
+"""Tests for `bestman.robots.flight_recorder`."""
+import numpy as np
+import pytest
+
+from bestman.robots.flight_recorder import load_flight_record
+
+from ._stubs import StubRobot
+
+
+class FaultyRobot(StubRobot):
+    def __init__(self):
+        super().__init__(config=None)
+        self.disconnected = False
+
+    def servo_to_ee_pose(self, pose):
+        if pose[0] > 1.0:
+            raise RuntimeError("workspace violation")
+        return True
+
+    def move_gripper(self, command):
+        return 0
+
+    def get_joint_positions(self):
+        return np.arange(6.0)
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def test_ring_keeps_latest_commands_in_order(tmp_path):
+    robot = FaultyRobot()
+    robot.start_flight_recorder(capacity=8, dump_dir=tmp_path)
+    for i in range(20):
+        robot.servo_to_ee_pose([i * 0.01, 0, 0, 0, 0, 0])
+    robot.move_gripper(0.5)
+    robot.get_joint_positions()
+
+    record = load_flight_record(robot.dump_flight_record())
+    cmds = record["commands"]
+    assert cmds["methods"][-1] == "move_gripper"
+    assert cmds["values"][-1, 0] == 0.5 and np.isnan(cmds["values"][-1, 1])
+    np.testing.assert_allclose(cmds["values"][:-1, 0], np.arange(13, 20) * 0.01)
+    assert np.all(np.diff(cmds["times"]) >= 0)
+    assert record["dropped"][0] == 13
+    np.testing.assert_array_equal(record["states"]["values"][0, :6], np.arange(6.0))
+    assert record["states"]["methods"] == ["get_joint_positions"]
+
+
+def test_dumps_on_exception_and_disconnect(tmp_path):
+    robot = FaultyRobot()
+    recorder = robot.start_flight_recorder(dump_dir=tmp_path)
+    robot.servo_to_ee_pose([0.5, 0, 0, 0, 0, 0])
+    with pytest.raises(RuntimeError):
+        robot.servo_to_ee_pose([2.0, 0, 0, 0, 0, 0])
+    record = load_flight_record(recorder.last_dump)
+    assert record["reason"] == "exception"
+    assert record["commands"]["status"].tolist() == [1.0, -np.inf]
+
+    robot.disconnect()
+    assert robot.disconnected
+    assert load_flight_record(recorder.last_dump)["reason"] == "disconnect"
+
+    robot.stop_flight_recorder()
+    assert "servo_to_ee_pose" not in robot.__dict__
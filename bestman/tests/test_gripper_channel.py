@@ -0,0 +1,44 @@
+"""Tests for `bestman.utils.replayer.gripper_channel`."""
+import time
+
+from bestman.utils.replayer.gripper_channel import GripperChannel
+
+
+def test_deadband_rate_limit_and_flush():
+    sent = []
+    with GripperChannel(sent.append, deadband=0.05, max_rate_hz=50) as channel:
+        channel.post(0.0)
+        time.sleep(0.01)
+        channel.post(0.01)          # inside the deadband
+        time.sleep(0.01)
+        for i in range(100):        # burst: only the latest values get through
+            channel.post(0.2 + i * 0.001)
+            time.sleep(0.0005)
+        channel.post(1.0)
+    assert sent[0] == 0.0 and sent[-1] == 1.0
+    assert 0.01 not in sent
+    assert len(sent) < 10
+    assert channel.skipped >= 1
+
+
+def test_deadband_rechecked_after_rate_limit_sleep():
+    sent = []
+    channel = GripperChannel(sent.append, deadband=0.05, max_rate_hz=5).start()
+    channel.post(0.0)
+    time.sleep(0.02)
+    channel.post(0.5)           # worker sleeps for the rate limit
+    time.sleep(0.05)
+    channel.post(0.01)          # newest value is back inside the deadband
+    time.sleep(0.3)
+    channel.close()
+    assert sent == [0.0]
+
+
+def test_close_without_flush_drops_pending_command():
+    sent = []
+    channel = GripperChannel(sent.append, deadband=0.01, max_rate_hz=5).start()
+    channel.post(0.0)
+    time.sleep(0.02)
+    channel.post(0.5)           # waiting for the rate limit
+    channel.close(flush=False)
+    assert sent == [0.0]
@@ -0,0 +1,86 @@
+"""Tests for `bestman.robots.group`."""
+import time
+
+import pytest
+
+from bestman.robots import RobotGroup, RobotGroupError
+
+from ._stubs import StubRobot
+
+
+class SlowRobot(StubRobot):
+    """Every SDK call takes `latency` seconds. / 每次 SDK 调用耗时 latency 秒。"""
+
+    def __init__(self, latency=0.02, fail_connect=False):
+        super().__init__(config=None)
+        self.latency = latency
+        self.fail_connect = fail_connect
+        self.connected = False
+        self.poses = []
+
+    def connect(self):
+        time.sleep(self.latency)
+        if self.fail_connect:
+            raise ConnectionError("no route to host")
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def move_gripper(self, command):
+        self.gripper = command
+        return True
+
+    def servo_to_ee_pose(self, pose):
+        time.sleep(self.latency)
+        self.poses.append(pose)
+        return True
+
+
+def test_members_are_commanded_concurrently():
+    group = RobotGroup({"left": SlowRobot(), "right": SlowRobot()})
+    with group:
+        assert all(r.connected for r in group.robots.values())
+        t0 = time.perf_counter()
+        for i in range(10):
+            tick = group.call_each("servo_to_ee_pose", {"left": [i], "right": [-i]})
+        elapsed = time.perf_counter() - t0
+    assert elapsed < 10 * 0.02 * 1.6          # sequential would be 2x
+    assert tick.results == {"left": True, "right": True}
+    assert group["left"].poses[-1] == [9] and group["right"].poses[-1] == [-9]
+    stats = group.stats()
+    assert stats["group_calls"] >= 10
+    assert 0 <= stats["start_skew_p50"] < 0.01
+    assert not group["left"].connected
+
+
+def test_run_streams_on_a_shared_time_base():
+    group = RobotGroup({"a": SlowRobot(0.001), "b": SlowRobot(0.001)})
+    ticks = ({"a": [i], "b": [i]} for i in range(20))
+    stats = group.run(ticks, rate_hz=100)
+    group.close()
+    assert stats["ticks"] == 20
+    assert len(group["a"].poses) == len(group["b"].poses) == 20
+
+
+def test_failed_connect_rolls_back():
+    group = RobotGroup({"ok": SlowRobot(), "bad": SlowRobot(fail_connect=True)})
+    with pytest.raises(ConnectionError, match="bad"):
+        group.connect()
+    assert not group["ok"].connected
+    assert group._members is None
+    with pytest.raises(RobotGroupError):
+        group.call_each("servo_to_ee_pose", {"ok": [0], "bad": None}, "extra-arg")
+    group.close()
+
+
+def test_shared_positional_argument_and_validation():
+    group = RobotGroup({"a": SlowRobot(0.001), "b": SlowRobot(0.001)})
+    tick = group.call("move_gripper", 0.5)
+    group.close()
+    assert tick.results == {"a": True, "b": True}
+    assert group["a"].gripper == group["b"].gripper == 0.5
+    with pytest.raises(KeyError):
+        group.call_each("move_gripper", {"c": 0.5})
+    with pytest.raises(TypeError, match="BaseRobot"):
+        RobotGroup({"a": object()})
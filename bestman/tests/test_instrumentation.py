@@ -0,0 +1,69 @@
+"""Tests for `bestman.robots.instrumentation`."""
+import json
+
+import pytest
+
+from bestman.robots import make_robot_from_config
+from bestman.robots.instrumentation import BUCKET_EDGES, LatencyHistogram
+from bestman.robots.sim import BestmanSim, SimConfig
+
+
+def _robot(**kwargs):
+    robot = make_robot_from_config(SimConfig(manual_clock=False, **kwargs))
+    robot.connect()
+    return robot
+
+
+def test_histogram_percentiles():
+    hist = LatencyHistogram()
+    for _ in range(99):
+        hist.record(10e-6)
+    hist.record(5e-3)
+    s = hist.summary()
+    assert s["count"] == 100 and s["max"] == 5e-3 and s["min"] == 10e-6
+    assert 10e-6 <= s["p50"] <= 10e-6 * 10 ** (1 / 10) + 1e-12
+    assert s["p99"] < 1e-4 and s["mean"] == pytest.approx((99 * 10e-6 + 5e-3) / 100)
+    assert LatencyHistogram().summary()["count"] == 0
+    hist.record(100.0)                                  # 上溢桶
+    assert hist.counts[len(BUCKET_EDGES)] == 1 and hist.percentile(100) == 100.0
+
+
+def test_instrumented_calls_and_zero_overhead_when_off():
+    robot = _robot(call_duration=0.002)
+    with pytest.raises(RuntimeError):
+        robot.stats()
+    robot.enable_instrumentation()
+    assert "servo_to_ee_pose" in robot.__dict__
+    for _ in range(5):
+        robot.get_joint_positions()
+    robot.servo_to_joint_positions(robot.get_joint_positions())
+    with pytest.raises(ValueError):
+        robot.servo_to_joint_positions([0.0])
+
+    stats = robot.stats()
+    assert stats["get_joint_positions"]["count"] == 6
+    assert stats["get_joint_positions"]["min"] >= 0.002
+    assert stats["servo_to_joint_positions"]["errors"] == 1
+    assert "move_to_ee_pose" not in stats               # 从未调用
+
+    robot.disable_instrumentation()
+    assert "servo_to_ee_pose" not in robot.__dict__
+    assert robot.servo_to_ee_pose.__func__ is BestmanSim.servo_to_ee_pose
+
+
+def test_reports_and_exporter(tmp_path):
+    robot = _robot()
+    inst = robot.enable_instrumentation(methods=["get_ee_pose"])
+    robot.get_ee_pose()
+    assert "get_ee_pose" in inst.report()
+    path = tmp_path / "stats.jsonl"
+    inst.export(interval=0.01, path=path, fmt="json")
+    robot.get_ee_pose()
+    robot.disable_instrumentation()                     # 停止导出器并写出最后一次
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records[-1]["methods"]["get_ee_pose"]["count"] == 2
+
+    idle = json.loads(robot.enable_instrumentation(methods=["get_ee_pose"]).report("json", include_idle=True))
+    assert idle["methods"]["get_ee_pose"]["count"] == 0
+    assert idle["methods"]["get_ee_pose"]["p99"] is None
+    robot.disable_instrumentation()
@@ -0,0 +1,67 @@
+"""Tests for `bestman.robots.observation`."""
+import numpy as np
+import pytest
+
+from bestman.robots.observation import ObservationBuffer, read_state_observation, state_observation_features
+
+
+class StubArm:
+    def __init__(self):
+        self.position = [300.0, 0.0, 200.0, 3.14, 0.0, 0.0]
+
+    def get_joint_positions(self):
+        return [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
+
+    def get_joint_velocities(self):
+        return np.zeros(6)
+
+    def get_ee_pose(self):
+        pose = np.array(self.position)
+        pose[:3] *= 1e-3
+        return pose
+
+    def get_gripper_position(self):
+        raise NotImplementedError
+
+
+def test_buffers_are_reused_and_match_schema():
+    robot = StubArm()
+    buf = ObservationBuffer(state_observation_features(6), dtype=np.float32)
+    read_state_observation(robot, buf)
+    obs = buf.get()
+    arrays = {k: v for k, v in obs.items()}
+
+    robot.position[0] = 400.0
+    read_state_observation(robot, buf)
+    again = buf.get()
+    assert again is obs
+    assert all(again[k] is arrays[k] for k in arrays)
+    assert again["eef_pos"][0] == pytest.approx(0.4)
+    assert again["joint_pos"].dtype == np.float32 and again["joint_pos"].shape == (6,)
+    assert np.isnan(again["gripper_pos"])
+    assert robot.position[0] == 400.0   # SDK list untouched
+
+
+def test_copy_detaches_from_buffers():
+    robot = StubArm()
+    buf = ObservationBuffer(state_observation_features(6))
+    read_state_observation(robot, buf)
+    saved = buf.get(copy=True)
+    robot.position[2] = 0.0
+    read_state_observation(robot, buf)
+    assert saved["eef_pos"][2] == pytest.approx(0.2)
+    assert buf.get()["eef_pos"][2] == 0.0
+
+
+def test_fill_rejects_wrong_length():
+    buf = ObservationBuffer(state_observation_features(6))
+    with pytest.raises(ValueError):
+        buf.fill("joint_pos", [0.0] * 7)
+
+
+def test_fill_head_copies_prefix_in_place():
+    buf = ObservationBuffer(state_observation_features(6))
+    joint_pos = buf.arrays["joint_pos"]
+    buf.fill_head("joint_pos", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+    assert buf.arrays["joint_pos"] is joint_pos
+    np.testing.assert_array_equal(joint_pos, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
@@ -0,0 +1,90 @@
+"""Tests for `bestman.robots.registry` (lazy plugin loading)."""
+import subprocess
+import sys
+from dataclasses import dataclass
+
+import draccus
+import pytest
+
+from bestman.robots import RobotConfig, make_robot_from_config, registry
+from bestman.robots.sim import BestmanSim, SimConfig
+
+
+@RobotConfig.register_subclass("plugin_sim")
+@dataclass(kw_only=True)
+class PluginSimConfig(SimConfig):
+    pass
+
+
+@RobotConfig.register_subclass("bad_sim")
+@dataclass(kw_only=True)
+class BadSimConfig(SimConfig):
+    pass
+
+
+class PluginSim(BestmanSim):
+    """Third-party driver registered only through an entry point (no @register_robot)."""
+
+
+def _fresh(code: str) -> str:
+    '''run code in a new interpreter so module import state is clean'''
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+
+def test_configs_load_without_drivers():
+    out = _fresh(
+        "import sys, draccus\n"
+        "from bestman.robots import RobotConfig\n"
+        "config = draccus.decode(RobotConfig, {'type': 'xarm', 'dof': 7, 'backend': 'fake'})\n"
+        "print(type(config).__name__, 'bestman.robots.xarm.bestman_xarm' in sys.modules)\n"
+        "from bestman.robots.startouch import StartouchConfig\n"
+        "print('bestman.robots.startouch.bestman_startouch' in sys.modules)\n"
+    )
+    assert out.split() == ["XArmConfig", "False", "False"]
+
+
+def test_driver_imported_by_factory():
+    out = _fresh(
+        "import sys, draccus\n"
+        "from bestman.robots import RobotConfig, make_robot_from_config\n"
+        "robot = make_robot_from_config(draccus.decode(RobotConfig, {'type': 'sim'}))\n"
+        "print(type(robot).__name__, 'bestman.robots.sim.bestman_sim' in sys.modules)\n"
+    )
+    assert out.split() == ["BestmanSim", "True"]
+
+
+def test_entry_points_extend_builtins(monkeypatch):
+    plugins = {
+        registry.CONFIG_GROUP: {"sim": "bestman.robots.sim.sim_config:SimConfig", "my_arm": "my_pkg.config:MyArm"},
+        registry.ROBOT_GROUP: {},
+    }
+    monkeypatch.setattr(registry, "_entry_points", plugins.__getitem__)
+    assert registry.available_robots() == ["my_arm", "sim", "startouch", "xarm"]
+    assert registry.load_config_class("sim").__name__ == "SimConfig"
+    with pytest.raises(ModuleNotFoundError):
+        registry.load_config_class("my_arm")
+    with pytest.raises(KeyError):
+        registry.load_robot_class("no_such_robot")
+    with pytest.raises(draccus.ParsingError):
+        draccus.decode(RobotConfig, {"type": "no_such_robot"})
+
+
+def test_entry_point_driver_without_register_robot(monkeypatch):
+    plugins = {
+        registry.CONFIG_GROUP: {"plugin_sim": f"{__name__}:PluginSimConfig"},
+        registry.ROBOT_GROUP: {"plugin_sim": f"{__name__}:PluginSim", "bad_sim": f"{__name__}:PluginSimConfig"},
+    }
+    monkeypatch.setattr(registry, "_entry_points", plugins.__getitem__)
+    assert type(make_robot_from_config(PluginSimConfig())) is PluginSim
+    with pytest.raises(TypeError, match="not a BaseRobot subclass"):
+        make_robot_from_config(BadSimConfig())
+
+
+def test_lazy_exports():
+    out = _fresh(
+        "import sys\n"
+        "import bestman.robots.sim as sim\n"
+        "print('bestman.robots.sim.bestman_sim' in sys.modules, sim.BestmanSim.__name__)\n"
+        "print(hasattr(sim, 'Missing'))\n"
+    )
+    assert out.split() == ["False", "BestmanSim", "False"]
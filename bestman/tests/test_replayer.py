@@ -0,0 +1,115 @@
+"""Tests for `bestman.utils.replayer.TrajReplayer`."""
+import time
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+
+from bestman.utils import TrajReplayer, rpy2T
+from bestman.utils.replayer import replayer as replayer_module
+from bestman.utils.replayer.sinks import NullSink
+
+
+@pytest.fixture
+def session_dir(tmp_path):
+    n = 200
+    ts = 1000.0 + np.arange(n) * 0.005
+    (tmp_path / "Merged_Trajectory").mkdir()
+    (tmp_path / "Clamp_Data").mkdir()
+    np.savetxt(
+        tmp_path / "Merged_Trajectory" / "merged_trajectory.txt",
+        np.column_stack([ts, np.random.default_rng(0).normal(size=(n, 3)), R.random(n, random_state=0).as_quat()]),
+    )
+    np.savetxt(tmp_path / "Clamp_Data" / "clamp_data_tum.txt", np.column_stack([ts[::4], np.linspace(0, 88, n // 4)]))
+    return tmp_path
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_dry_run_records_every_command(session_dir, stream):
+    T_robot_init = rpy2T([0.3, 0.0, 0.2, np.pi, 0.0, 0.0])
+    replayer = TrajReplayer()
+    replayer.load_data(session=session_dir, stream=stream, chunk_size=64)
+    replayer.transform_traj(T_robot_init)
+    stats = replayer.replay(interval=3, dry_run=True, realtime=False, async_gripper=False)
+
+    commands = replayer.dry_run_sink.commands()
+    assert stats["commands"] == {"servo": 67, "gripper": 67}
+    assert "pipeline" in stats["timings"] and "tick_p99" in stats["timings"]
+
+    reference = TrajReplayer()
+    reference.load_data(session=session_dir)
+    reference.transform_traj(T_robot_init)
+    np.testing.assert_allclose(commands["servo_poses"], reference.target_pose[::3], atol=1e-9)
+    np.testing.assert_allclose(commands["gripper_commands"], reference.target_clamp_width[::3] / 88)
+
+
+def test_dry_run_resampled_realtime(session_dir):
+    replayer = TrajReplayer()
+    replayer.load_data(session=session_dir)
+    replayer.transform_traj(np.eye(4))
+    stats = replayer.replay(speed_rate=5.0, rate_hz=100.0, dry_run=True)
+
+    servo_times = replayer.dry_run_sink.commands()["servo_times"]
+    assert stats["commands"]["servo"] == len(servo_times) == 20
+    assert np.median(np.diff(servo_times)) == pytest.approx(0.01, abs=1e-3)
+
+
+def test_load_data_without_root_uses_default_directory(session_dir, monkeypatch):
+    calls = []
+
+    def select(*args):
+        calls.append(args)
+        return session_dir.parent
+
+    monkeypatch.setattr(replayer_module, "select_multi_sessions_dir", select)
+    monkeypatch.setattr(replayer_module, "select_session_subdir", lambda root: session_dir)
+    replayer = TrajReplayer()
+    replayer.load_data()
+    assert calls == [()] and len(replayer.pose_timestamps) == 200
+
+
+def test_dry_run_without_recording(session_dir):
+    replayer = TrajReplayer()
+    replayer.load_data(session=session_dir)
+    replayer.transform_traj(np.eye(4))
+    stats = replayer.replay(interval=3, dry_run=True, realtime=False, record=False)
+    assert isinstance(replayer.dry_run_sink, NullSink)
+    assert stats["commands"]["servo"] == 67
+
+
+@pytest.mark.parametrize("rate_hz", [None, 100.0])
+def test_empty_trajectory_replays_nothing(rate_hz):
+    replayer = TrajReplayer()
+    replayer.stream = False
+    replayer.timings = {}
+    replayer.pose_timestamps = np.zeros(0)
+    replayer.target_pose = np.zeros((0, 6))
+    replayer.target_clamp_width = np.zeros(0)
+    stats = replayer.replay(rate_hz=rate_hz, dry_run=True, realtime=False)
+    assert stats["commands"] == {"servo": 0, "gripper": 0}
+
+
+def test_abort_drops_queued_gripper_command(session_dir):
+    class FailingRobot:
+        def __init__(self):
+            self.gripper = []
+            self.servo = 0
+
+        def servo_to_ee_pose(self, pose):
+            self.servo += 1
+            if self.servo == 3:
+                time.sleep(0.05)              # 第一条夹爪指令已发出，第二条在等待限频
+                raise RuntimeError("controller fault")
+            return True
+
+        def move_gripper(self, command):
+            self.gripper.append(command)
+            return True
+
+    robot = FailingRobot()
+    replayer = TrajReplayer(robot)
+    replayer.load_data(session=session_dir)
+    replayer.transform_traj(np.eye(4))
+    with pytest.raises(RuntimeError, match="controller fault"):
+        replayer.replay(realtime=False, gripper_deadband=0.0, gripper_rate_hz=1.0)
+    assert len(robot.gripper) == 1            # 之后排队的指令不会再发送
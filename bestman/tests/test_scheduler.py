@@ -0,0 +1,30 @@
+"""Tests for `bestman.robots.scheduler`."""
+import time
+
+import pytest
+
+from bestman.robots.scheduler import RealtimeScheduler, ScheduleLagError
+
+
+@pytest.mark.parametrize("policy", ["drop", "stretch", "abort"])
+def test_lag_policies(policy):
+    scheduler = RealtimeScheduler(lag_policy=policy, max_lag=0.005)
+    assert scheduler.wait(0.002)
+    time.sleep(0.03)
+    if policy == "abort":
+        with pytest.raises(ScheduleLagError):
+            scheduler.wait(0.004)
+        return
+    assert scheduler.wait(0.004) is (policy == "stretch")
+    stats = scheduler.stats()
+    assert stats["ticks"] == 2 and stats["lateness_max"] > 0.02
+    assert stats["dropped"] == (policy == "drop")
+    assert (stats["stretched"] > 0.02) is (policy == "stretch")
+
+
+def test_wait_is_on_time():
+    scheduler = RealtimeScheduler()
+    for i in range(20):
+        scheduler.wait(i * 0.001)
+    assert scheduler.now() >= 0.019
+    assert scheduler.stats()["lateness_p50"] < 0.001
@@ -0,0 +1,84 @@
+"""Tests for `bestman.robots.servo_engine`."""
+import time
+
+import numpy as np
+
+from bestman.robots.hooks import add_method_hook, remove_hooks
+from bestman.robots.servo_engine import ServoEngine
+
+from ._stubs import StubRobot
+
+
+class Recorder:
+    def __init__(self):
+        self.times, self.commands = [], []
+
+    def __call__(self, command):
+        self.times.append(time.perf_counter())
+        self.commands.append(np.array(command))
+
+
+def test_slow_producer_is_interpolated_at_servo_rate():
+    send = Recorder()
+    engine = ServoEngine(send, rate_hz=200).start()
+    try:
+        for i in range(11):
+            engine.post([i * 0.01, 0, 0, 0, 0, 0])
+            time.sleep(0.05)
+    finally:
+        engine.stop()
+
+    commands = np.array(send.commands)
+    x = commands[:, 0]
+    assert len(x) > 80                              # ~0.55 s at 200 Hz
+    assert np.all(np.diff(x) >= -1e-12)             # monotone, no jumps back
+    assert np.max(np.diff(x)) < 0.01                # every target step is split into several ticks
+    assert x[-1] == 0.1
+    assert engine.stats()["posted"] == 11
+    assert np.median(np.diff(send.times)) < 0.0075
+
+
+def test_latest_target_wins_without_interpolation():
+    send = Recorder()
+    engine = ServoEngine(send, rate_hz=100, interpolate=False).start()
+    for i in range(100):
+        engine.post([float(i)])
+    time.sleep(0.05)
+    engine.stop()
+    assert send.commands and send.commands[-1][0] == 99.0
+    assert len(send.commands) < 20
+
+
+def test_angles_take_the_shortest_way():
+    send = Recorder()
+    engine = ServoEngine(send, rate_hz=200, angle_dims=slice(3, 6), angle_period=2 * np.pi).start()
+    engine.post([0, 0, 0, 0, 0, np.pi - 0.05])
+    time.sleep(0.05)
+    engine.post([0, 0, 0, 0, 0, -np.pi + 0.05])
+    time.sleep(0.3)
+    engine.stop()
+    yaw = np.unwrap([c[5] for c in send.commands])
+    assert yaw.max() - yaw.min() < 0.2 + 1e-9      # went through pi, not through 0
+
+
+def test_hooks_installed_after_start_see_every_tick():
+    class Robot(StubRobot):
+        def servo_to_ee_pose(self, pose):
+            return True
+
+    robot = Robot(config=None)
+    engine = robot.start_servo_engine(rate_hz=200, interpolate=False)
+    try:
+        engine.post([0.0] * 6)
+        time.sleep(0.02)
+        hooked = []
+        add_method_hook(robot, "servo_to_ee_pose", "spy",
+                        lambda inner: lambda pose: hooked.append(pose) or inner(pose))
+        time.sleep(0.05)
+        remove_hooks(robot, "spy")
+        n_hooked = len(hooked)
+        time.sleep(0.03)
+    finally:
+        robot.stop_servo_engine()
+    assert n_hooked >= 5
+    assert len(hooked) == n_hooked
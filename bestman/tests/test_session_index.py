@@ -0,0 +1,57 @@
+"""Tests for `bestman.utils.session_index`."""
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from bestman.utils import SessionIndex
+
+
+def _make_session(root, multi, session, n):
+    traj_dir = root / multi / session / "Merged_Trajectory"
+    clamp_dir = root / multi / session / "Clamp_Data"
+    traj_dir.mkdir(parents=True)
+    clamp_dir.mkdir(parents=True)
+    ts = np.arange(n) * 0.01
+    np.savetxt(traj_dir / "merged_trajectory.txt", np.column_stack([ts, np.zeros((n, 6)), np.ones(n)]))
+    np.savetxt(clamp_dir / "clamp_data_tum.txt", np.column_stack([ts, np.full(n, 40.0)]))
+
+
+@pytest.fixture
+def data_root(tmp_path):
+    _make_session(tmp_path, "multi_sessions_20251114_100000", "session_001", 11)
+    _make_session(tmp_path, "multi_sessions_20251114_100000", "session_002", 21)
+    _make_session(tmp_path, "multi_sessions_20251115_090000", "session_001", 31)
+    return tmp_path
+
+
+def test_index_scan_and_select(data_root):
+    index = SessionIndex(data_root).refresh()
+    assert len(index) == 3
+
+    latest = index.select()
+    assert (latest.multi_session, latest.session) == ("multi_sessions_20251115_090000", "session_001")
+    assert latest.n_points == 31
+    assert latest.duration == pytest.approx(0.3)
+    assert latest.started_at == datetime(2025, 11, 15, 9, 0, 0)
+
+    older = index.select(multi=2, session=1)
+    assert older.session == "session_001" and older.n_points == 11
+    assert [r.n_points for r in index.query(before=datetime(2025, 11, 15))] == [11, 21]
+
+
+def test_index_is_persisted_and_updated_incrementally(data_root):
+    SessionIndex(data_root).refresh()
+    index = SessionIndex(data_root)
+    assert len(index) == 3
+
+    _make_session(data_root, "multi_sessions_20251114_100000", "session_003", 5)
+    assert index.refresh().select(multi="multi_sessions_20251114_100000").n_points == 5
+
+
+def test_point_count_skips_comment_lines(tmp_path):
+    _make_session(tmp_path, "multi_sessions_20251114_100000", "session_001", 4)
+    traj = tmp_path / "multi_sessions_20251114_100000" / "session_001" / "Merged_Trajectory" / "merged_trajectory.txt"
+    traj.write_text("# timestamp tx ty tz qx qy qz qw\n" + traj.read_text() + "\n")
+    record = SessionIndex(tmp_path).refresh(save=False).select()
+    assert record.n_points == 4 and record.duration == pytest.approx(0.03)
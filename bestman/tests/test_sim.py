@@ -0,0 +1,115 @@
+"""Tests for `bestman.robots.sim`."""
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from bestman.robots import make_robot_from_config
+from bestman.robots.sim import BestmanSim, SimConfig
+from bestman.robots.sim.sim_config import DEFAULT_HOME
+
+
+def _robot(**kwargs):
+    kwargs.setdefault("manual_clock", True)
+    robot = make_robot_from_config(SimConfig(**kwargs))
+    robot.connect()
+    return robot
+
+
+def test_factory_and_config_type():
+    robot = make_robot_from_config(SimConfig())
+    assert isinstance(robot, BestmanSim)
+    assert robot.config.type == "sim"
+    with pytest.raises(ConnectionError):
+        robot.get_joint_positions()
+
+
+def test_initial_joints_none_falls_back_to_home():
+    robot = _robot(initial_joints=None)
+    assert robot.config.initial_joints == list(DEFAULT_HOME)
+    np.testing.assert_allclose(robot.get_joint_positions(), DEFAULT_HOME)
+    config = SimConfig(dof=3, dh_params=[[0.1, 0.2, 0.0]] * 3)
+    assert config.initial_joints == [0.0] * 3
+
+
+def test_observation_matches_getters_and_reuses_buffers():
+    robot = _robot()
+    robot.servo_to_joint_positions(robot.get_joint_positions() + 0.2)
+    robot.step(0.02)
+    obs = robot.get_observation()
+    np.testing.assert_allclose(obs["joint_pos"], robot.get_joint_positions(), atol=1e-6)
+    np.testing.assert_allclose(obs["joint_vel"], robot.get_joint_velocities(), rtol=1e-5)
+    np.testing.assert_allclose(obs["eef_pos"], robot.get_ee_pose(), atol=1e-6)
+    assert float(obs["gripper_pos"]) == pytest.approx(robot.get_gripper_position())
+    assert robot.get_observation()["eef_pos"] is obs["eef_pos"]
+
+
+def test_first_order_tracking_and_latency():
+    robot = _robot(time_constant=0.1, command_latency=0.05)
+    q0 = robot.get_joint_positions()
+    target = q0 + 0.1
+    assert robot.servo_to_joint_positions(target)
+    robot.step(0.04)
+    np.testing.assert_allclose(robot.get_joint_positions(), q0)      # 指令尚未生效
+    robot.step(0.01 + 0.1)                                           # 生效后一个时间常数
+    np.testing.assert_allclose(robot.get_joint_positions() - q0, 0.1 * (1 - np.exp(-1)), rtol=1e-6)
+    assert robot.is_moving()
+    robot.stop_motion()
+    robot.step(1.0)
+    assert not robot.is_moving()
+
+
+def test_joint_limits_and_velocity_limit():
+    robot = _robot(joint_limits=[[-1.0, 1.0]] * 6, initial_joints=[0.0] * 6, max_joint_velocity=0.5)
+    assert not robot.move_to_joint_positions([1.5] + [0.0] * 5)
+    assert robot.move_to_joint_positions([1.0] + [0.0] * 5)
+    robot.step(0.2)
+    assert robot.get_joint_positions()[0] == pytest.approx(0.1)
+    assert robot.get_joint_velocities()[0] == pytest.approx(0.5)
+    with pytest.raises(ValueError):
+        robot.move_to_joint_positions([0.0] * 5)
+    assert robot.move_to_joint_positions([-45.0] + [0.0] * 5, is_radian=False)
+    robot.step(5.0)
+    assert robot.get_joint_positions()[0] == pytest.approx(-np.pi / 4)
+
+
+def test_ee_pose_round_trip():
+    robot = _robot()
+    pose = robot.get_ee_pose()
+    target = pose + np.array([0.05, -0.03, 0.02, 0.0, 0.1, 0.0])
+    assert robot.move_to_ee_pose(target, is_radian=True, wait=True)
+    np.testing.assert_allclose(robot.get_ee_pose()[:3], target[:3], atol=1e-3)
+    assert not robot.move_to_ee_pose([5.0, 0.0, 0.0, 0.0, 0.0, 0.0], is_radian=True)   # 超出工作空间
+
+    robot.move_gripper(0.7)
+    robot.step(2.0)
+    assert robot.get_gripper_position() == pytest.approx(0.7)
+    obs = robot.get_observation()
+    assert obs["joint_pos"].shape == (6,) and obs["eef_pos"].dtype == np.float32
+
+
+def test_time_scale_runs_faster_than_real_time():
+    robot = _robot(manual_clock=False, time_scale=20.0, time_constant=0.05)
+    t0 = time.perf_counter()
+    assert robot.go_home()
+    q = np.asarray(robot.config.initial_joints) + 0.5
+    assert robot.move_to_joint_positions(q, wait=True)
+    wall = time.perf_counter() - t0
+    assert wall < 0.2          # 约 0.5 s 仿真时间
+    np.testing.assert_allclose(robot.get_joint_positions(), q, atol=1e-3)
+
+
+def test_cancellable_async_motion():
+    robot = _robot(manual_clock=False, max_joint_velocity=0.1)
+
+    async def main():
+        async with robot.aio() as r:
+            task = asyncio.create_task(r.move_to_joint_positions(robot.get_joint_positions() + 1.0, wait=True))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(main())
+    assert not robot.is_moving()
@@ -0,0 +1,97 @@
+"""Tests for the background state cache of `BaseRobot`."""
+import time
+
+import numpy as np
+import pytest
+
+from bestman.robots.hooks import add_method_hook, remove_hooks
+
+from ._stubs import StubRobot
+
+
+class CountingRobot(StubRobot):
+    """Driver stub that counts every state query. / 计数每次状态查询的驱动桩。"""
+
+    def __init__(self):
+        super().__init__(config=None)
+        self.calls = 0
+        self.q = np.zeros(6)
+
+    def get_joint_positions(self):
+        self.calls += 1
+        return self.q.copy()
+
+    def get_joint_velocities(self):
+        return np.ones(6)
+
+    def get_ee_pose(self):
+        return [0.3, 0.0, 0.2, np.pi, 0.0, 0.0]
+
+    def get_gripper_position(self):
+        return 0.5
+
+
+def test_get_state_without_cache_reads_driver():
+    robot = CountingRobot()
+    state = robot.get_state()
+    assert robot.calls == 1
+    assert state.gripper_position == 0.5
+    assert state.ee_pose.shape == (6,) and not state.ee_pose.flags.writeable
+    assert state.joint_positions is not None
+
+
+def test_cached_getters_do_not_touch_driver():
+    robot = CountingRobot()
+    robot.start_state_cache(rate_hz=500)
+    try:
+        robot.q[:] = 1.0
+        deadline = time.perf_counter() + 2.0
+        while robot.get_state().joint_positions[0] != 1.0 and time.perf_counter() < deadline:
+            time.sleep(0.005)
+        assert robot.get_state().joint_positions[0] == 1.0
+
+        # 低频轮询：两次轮询之间的读取全部来自快照
+        robot.start_state_cache(rate_hz=0.1)
+        calls = robot.calls
+        for _ in range(100):
+            robot.get_joint_positions()
+            robot.get_state()
+        assert robot.calls == calls
+        assert robot.get_joint_positions() is robot.get_state().joint_positions
+        with pytest.raises(ValueError):
+            robot.get_joint_positions()[0] = 2.0
+    finally:
+        robot.stop_state_cache()
+
+    calls = robot.calls
+    robot.get_joint_positions()
+    assert robot.calls == calls + 1
+    assert "get_joint_positions" not in robot.__dict__
+
+
+def test_polling_holds_the_robot_sdk_lock():
+    robot = CountingRobot()
+    cache = robot.start_state_cache(rate_hz=1000)
+    try:
+        with robot.sdk_lock:
+            seq = cache.state.seq
+            time.sleep(0.05)
+            assert cache.state.seq == seq         # 持锁期间轮询线程不会访问 SDK
+        deadline = time.perf_counter() + 1.0
+        while cache.state.seq == seq and time.perf_counter() < deadline:
+            time.sleep(0.001)
+        assert cache.state.seq > seq
+    finally:
+        robot.stop_state_cache()
+
+
+def test_hook_layers_are_ordered_and_removable():
+    robot = CountingRobot()
+    add_method_hook(robot, "get_gripper_position", "outer", lambda inner: lambda: inner() + 1)
+    add_method_hook(robot, "get_gripper_position", "inner", lambda inner: lambda: inner() * 10, order=0)
+    assert robot.get_gripper_position() == 6.0
+    remove_hooks(robot, "inner")
+    assert robot.get_gripper_position() == 1.5
+    remove_hooks(robot, "outer")
+    assert robot.get_gripper_position() == 0.5
+    assert "get_gripper_position" not in robot.__dict__
@@ -0,0 +1,162 @@
+"""Tests for the trajectory utilities in `bestman.utils`."""
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+
+from bestman.utils.batch import load_preprocessed, preprocess_multi_session, preprocess_session
+from bestman.utils.resample import iter_resampled_chunks, resample_traj
+from bestman.utils.traj_cache import load_tum
+from bestman.utils.traj_stream import iter_transformed_chunks
+from bestman.utils.utils import (
+    VIVE2VIVE_FLAT,
+    VIVEFLAT2XV,
+    XV2Gripper,
+    align_clamp_widths,
+    load_trajectory,
+    map_sensor_to_robot,
+    map_sensor_to_robot_batch,
+    rpy2T,
+    transform_traj,
+    transform_vive_to_gripper,
+    transform_vive_to_gripper_batch,
+)
+
+
+@pytest.fixture
+def session():
+    rng = np.random.default_rng(0)
+    n = 500
+    pose_ts = np.cumsum(rng.uniform(0.004, 0.006, n))
+    raw_pose = np.hstack([rng.normal(scale=0.3, size=(n, 3)), R.random(n, random_state=1).as_quat()])
+    clamp_ts = np.sort(rng.uniform(pose_ts[0] - 0.1, pose_ts[-1] + 0.1, 120))
+    raw_clamp = np.column_stack([clamp_ts, rng.uniform(-5, 100, len(clamp_ts))])
+    T_robot_init = rpy2T([0.3, -0.1, 0.25, 3.1, 0.05, -1.2])
+    return raw_pose, raw_clamp, pose_ts, T_robot_init
+
+
+def test_map_sensor_to_robot_batch_matches_per_point(session):
+    raw_pose, _, _, T_robot_init = session
+    expected = np.array([map_sensor_to_robot(*p, T_robot_init=T_robot_init) for p in raw_pose])
+    np.testing.assert_allclose(map_sensor_to_robot_batch(raw_pose, T_robot_init), expected, atol=1e-12)
+
+
+def test_align_clamp_widths_matches_argmin(session):
+    _, raw_clamp, pose_ts, _ = session
+    # duplicated timestamps and exact hits must resolve like argmin (first match wins)
+    raw_clamp = np.vstack([raw_clamp, [raw_clamp[10, 0], 42.0]])
+    raw_clamp = raw_clamp[np.argsort(raw_clamp[:, 0], kind="stable")]
+    pose_ts = np.concatenate([pose_ts, raw_clamp[:5, 0]])
+
+    expected = [np.clip(raw_clamp[np.abs(raw_clamp[:, 0] - t).argmin(), -1], 0, 88) for t in pose_ts]
+    np.testing.assert_array_equal(align_clamp_widths(raw_clamp[:, 0], raw_clamp[:, -1], pose_ts), expected)
+
+
+def test_transform_traj_returns_arrays(session):
+    target_poses, target_widths = transform_traj(*session)
+    assert target_poses.shape == (len(session[0]), 6)
+    assert target_widths.shape == (len(session[0]),)
+    assert target_widths.min() >= 0 and target_widths.max() <= 88
+
+
+def test_load_tum_cache_roundtrip_and_invalidation(tmp_path):
+    src = tmp_path / "merged_trajectory.txt"
+    data = np.arange(16, dtype=float).reshape(2, 8)
+    np.savetxt(src, data)
+
+    first = load_tum(src)
+    assert isinstance(first, np.memmap)
+    np.testing.assert_array_equal(first, data)
+    np.testing.assert_array_equal(load_tum(src), data)
+
+    np.savetxt(src, data[:1] * 2)
+    np.testing.assert_array_equal(load_tum(src), data[:1].ravel() * 2)
+
+
+def test_streamed_chunks_match_batch_transform(session, tmp_path):
+    raw_pose, raw_clamp, pose_ts, T_robot_init = session
+    traj_path, clamp_path = tmp_path / "merged_trajectory.txt", tmp_path / "clamp_data_tum.txt"
+    np.savetxt(traj_path, np.column_stack([pose_ts, raw_pose]))
+    np.savetxt(clamp_path, raw_clamp)
+    expected_poses, expected_widths = transform_traj(*load_trajectory(traj_path, clamp_path), T_robot_init)
+
+    chunks = list(iter_transformed_chunks(traj_path, clamp_path, T_robot_init, chunk_size=37, use_cache=False))
+    assert max(len(c[0]) for c in chunks) == 37
+    np.testing.assert_allclose(np.concatenate([c[1] for c in chunks]), expected_poses, atol=1e-9)
+    np.testing.assert_allclose(np.concatenate([c[2] for c in chunks]), expected_widths, atol=1e-9)
+
+
+def test_resample_traj_uniform_grid_and_slerp(session):
+    raw_pose, raw_clamp, pose_ts, T_robot_init = session
+    poses, widths = transform_traj(raw_pose, raw_clamp, pose_ts, T_robot_init)
+    grid, out, out_widths = resample_traj(pose_ts, poses, widths, rate_hz=250.0)
+
+    np.testing.assert_allclose(np.diff(grid), 1 / 250.0)
+    assert grid[0] == pose_ts[0] and grid[-1] <= pose_ts[-1]
+    np.testing.assert_allclose(out[0], poses[0], atol=1e-9)
+
+    # the orientation halfway between two samples is the geodesic midpoint
+    t_mid = 0.5 * (pose_ts[10] + pose_ts[11])
+    _, mid, _ = resample_traj(pose_ts, poses, rate_hz=1.0, t_start=t_mid)
+    r0, r1 = R.from_euler("xyz", poses[10:12, 3:])
+    expected = r0 * R.from_rotvec(0.5 * (r0.inv() * r1).as_rotvec())
+    assert (R.from_euler("xyz", mid[0, 3:]) * expected.inv()).magnitude() < 1e-9
+
+
+def test_resample_traj_empty_input():
+    grid, out, out_widths = resample_traj(np.empty(0), np.empty((0, 6)))
+    assert grid.shape == (0,) and out.shape == (0, 6) and out_widths is None
+    _, _, out_widths = resample_traj(np.empty(0), np.empty((0, 6)), np.empty(0), t_start=1.0)
+    assert out_widths.shape == (0,)
+
+
+def test_resampled_chunks_match_batch(session):
+    raw_pose, raw_clamp, pose_ts, T_robot_init = session
+    poses, widths = transform_traj(raw_pose, raw_clamp, pose_ts, T_robot_init)
+    grid, out, out_widths = resample_traj(pose_ts, poses, widths, rate_hz=300.0)
+
+    chunks = [(pose_ts[i:i + 50], poses[i:i + 50], widths[i:i + 50]) for i in range(0, len(pose_ts), 50)]
+    streamed = list(iter_resampled_chunks(chunks, rate_hz=300.0))
+    np.testing.assert_allclose(np.concatenate([c[0] for c in streamed]), grid)
+    np.testing.assert_allclose(np.concatenate([c[1] for c in streamed]), out, atol=1e-9)
+    np.testing.assert_allclose(np.concatenate([c[2] for c in streamed]), out_widths)
+
+
+def test_preprocess_multi_session_writes_ready_arrays(session, tmp_path):
+    raw_pose, raw_clamp, pose_ts, T_robot_init = session
+    for name in ("session_001", "session_002"):
+        (tmp_path / name / "Merged_Trajectory").mkdir(parents=True)
+        (tmp_path / name / "Clamp_Data").mkdir()
+        np.savetxt(
+            tmp_path / name / "Merged_Trajectory" / "merged_trajectory.txt", np.column_stack([pose_ts, raw_pose])
+        )
+        np.savetxt(tmp_path / name / "Clamp_Data" / "clamp_data_tum.txt", raw_clamp)
+
+    results = preprocess_multi_session(tmp_path, T_robot_init, workers=2, verbose=False)
+    assert [r["n_points"] for r in results] == [len(pose_ts)] * 2
+
+    timestamps, poses, widths = load_preprocessed(tmp_path / "session_002", T_robot_init)
+    expected_poses, expected_widths = transform_traj(raw_pose, raw_clamp, pose_ts, T_robot_init)
+    np.testing.assert_allclose(timestamps, pose_ts)
+    np.testing.assert_allclose(poses, expected_poses, atol=1e-9)
+    np.testing.assert_allclose(widths, expected_widths, atol=1e-9)
+    with pytest.raises(ValueError):
+        load_preprocessed(tmp_path / "session_002", np.eye(4))
+
+
+def test_preprocess_session_propagates_load_errors(tmp_path):
+    with pytest.raises(OSError):
+        preprocess_session(tmp_path / "session_404", np.eye(4))
+
+
+def test_vive_to_gripper_batch_matches_stage_chain():
+    rng = np.random.default_rng(2)
+    qposes = np.hstack([rng.normal(scale=0.5, size=(200, 3)), R.random(200, random_state=3).as_quat()])
+    flat = np.eye(4)
+    flat[:3, :3] = R.from_euler("xyz", [30, 0, 0], degrees=True).as_matrix()
+    expected = np.array([XV2Gripper(VIVEFLAT2XV(VIVE2VIVE_FLAT(q, flat))) for q in qposes])
+
+    out = transform_vive_to_gripper_batch(qposes)
+    np.testing.assert_allclose(out[:, :3], expected[:, :3], atol=1e-12)
+    # q and -q are the same rotation
+    np.testing.assert_allclose(np.abs(np.sum(out[:, 3:] * expected[:, 3:], axis=1)), 1.0, atol=1e-12)
+    np.testing.assert_allclose(transform_vive_to_gripper(qposes[0]), out[0])
@@ -0,0 +1,62 @@
+"""Tests for `bestman.utils.transform_tree`."""
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+
+from bestman.utils import TransformTree, make_umi_tree, rpy2T
+from bestman.utils.utils import map_sensor_to_robot_batch, transform_vive_to_gripper_batch
+
+
+@pytest.fixture
+def poses():
+    rng = np.random.default_rng(4)
+    return np.hstack([rng.normal(size=(50, 3)), R.random(50, random_state=5).as_quat()])
+
+
+def test_chain_composition_and_inverse():
+    tree = TransformTree()
+    T_ab, T_ac, T_cd = rpy2T([1, 2, 3, 0.1, 0.2, 0.3]), rpy2T([0, 1, 0, 0.5, 0, 0]), rpy2T([0, 0, 2, 0, 0, 1.0])
+    tree.set_transform("a", "b", T_ab)
+    tree.set_transform("a", "c", T_ac)
+    tree.set_transform("c", "d", T_cd)
+    np.testing.assert_allclose(tree.get("b", "d"), np.linalg.inv(T_ab) @ T_ac @ T_cd, atol=1e-12)
+    np.testing.assert_allclose(tree.get("d", "b") @ tree.get("b", "d"), np.eye(4), atol=1e-12)
+    with pytest.raises(ValueError):
+        tree.set_transform("d", "a", np.eye(4))
+
+
+def test_cache_invalidated_only_by_edges_on_the_path():
+    tree = make_umi_tree(rpy2T([0.3, 0, 0.2, np.pi, 0, 0]))
+    T_vive = tree.get("gripper", "vive")
+    T_init = tree.get("base", "sensor_init")
+    assert tree.get("gripper", "vive") is T_vive
+
+    tree.set_transform("base", "sensor_init", np.eye(4))
+    assert tree.get("gripper", "vive") is T_vive
+    assert tree.get("base", "sensor_init") is not T_init
+    np.testing.assert_allclose(tree.get("base", "sensor_init"), np.eye(4))
+
+
+def test_batch_transforms_match_existing_helpers(poses):
+    T_robot_init = rpy2T([0.3, -0.1, 0.25, 3.1, 0.05, -1.2])
+    tree = make_umi_tree(T_robot_init)
+
+    in_base = tree.express(poses, "sensor_init", "base")
+    expected = map_sensor_to_robot_batch(poses, T_robot_init)
+    np.testing.assert_allclose(in_base[:, :3], expected[:, :3], atol=1e-12)
+    np.testing.assert_allclose(R.from_quat(in_base[:, 3:]).as_euler("xyz"), expected[:, 3:], atol=1e-9)
+
+    gripper = tree.conjugate(poses, "vive", "gripper")
+    np.testing.assert_allclose(gripper, transform_vive_to_gripper_batch(poses), atol=1e-12)
+
+
+def test_vive_to_gripper_uses_the_given_tree(poses):
+    tree = make_umi_tree()
+    tree.set_transform("gripper", "xv", rpy2T([0.01, 0.02, 0.1, 0.0, 0.0, np.pi / 2]))
+    np.testing.assert_allclose(
+        transform_vive_to_gripper_batch(poses, tree), tree.conjugate(poses, "vive", "gripper"), atol=1e-12,
+    )
+    # 修改传入的树不影响默认标定链
+    np.testing.assert_allclose(
+        transform_vive_to_gripper_batch(poses), make_umi_tree().conjugate(poses, "vive", "gripper"), atol=1e-12,
+    )
@@ -0,0 +1,44 @@
+# 伺服发送引擎：引擎线程以 250 Hz 发送，生产者只需以任意频率投递目标
+from bestman.robots.xarm import XArmConfig, BestmanXarm
+import time
+import numpy as np
+
+config = XArmConfig(
+    id="my_xarm",
+    dof=7,
+    initial_joints=[0., 0., 0., 0., -180., 90., -180.],
+    tcp_offset=[0., 0., 174.435, 0., 0., 0.],  # mm
+    sdk_kwargs={"port": "192.168.1.235", "is_radian": False}
+)
+robot = BestmanXarm(config)
+
+PRODUCER_HZ = 30    # 模拟较慢的策略输出
+AMPLITUDE_DEG = 15
+CIRCLE_FPS = 0.5
+
+try:
+    robot.connect()
+    robot.go_home()
+    pose = np.array(robot.arm.position, dtype=float)  # [mm, mm, mm, deg, deg, deg]
+
+    robot.set_mode(1)
+    time.sleep(0.2)
+    engine = robot.start_servo_engine("ee_pose", rate_hz=250, angle_period=360.0)
+
+    t_start = time.perf_counter()
+    while (t := time.perf_counter() - t_start) < 10.0:
+        target = pose.copy()
+        target[5] += AMPLITUDE_DEG * np.sin(2 * np.pi * CIRCLE_FPS * t)
+        engine.post(target)                 # 非阻塞，引擎在目标之间插值
+        time.sleep(1.0 / PRODUCER_HZ)
+
+    robot.stop_servo_engine()
+    print(engine.stats())
+
+except KeyboardInterrupt:
+    print("Keyboard interrupt received.")
+finally:
+    robot.stop_servo_engine()
+    robot.set_mode(0)
+    robot.go_home()
+    robot.disconnect()